@@ -0,0 +1 @@
+"""EpiLog Performance Benchmark Scripts."""
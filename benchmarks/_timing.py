@@ -0,0 +1,63 @@
+"""Shared timing utilities of the EpiLog benchmark scripts."""
+
+from __future__ import annotations
+
+import logging
+import statistics
+import timeit
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Sequence
+
+
+@dataclass
+class Timing:
+    """Per call duration of a measured callable, in nanoseconds.
+
+    Args:
+        name (str): description of measurement
+        best (float): fastest observed repeat
+        median (float): median of observed repeats
+        samples (List[float]): per call duration of each repeat
+
+    """
+
+    name: str
+    best: float
+    median: float
+    samples: List[float] = field(default_factory=list)
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    number: int = 10_000,
+    repeat: int = 7,
+) -> Timing:
+    """Measure the per call duration of a callable."""
+    totals: List[float] = timeit.Timer(func).repeat(repeat=repeat, number=number)
+    per_call: List[float] = [1e9 * t / number for t in totals]
+    return Timing(name, min(per_call), statistics.median(per_call), per_call)
+
+
+def render(timings: Sequence[Timing], baseline: Optional[str] = None) -> str:
+    """Render timings as a table, relative to a named baseline measurement."""
+    reference: Optional[Timing] = next((t for t in timings if t.name == baseline), None)
+    width: int = max(len(t.name) for t in timings)
+    lines: List[str] = [f"{'benchmark':<{width}}  {'best ns':>10}  {'median ns':>10}"]
+    if reference is not None:
+        lines[0] += f"  {'relative':>8}"
+
+    for t in timings:
+        line: str = f"{t.name:<{width}}  {t.best:>10.1f}  {t.median:>10.1f}"
+        if reference is not None:
+            line += f"  {t.median / reference.median:>8.2f}"
+        lines.append(line)
+
+    return "\n".join(lines)
+
+
+class FormatHandler(logging.Handler):
+    """Handler which formats records without writing them, to exclude I/O."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.format(record)
@@ -0,0 +1,79 @@
+"""Emit cost and size of binary logs, compared with formatted text logs.
+
+Run with `python -m benchmarks.bench_binary`.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+from typing import Dict, List
+
+from EpiLog import EpiLog
+from EpiLog.binary import BinaryHandler
+from EpiLog.manager import defaultFormat
+
+from ._timing import Timing, measure, render
+
+
+NUMBER: int = 20_000
+
+
+def main() -> None:
+    """Measure per record cost, and bytes per record written, per handler."""
+    timings: List[Timing] = []
+    sizes: Dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        handlers: Dict[str, logging.Handler] = {
+            "text file": logging.FileHandler(os.path.join(directory, "app.log")),
+            "binary file": BinaryHandler(os.path.join(directory, "app.bin")),
+            "text file cached": logging.FileHandler(os.path.join(directory, "c.log")),
+            "binary file cached": BinaryHandler(os.path.join(directory, "c.bin")),
+        }
+        for name, handler in handlers.items():
+            # Cached caller resolution, and slim records reduce the cost shared by both
+            cached: bool = name.endswith("cached")
+            manager = EpiLog(
+                stream=handler, caller="cached" if cached else "full", slim=cached
+            )
+            log: logging.Logger = manager.get_logger(f"bench.binary.{name}")
+            timing: Timing = measure(
+                name,
+                lambda log=log: log.info("request %d took %.3f ms", 1234, 5.678),
+                number=NUMBER,
+                repeat=5,
+            )
+            timings.append(timing)
+            manager.flush()
+            records: int = NUMBER * 5
+            path: str = handler.baseFilename  # type: ignore[attr-defined]
+            sizes[name] = os.path.getsize(path) / records
+            manager.remove(log)
+            handler.close()
+
+        # Handler cost alone, excluding record construction and caller lookup
+        record = logging.LogRecord(
+            "bench.binary",
+            logging.INFO,
+            __file__,
+            1,
+            "request %d took %.3f ms",
+            (1234, 5.678),
+            None,
+        )
+        text = logging.FileHandler(os.path.join(directory, "handle.log"))
+        text.setFormatter(defaultFormat)
+        binary = BinaryHandler(os.path.join(directory, "handle.bin"))
+        timings.append(measure("text handle", lambda: text.handle(record)))
+        timings.append(measure("binary handle", lambda: binary.handle(record)))
+        text.close()
+        binary.close()
+
+    print(render(timings, baseline="text file"))
+    for name, size in sizes.items():
+        print(f"{name:<20} {size:>8.1f} bytes/record")
+
+
+if __name__ == "__main__":
+    main()
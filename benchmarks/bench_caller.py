@@ -0,0 +1,30 @@
+"""Per record cost of each EpiLog caller information policy.
+
+Run with `python -m benchmarks.bench_caller`.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import List
+
+from EpiLog import EpiLog
+from EpiLog.caller import CALLER_CACHED, CALLER_FULL, CALLER_OFF
+
+from ._timing import FormatHandler, Timing, measure, render
+
+
+def main() -> None:
+    """Measure records emitted at each caller policy, with default formats."""
+    timings: List[Timing] = []
+    for policy in (CALLER_FULL, CALLER_CACHED, CALLER_OFF):
+        manager = EpiLog(logging.INFO, stream=FormatHandler(), caller=policy)
+        log: logging.Logger = manager.get_logger(f"bench.caller.{policy}")
+        timings.append(measure(policy, lambda log=log: log.info("message %d", 1)))
+        manager.remove(log)
+
+    print(render(timings, baseline=CALLER_FULL))
+
+
+if __name__ == "__main__":
+    main()
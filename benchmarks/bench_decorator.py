@@ -0,0 +1,61 @@
+"""Call overhead of BenchMark decorated callables, compared with undecorated.
+
+Run with `python -m benchmarks.bench_decorator`.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Coroutine, List
+
+from EpiLog import BenchMark, EpiLog
+
+from ._timing import FormatHandler, Timing, measure, render
+
+
+def work(a: int, b: int) -> int:
+    """Trivial function, such that call overhead dominates."""
+    return a + b
+
+
+async def awork(a: int, b: int) -> int:
+    """Trivial coroutine, which never suspends."""
+    return a + b
+
+
+def drive(coro: Coroutine[Any, Any, int]) -> int:
+    """Run a coroutine which never suspends, without an event loop."""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return int(stop.value)
+    raise RuntimeError("Coroutine suspended.")
+
+
+def main() -> None:
+    """Measure undecorated, disabled and enabled decorated calls."""
+    manager = EpiLog(logging.INFO, stream=FormatHandler())
+    log: logging.Logger = manager.get_logger("bench.decorator")
+
+    disabled = BenchMark(log, "work", logging.DEBUG)(work)
+    enabled = BenchMark(log, "work", logging.INFO)(work)
+    aggregated = BenchMark(log, "work", logging.INFO, aggregate=True)(work)
+    adisabled = BenchMark(log, "awork", logging.DEBUG)(awork)
+    aenabled = BenchMark(log, "awork", logging.INFO)(awork)
+
+    timings: List[Timing] = [
+        measure("function", lambda: work(1, 2)),
+        measure("function disabled", lambda: disabled(1, 2)),
+        measure("function enabled", lambda: enabled(1, 2)),
+        measure("function aggregated", lambda: aggregated(1, 2)),
+        measure("coroutine", lambda: drive(awork(1, 2))),
+        measure("coroutine disabled", lambda: drive(adisabled(1, 2))),
+        measure("coroutine enabled", lambda: drive(aenabled(1, 2))),
+    ]
+    manager.remove(log)
+
+    print(render(timings, baseline="function"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Throughput of the JSON formatter compared with the default text format.
+
+Run with `python -m benchmarks.bench_formatters`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Dict, List
+
+from EpiLog.formatters import DEFAULT_FIELDS, JsonFormatter
+from EpiLog.manager import defaultFormat
+
+from ._timing import Timing, measure, render
+
+
+class NaiveJsonFormatter(logging.Formatter):
+    """Formatter building a dictionary per record, serialized by json.dumps."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, object] = {
+            "asctime": self.formatTime(record),
+            "name": record.name,
+            "levelname": record.levelname,
+            "module": record.module,
+            "funcName": record.funcName,
+            "lineno": record.lineno,
+            "message": record.getMessage(),
+        }
+        return json.dumps(data)
+
+
+def main() -> None:
+    """Measure formatting of a single record, per formatter."""
+    record = logging.LogRecord(
+        "bench.formatters", logging.INFO, __file__, 1, "item %d of %s", (1, "x"), None
+    )
+    record.request_id = "abc"
+    formatters: Dict[str, logging.Formatter] = {
+        "defaultFormat": defaultFormat,
+        "naive json.dumps": NaiveJsonFormatter(),
+        "JsonFormatter": JsonFormatter(DEFAULT_FIELDS),
+        "JsonFormatter extra": JsonFormatter(DEFAULT_FIELDS, extra=("request_id",)),
+        "JsonFormatter no time": JsonFormatter(
+            ("created", *DEFAULT_FIELDS[1:]), extra=("request_id",)
+        ),
+    }
+
+    timings: List[Timing] = [
+        measure(name, lambda f=formatter: f.format(record))
+        for name, formatter in formatters.items()
+    ]
+    print(render(timings, baseline="defaultFormat"))
+
+
+if __name__ == "__main__":
+    main()
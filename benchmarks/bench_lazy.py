@@ -0,0 +1,54 @@
+"""Cost of expensive message arguments at a disabled level, eager against deferred.
+
+Run with `python -m benchmarks.bench_lazy`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Dict, List
+
+from EpiLog import EpiLog
+from EpiLog.lazy import Lazy
+
+from ._timing import FormatHandler, Timing, measure, render
+
+
+STATE: Dict[str, Any] = {f"key{n}": list(range(20)) for n in range(50)}
+
+
+def main() -> None:
+    """Measure disabled (and enabled) records of an expensive argument."""
+    manager = EpiLog(logging.INFO, stream=FormatHandler(), lazy=True)
+    log: logging.Logger = manager.get_logger("bench.lazy")
+
+    def guarded() -> None:
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("state: %s", json.dumps(STATE))
+
+    timings: List[Timing] = [
+        measure("disabled.constant", lambda: log.debug("state: %s", "constant")),
+        measure("disabled.guarded", guarded),
+        measure("disabled.eager", lambda: log.debug("state: %s", json.dumps(STATE))),
+        measure(
+            "disabled.Lazy", lambda: log.debug("state: %s", Lazy(json.dumps, STATE))
+        ),
+        measure(
+            "disabled.lambda", lambda: log.debug("state: %s", lambda: json.dumps(STATE))
+        ),
+        measure(
+            "enabled.eager", lambda: log.info("state: %s", json.dumps(STATE)), 1_000
+        ),
+        measure(
+            "enabled.lambda",
+            lambda: log.info("state: %s", lambda: json.dumps(STATE)),
+            1_000,
+        ),
+    ]
+    print(render(timings, "disabled.constant"))
+    manager.remove(log)
+
+
+if __name__ == "__main__":
+    main()
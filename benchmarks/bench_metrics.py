@@ -0,0 +1,73 @@
+"""Throughput of metric updates from the hot path, by number of threads.
+
+Compares per thread (lock free) histogram shards of `EpiLog.metrics` with a
+single histogram guarded by one shared lock.
+
+Run with `python -m benchmarks.bench_metrics`.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from typing import Callable, List
+
+from EpiLog.metrics import DEFAULT_BUCKETS, MetricsRegistry
+
+
+THREADS: List[int] = [1, 2, 4, 8, 16, 32]
+UPDATES: int = 640_000  # Total per measurement, divided among threads
+
+
+class _Locked:
+    """Histogram of a single shared table, guarded by one lock."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.table: List[int] = [0] * (len(DEFAULT_BUCKETS) + 3)
+
+    def add(self, value: int) -> None:
+        with self.lock:
+            self.table[0] += 1
+            self.table[1] += value
+            self.table[2 + bisect.bisect_left(DEFAULT_BUCKETS, value)] += 1
+
+
+def _throughput(add: Callable[[int], None], threads: int) -> float:
+    per_thread: int = UPDATES // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        barrier.wait()
+        for n in range(per_thread):
+            add(n)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in pool:
+        t.start()
+    barrier.wait()
+    start: int = time.perf_counter_ns()
+    for t in pool:
+        t.join()
+    elapsed: int = time.perf_counter_ns() - start
+
+    return per_thread * threads / elapsed * 1e9
+
+
+def main() -> None:
+    """Measure updates per second, of sharded and singly locked histograms."""
+    registry = MetricsRegistry()
+    print(f"{'threads':>7}  {'sharded/s':>12}  {'locked/s':>12}")
+    for threads in THREADS:
+        sharded: float = _throughput(registry.histogram("bench").add, threads)
+        locked: float = _throughput(_Locked().add, threads)
+        print(f"{threads:>7}  {sharded:>12,.0f}  {locked:>12,.0f}")
+
+    start: int = time.perf_counter_ns()
+    registry.render()
+    print(f"render: {(time.perf_counter_ns() - start) / 1e3:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
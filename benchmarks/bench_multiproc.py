@@ -0,0 +1,73 @@
+"""Throughput of worker records collected by the parent, against per process files.
+
+Run with `python -m benchmarks.bench_multiproc`.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Tuple
+
+from EpiLog import EpiLog
+from EpiLog.multiproc import init_worker
+
+
+WORKERS: int = 4
+RECORDS: int = 20_000
+_worker: Dict[str, logging.Logger] = {}
+
+
+def _init_file(directory: str) -> None:
+    """Worker initializer writing records to a file of its own."""
+    path: str = os.path.join(directory, f"worker-{os.getpid()}.log")
+    manager = EpiLog(stream=logging.FileHandler(path))
+    _worker["log"] = manager.get_logger("bench.multiproc")
+
+
+def _init_collected(records: Any) -> None:
+    """Worker initializer shipping records to the parent collector."""
+    init_worker(records)
+    _worker["log"] = EpiLog().get_logger("bench.multiproc")
+
+
+def _work(n: int) -> int:
+    log: logging.Logger = _worker["log"]
+    for i in range(RECORDS):
+        log.info("task %d record %d", n, i)
+    return n
+
+
+def _run(initializer: Callable[..., None], initargs: Tuple[Any, ...]) -> float:
+    start: float = time.perf_counter()
+    with ProcessPoolExecutor(
+        WORKERS, initializer=initializer, initargs=initargs
+    ) as pool:
+        list(pool.map(_work, range(WORKERS)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Compare records per second written by WORKERS processes."""
+    total: int = WORKERS * RECORDS
+    with tempfile.TemporaryDirectory() as directory:
+        elapsed: float = _run(_init_file, (directory,))
+        print(f"per process files  {total / elapsed:>12,.0f} records/s")
+
+        path: str = os.path.join(directory, "collected.log")
+        manager = EpiLog(stream=logging.FileHandler(path), collect=True)
+        start: float = time.perf_counter()
+        _run(_init_collected, manager.worker_args)
+        manager.flush()
+        elapsed = time.perf_counter() - start
+        print(f"parent collector   {total / elapsed:>12,.0f} records/s")
+
+        with open(path) as f:
+            assert sum(1 for _ in f) == total, "Expected every record collected."
+
+
+if __name__ == "__main__":
+    main()
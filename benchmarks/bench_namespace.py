@@ -0,0 +1,62 @@
+"""Cost of reconfiguring level and formatter, with and without a namespace parent.
+
+Run with `python -m benchmarks.bench_namespace`.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import List
+
+from EpiLog import EpiLog
+
+from ._timing import Timing, measure, render
+
+
+# NOTE: every Logger.setLevel clears the level cache of every registered logger,
+#       so reconfiguring each flat logger is quadratic. Flat loggers are measured
+#       only up to a size which completes in reasonable time.
+SIZES: List[int] = [10, 100, 1_000, 10_000, 100_000]
+FLAT_LIMIT: int = 10_000
+
+
+def _reconfigure(manager: EpiLog) -> None:
+    manager.level = logging.DEBUG
+    manager.formatter = logging.Formatter("%(levelname)s | %(message)s")
+    manager.level = logging.INFO
+
+
+def main() -> None:
+    """Measure a level and formatter change, per number of managed loggers."""
+    timings: List[Timing] = []
+    for size in SIZES:
+        for namespace in (False, True):
+            if not namespace and size > FLAT_LIMIT:
+                continue
+
+            manager = EpiLog(stream=logging.NullHandler(), namespace=namespace)
+            label: str = "namespace" if namespace else "flat"
+            start: int = time.perf_counter_ns()
+            for n in range(size):
+                manager.get_logger(f"bench.namespace.{label}.{n}")
+            created: float = (time.perf_counter_ns() - start) / size
+
+            slow: bool = size >= 1_000 and not namespace
+            timing = measure(
+                f"{label} n={size}",
+                lambda manager=manager: _reconfigure(manager),
+                number=1 if slow else 10,
+                repeat=1 if slow and size >= FLAT_LIMIT else 3,
+            )
+            timings.append(timing)
+            print(f"{label:>9} n={size:<7} get_logger {created:>10.1f} ns/logger")
+
+            for name in list(manager.loggers):
+                manager.remove(name)
+
+    print(render(timings))
+
+
+if __name__ == "__main__":
+    main()
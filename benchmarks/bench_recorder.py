@@ -0,0 +1,54 @@
+"""Per record cost of a flight recorder, compared with writing a file.
+
+Run with `python -m benchmarks.bench_recorder`.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+from typing import List
+
+from EpiLog.manager import defaultFormat
+from EpiLog.recorder import FlightRecorder
+
+from ._timing import Timing, measure, render
+
+
+def main() -> None:
+    """Measure handler cost of retaining a record in the ring, and writing a file."""
+    record = logging.LogRecord(
+        "bench.recorder",
+        logging.DEBUG,
+        __file__,
+        1,
+        "request %d took %.3f ms",
+        (1234, 5.678),
+        None,
+    )
+    timings: List[Timing] = []
+    with tempfile.TemporaryDirectory() as directory:
+        text = logging.FileHandler(os.path.join(directory, "app.log"))
+        text.setFormatter(defaultFormat)
+        ring = FlightRecorder(os.path.join(directory, "app.ring"), trigger=None)
+        ring.setFormatter(defaultFormat)
+        small = FlightRecorder(
+            os.path.join(directory, "small.ring"), 4096, trigger=None
+        )
+        small.setFormatter(defaultFormat)
+
+        timings.append(measure("file handle", lambda: text.handle(record)))
+        timings.append(measure("recorder handle", lambda: ring.handle(record)))
+        timings.append(measure("recorder handle 4KiB", lambda: small.handle(record)))
+        timings.append(measure("format only", lambda: defaultFormat.format(record)))
+
+        text.close()
+        ring.close()
+        small.close()
+
+    print(render(timings, baseline="file handle"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Per record cost of slim records compared with standard LogRecords.
+
+Run with `python -m benchmarks.bench_records`.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import List
+
+from EpiLog import EpiLog
+from EpiLog.manager import defaultFormat
+
+from ._timing import FormatHandler, Timing, measure, render
+
+
+def main() -> None:
+    """Measure record construction, and records emitted, with and without slim."""
+    formats = {
+        "short": logging.Formatter("%(levelname)s | %(message)s"),
+        "default": defaultFormat,
+    }
+    timings: List[Timing] = []
+    for label, formatter in formats.items():
+        for slim in (False, True):
+            name: str = f"{label} {'slim' if slim else 'full'}"
+            manager = EpiLog(stream=FormatHandler(), formatter=formatter, slim=slim)
+            log: logging.Logger = manager.get_logger(f"bench.records.{label}.{slim}")
+
+            timings.append(
+                measure(
+                    f"{name} makeRecord",
+                    lambda log=log: log.makeRecord(
+                        log.name, logging.INFO, __file__, 1, "msg %d", (1,), None
+                    ),
+                )
+            )
+            timings.append(
+                measure(f"{name} record", lambda log=log: log.info("msg %d", 1))
+            )
+            manager.remove(log)
+
+    print(render(timings, baseline="short full record"))
+
+
+if __name__ == "__main__":
+    main()
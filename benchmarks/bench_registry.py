@@ -0,0 +1,73 @@
+"""Throughput of logger lookups (registry hits), by number of threads.
+
+Run with `python -m benchmarks.bench_registry`.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import List
+
+from EpiLog import EpiLog
+
+
+THREADS: List[int] = [1, 2, 4, 8, 16, 32, 64]
+LOOKUPS: int = 640_000  # Total per measurement, divided among threads
+NAMES: int = 64
+
+
+def _throughput(manager: EpiLog, threads: int) -> float:
+    names: List[str] = [f"bench.registry.{n}" for n in range(NAMES)]
+    per_thread: int = LOOKUPS // threads // NAMES
+    barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        get_logger = manager.get_logger
+        barrier.wait()
+        for _ in range(per_thread):
+            for name in names:
+                get_logger(name)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in pool:
+        t.start()
+    barrier.wait()
+    start: int = time.perf_counter_ns()
+    for t in pool:
+        t.join()
+    elapsed: int = time.perf_counter_ns() - start
+
+    return per_thread * NAMES * threads / elapsed * 1e9
+
+
+def _writer(manager: EpiLog, done: threading.Event) -> None:
+    while not done.is_set():
+        manager.level = logging.DEBUG
+        manager.level = logging.INFO
+
+
+def main() -> None:
+    """Measure lookups per second, while another thread reconfigures the manager."""
+    manager = EpiLog(stream=logging.NullHandler())
+    for n in range(NAMES):
+        manager.get_logger(f"bench.registry.{n}")
+
+    print(f"{'threads':>7}  {'lookups/s':>12}  {'reconfigured':>12}")
+    for threads in THREADS:
+        quiet: float = _throughput(manager, threads)
+
+        # Contend with a writer holding the registry lock
+        done = threading.Event()
+        background = threading.Thread(target=_writer, args=(manager, done))
+        background.start()
+        busy: float = _throughput(manager, threads)
+        done.set()
+        background.join()
+
+        print(f"{threads:>7}  {quiet:>12,.0f}  {busy:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Cost of tearing down many loggers, one by one or as a batch.
+
+Run with `python -m benchmarks.bench_remove`.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Callable, Dict
+
+from EpiLog import EpiLog
+
+
+SIZE: int = 10_000
+
+
+def _one_by_one(manager: EpiLog) -> None:
+    for name in manager.names("job"):
+        manager.remove(name)
+
+
+def _prefix(manager: EpiLog) -> None:
+    manager.remove_prefix("job")
+
+
+def main() -> None:
+    """Measure removal of every task logger of a job, per strategy."""
+    strategies: Dict[str, Callable[[EpiLog], None]] = {
+        "remove one by one": _one_by_one,
+        "remove_prefix": _prefix,
+    }
+    print(f"{'benchmark':<28}  {'total ms':>10}  {'us/logger':>10}")
+    for queued in (False, True):
+        for label, strategy in strategies.items():
+            manager = EpiLog(
+                stream=logging.NullHandler(), namespace=True, queued=queued
+            )
+            for n in range(SIZE):
+                manager.get_logger(f"job.123.task.{n}")
+
+            start: int = time.perf_counter_ns()
+            strategy(manager)
+            elapsed: int = time.perf_counter_ns() - start
+
+            name: str = f"{label}{' (queued)' if queued else ''}"
+            print(f"{name:<28}  {elapsed / 1e6:>10.1f}  {elapsed / SIZE / 1e3:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Schedule jitter of the background reporter, and the cost of counting records.
+
+Reports are timed against their ideal schedule (start + n * interval), compared
+with a naive loop sleeping one interval after each report, which drifts by the
+duration of every report.
+
+Run with `python -m benchmarks.bench_reporter`.
+"""
+
+from __future__ import annotations
+
+import logging
+import statistics
+import threading
+import time
+from typing import List, Optional
+
+from EpiLog import EpiLog
+from EpiLog.reporter import Reporter
+
+from ._timing import FormatHandler, measure, render
+
+
+INTERVAL: float = 0.02
+REPORTS: int = 100
+WORK: float = 0.002  # Duration of each report
+
+
+class _Ticks:
+    """Source recording the time of each report, taking a fixed time to report."""
+
+    def __init__(self) -> None:
+        self.times: List[float] = []
+        self.done = threading.Event()
+
+    def emit(self, log: Optional[logging.Logger] = None, reset: bool = True) -> None:
+        self.times.append(time.monotonic())
+        deadline: float = time.monotonic() + WORK
+        while time.monotonic() < deadline:
+            ...
+        if len(self.times) >= REPORTS:
+            self.done.set()
+
+
+def _lateness(times: List[float], start: float) -> List[float]:
+    """Lateness (ms) of each report against its ideal deadline."""
+    return [1e3 * (t - start - (n + 1) * INTERVAL) for n, t in enumerate(times)]
+
+
+def _describe(name: str, lateness: List[float]) -> str:
+    return (
+        f"{name:<8}  median={statistics.median(lateness):8.3f} ms"
+        f"  max={max(lateness):8.3f} ms  final={lateness[-1]:8.3f} ms"
+    )
+
+
+def main() -> None:
+    """Measure report lateness, and per record cost with and without counting."""
+    log = logging.Logger("bench.reporter")
+    reporter = Reporter(log, INTERVAL, accumulators=False)
+    ticks = _Ticks()
+    reporter.register(ticks)
+    start: float = time.monotonic()
+    reporter.start()
+    ticks.done.wait()
+    reporter.stop(report=False)
+    scheduled: List[float] = _lateness(ticks.times[:REPORTS], start)
+
+    naive = _Ticks()
+    start = time.monotonic()
+    while not naive.done.is_set():
+        time.sleep(INTERVAL)
+        naive.emit()
+    drifting: List[float] = _lateness(naive.times, start)
+
+    print(f"{REPORTS} reports every {INTERVAL * 1e3:.0f} ms, taking {WORK * 1e3} ms")
+    print(_describe("reporter", scheduled))
+    print(_describe("naive", drifting))
+
+    manager = EpiLog(logging.INFO, stream=FormatHandler())
+    counted: logging.Logger = manager.get_logger("bench.reporter.records")
+    timings = [measure("record", lambda: counted.info("message %d", 1))]
+    manager.start_reporter(interval=3600)
+    timings.append(measure("record.counted", lambda: counted.info("message %d", 1)))
+    manager.stop_reporter()
+    print(render(timings, "record"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Cost of adding measurements to a shared memory accumulator, and of reading it.
+
+Compares `SharedAccumulator.add` with the (per process) `Accumulator.add`, and
+with shipping each measurement to the parent through a multiprocessing queue (of
+which only the put is measured, excluding pickling by the feeder thread, and the
+receipt by the parent).
+
+Run with `python -m benchmarks.bench_shared`.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+
+from EpiLog.shared import SharedAccumulator
+from EpiLog.stats import Accumulator
+
+from ._timing import measure, render
+
+
+def main() -> None:
+    """Measure per measurement cost, and the cost of a parent snapshot."""
+    shared = SharedAccumulator("bench.shared")
+    local = Accumulator("bench.local")
+    queue = multiprocessing.Queue()
+    timings = [
+        measure("Accumulator.add", lambda: local.add(12_345)),
+        measure("SharedAccumulator.add", lambda: shared.add(12_345)),
+        measure("Queue.put (IPC)", lambda: queue.put(12_345)),
+        measure("SharedAccumulator.snapshot", shared.snapshot, 1_000),
+    ]
+    print(render(timings, "Accumulator.add"))
+    shared.close()
+    queue.cancel_join_thread()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+"""Reproducible benchmark suite of EpiLog overheads, with regression comparison.
+
+Run with `python -m benchmarks.suite run -o results.json`, and compare against a
+saved baseline with `python -m benchmarks.suite compare baseline.json results.json`.
+A run also fails when a benchmark exceeds its budget relative to a reference of the
+same run (see `BUDGETS`), e.g. a disabled BenchMark against a bare context manager.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import logging
+import platform
+import statistics
+import sys
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import EpiLog as package
+from EpiLog import BenchMark, EpiLog
+from EpiLog.manager import defaultFormat
+from EpiLog.resources import CpuTime, ThreadTime, Usage
+from EpiLog.units import NS_UNITS
+
+from ._timing import FormatHandler, Timing, measure, render
+
+
+# Regressions must exceed this relative change, and the noise of both runs
+THRESHOLD: float = 0.05
+NOISE_FACTOR: float = 3.0
+
+# Upper bound of a benchmark median, as a multiple of a reference of the same run
+BUDGETS: Dict[str, Tuple[str, float]] = {
+    "benchmark.disabled": ("benchmark.bare", 2.0),
+    "benchmark.resources.disabled": ("benchmark.bare", 2.0),
+}
+
+
+def _records(quick: bool) -> List[Timing]:
+    """Per record cost of EpiLog loggers, compared with bare stdlib loggers."""
+    number: int = 2_000 if quick else 10_000
+    timings: List[Timing] = []
+
+    handler = FormatHandler()
+    handler.setFormatter(defaultFormat)
+    stdlib = logging.Logger("suite.stdlib", logging.INFO)
+    stdlib.addHandler(handler)
+    timings.append(
+        measure("records.stdlib", lambda: stdlib.info("message %d", 1), number)
+    )
+    timings.append(
+        measure("records.stdlib.disabled", lambda: stdlib.debug("message"), number)
+    )
+
+    for name, kwargs in (
+        ("records.epilog", {}),
+        ("records.epilog.cached", {"caller": "cached", "slim": True}),
+    ):
+        manager = EpiLog(logging.INFO, stream=FormatHandler(), **kwargs)
+        log: logging.Logger = manager.get_logger(f"suite.{name}")
+        timings.append(measure(name, lambda log=log: log.info("message %d", 1), number))
+        manager.remove(log)
+
+    manager = EpiLog(logging.INFO, stream=FormatHandler())
+    log = manager.get_logger("suite.records.disabled")
+    timings.append(
+        measure("records.epilog.disabled", lambda: log.debug("message"), number)
+    )
+    timings.append(measure("get_logger.hit", lambda: manager.get_logger(log.name)))
+    manager.remove(log)
+
+    return timings
+
+
+class _Bare:
+    """Context manager checking a logger level, and nothing more."""
+
+    __slots__ = ("enabled", "level", "log")
+
+    def __init__(self, log: logging.Logger, level: int) -> None:
+        self.log = log
+        self.level = level
+        self.enabled = log.isEnabledFor(level)
+
+    def __enter__(self) -> None: ...
+
+    def __exit__(self, *exc: object) -> None: ...
+
+
+def _benchmark(quick: bool) -> List[Timing]:
+    """Cost of a BenchMark context, when disabled and enabled."""
+    number: int = 2_000 if quick else 10_000
+    manager = EpiLog(logging.INFO, stream=FormatHandler())
+    log: logging.Logger = manager.get_logger("suite.benchmark")
+
+    def bare() -> None:
+        with _Bare(log, logging.DEBUG):
+            ...
+
+    def disabled() -> None:
+        with BenchMark(log, "disabled", logging.DEBUG):
+            ...
+
+    def enabled() -> None:
+        with BenchMark(log, "enabled"):
+            ...
+
+    @BenchMark(log, "decorated", logging.DEBUG)
+    def decorated() -> None: ...
+
+    reused = BenchMark(log, "reused", logging.DEBUG)
+
+    def reused_disabled() -> None:
+        with reused:
+            ...
+
+    collectors = (CpuTime(), ThreadTime(), Usage())
+
+    def resources_disabled() -> None:
+        with BenchMark(log, "disabled", logging.DEBUG, resources=collectors):
+            ...
+
+    def resources_enabled() -> None:
+        with BenchMark(log, "enabled", resources=collectors):
+            ...
+
+    timings: List[Timing] = [
+        measure("benchmark.bare", bare, number),
+        measure("benchmark.disabled", disabled, number),
+        measure("benchmark.enabled", enabled, number),
+        measure("benchmark.decorated.disabled", decorated, number),
+        measure("benchmark.reused.disabled", reused_disabled, number),
+        measure("benchmark.resources.disabled", resources_disabled, number),
+        measure("benchmark.resources.enabled", resources_enabled, number),
+    ]
+    manager.remove(log)
+
+    return timings
+
+
+def _units(quick: bool) -> List[Timing]:
+    """Cost of converting durations (of increasing magnitude) into relevant units."""
+    number: int = 10_000 if quick else 100_000
+    return [
+        measure(
+            f"convert_units.{unit}",
+            lambda value=value: NS_UNITS.convert_units(value),
+            number,
+        )
+        for unit, value in (("ns", 512), ("ms", 1_234_567), ("hr", 7_200_000_000_000))
+    ]
+
+
+def _setters(quick: bool) -> List[Timing]:
+    """Reconfiguration cost of the level and formatter setters, by logger count."""
+    sizes: Sequence[int] = (10, 100) if quick else (10, 100, 1_000)
+    timings: List[Timing] = []
+    formatter = logging.Formatter("%(message)s")
+    for namespace in (False, True):
+        label: str = "namespace" if namespace else "flat"
+        for size in sizes:
+            manager = EpiLog(stream=logging.NullHandler(), namespace=namespace)
+            for n in range(size):
+                manager.get_logger(f"suite.setters.{label}.{n}")
+
+            def reconfigure(manager: EpiLog = manager) -> None:
+                manager.level = logging.DEBUG
+                manager.level = logging.INFO
+                manager.formatter = formatter
+
+            number: int = max(1, 10_000 // size**2) if not namespace else 100
+            timings.append(
+                measure(f"setters.{label}.{size}", reconfigure, number, repeat=5)
+            )
+            manager.clear()
+
+    return timings
+
+
+GROUPS: Dict[str, Callable[[bool], List[Timing]]] = {
+    "records": _records,
+    "benchmark": _benchmark,
+    "units": _units,
+    "setters": _setters,
+}
+
+
+def run(groups: Sequence[str], quick: bool = False) -> Dict[str, Any]:
+    """Run benchmark groups, returning JSON serializable results."""
+    timings: List[Timing] = []
+    for group in groups:
+        timings.extend(GROUPS[group](quick))
+
+    print(render(timings), file=sys.stderr)
+    return {
+        "meta": {
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "epilog": package.__version__,
+            "quick": quick,
+        },
+        "results": {
+            t.name: {"best": t.best, "median": t.median, "samples": t.samples}
+            for t in timings
+        },
+    }
+
+
+def check(results: Dict[str, Any]) -> List[str]:
+    """Describe benchmarks exceeding their budget (see `BUDGETS`), if any."""
+    found: Dict[str, Any] = results["results"]
+    exceeded: List[str] = []
+    for name, (reference, limit) in BUDGETS.items():
+        if name not in found or reference not in found:
+            continue
+        ratio: float = found[name]["median"] / found[reference]["median"]
+        if ratio > limit:
+            exceeded.append(f"{name}: {ratio:.2f}x {reference} (budget {limit:.2f}x)")
+
+    return exceeded
+
+
+def _noise(result: Dict[str, Any]) -> float:
+    """Relative noise of a result, the median absolute deviation of its samples."""
+    samples: List[float] = result.get("samples") or [result["median"]]
+    median: float = statistics.median(samples)
+    if median <= 0:
+        return 0.0
+    return statistics.median(abs(s - median) for s in samples) / median
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = THRESHOLD,
+    factor: float = NOISE_FACTOR,
+) -> List[Dict[str, Any]]:
+    """Compare medians of current results with a baseline.
+
+    A change is flagged only when it exceeds both the threshold, and a multiple
+    (factor) of the relative noise observed in either run.
+
+    Returns:
+        (List[Dict[str, Any]]): name, baseline and current medians, relative change,
+            allowed tolerance, and status ("regression", "improvement", "ok",
+            "new", or "missing") per benchmark.
+
+    """
+    rows: List[Dict[str, Any]] = []
+    before: Dict[str, Any] = baseline["results"]
+    after: Dict[str, Any] = current["results"]
+    for name in sorted(set(before) | set(after)):
+        old: Optional[Dict[str, Any]] = before.get(name)
+        new: Optional[Dict[str, Any]] = after.get(name)
+        row: Dict[str, Any] = {
+            "name": name,
+            "baseline": old["median"] if old else None,
+            "current": new["median"] if new else None,
+            "change": None,
+            "tolerance": None,
+        }
+        if old is None or new is None:
+            row["status"] = "new" if old is None else "missing"
+            rows.append(row)
+            continue
+
+        tolerance: float = max(threshold, factor * max(_noise(old), _noise(new)))
+        change: float = new["median"] / old["median"] - 1.0
+        row["change"] = change
+        row["tolerance"] = tolerance
+        if change > tolerance:
+            row["status"] = "regression"
+        elif change < -tolerance:
+            row["status"] = "improvement"
+        else:
+            row["status"] = "ok"
+        rows.append(row)
+
+    return rows
+
+
+def _render_comparison(rows: List[Dict[str, Any]]) -> str:
+    width: int = max(len(r["name"]) for r in rows)
+    lines: List[str] = [
+        f"{'benchmark':<{width}}  {'baseline ns':>12}  {'current ns':>12}"
+        f"  {'change':>8}  {'tolerance':>9}  status"
+    ]
+    for r in rows:
+        old: str = f"{r['baseline']:>12.1f}" if r["baseline"] is not None else " " * 12
+        new: str = f"{r['current']:>12.1f}" if r["current"] is not None else " " * 12
+        change: str = f"{r['change']:>+8.1%}" if r["change"] is not None else " " * 8
+        noise: str = (
+            f"{r['tolerance']:>9.1%}" if r["tolerance"] is not None else " " * 9
+        )
+        lines.append(
+            f"{r['name']:<{width}}  {old}  {new}  {change}  {noise}  {r['status']}"
+        )
+
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point, returning 1 when a regression (or budget) is found."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite", description=__doc__.splitlines()[0]
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    runner = commands.add_parser("run", help="run benchmarks, writing JSON results")
+    runner.add_argument("-o", "--output", help="path of JSON results (or stdout)")
+    runner.add_argument(
+        "-g", "--group", action="append", choices=sorted(GROUPS), help="repeatable"
+    )
+    runner.add_argument("--quick", action="store_true", help="fewer iterations")
+
+    comparer = commands.add_parser("compare", help="compare results with a baseline")
+    comparer.add_argument("baseline", help="path of baseline JSON results")
+    comparer.add_argument("current", help="path of current JSON results")
+    comparer.add_argument("--threshold", type=float, default=THRESHOLD)
+    comparer.add_argument("--noise-factor", type=float, default=NOISE_FACTOR)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        results: Dict[str, Any] = run(args.group or list(GROUPS), args.quick)
+        text: str = json.dumps(results, indent=2)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        else:
+            print(text)
+
+        exceeded: List[str] = check(results)
+        for line in exceeded:
+            print(f"over budget: {line}", file=sys.stderr)
+        return int(bool(exceeded))
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline: Dict[str, Any] = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current: Dict[str, Any] = json.load(f)
+
+    rows = compare(baseline, current, args.threshold, args.noise_factor)
+    print(_render_comparison(rows))
+    return int(any(r["status"] == "regression" for r in rows))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -23,11 +23,37 @@
 
 from __future__ import annotations
 
+import functools
+import inspect
 import logging
-from dataclasses import dataclass
+from contextvars import Token
 from time import perf_counter_ns
 from types import TracebackType
-from typing import Dict, Iterator, Optional, Tuple, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from .calibration import calibrate
+from .manager import EpiLog
+from .resources import Measurement, ResourceCollector, describe
+from .spans import CURRENT_SPAN, Span
+from .stats import Aggregate, get_accumulator
+
+# NOTE: Unit tables are re-exported here for backwards compatibility
+from .units import BYTE_RATE_UNITS, ITEM_RATE_UNITS, NS_UNITS
+from .units import Unit as Unit
+from .units import Units as Units
 
 
 # Python < 3.11 support
@@ -36,84 +62,17 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+F = TypeVar("F", bound=Callable[..., Any])
 
-@dataclass
-class Unit:
-    """Unit comparing string id to a modifier of the next unit.
-
-    Args:
-        unit (str): name of unit
-        base (int): value of unit
-        modifier (int | None): multiplier describing 1 of next unit
-
-    """
-
-    unit: str
-    base: int = 1
-    modifier: Union[int, None] = None
-
-
-class Units:
-    """Container of Units.
-
-    Args:
-        units (Unit): unit definitions
-
-    Raises:
-        ValueError: if modifier value of units is not defined.
-
-    """
-
-    units: Tuple[Unit, ...]
-
-    def __init__(self, *units: Unit) -> None:
-        self.units = units
-        self._update()
-
-    def _update(self) -> None:
-        for n, current in enumerate(self.units[1:]):
-            previous = self.units[n]
-            if previous.modifier is None:
-                raise ValueError(
-                    f"Modifier value of unit '{previous.unit}' cannot be None."
-                )
-            current.base = previous.base * previous.modifier
-
-    def __iter__(self) -> Iterator[Unit]:
-        yield from self.units
-
-    def convert_units(self, value: int) -> Tuple[float, str]:
-        """Convert base unit into most relevant unit."""
-        new_time: float = float(value)
-        text: str = ""
-
-        for u in self:
-            new_time = value / u.base
-            text = u.unit
-            if u.modifier is None or new_time < u.modifier:
-                break
-
-        return new_time, text
-
-    def breakdown_units(self, value: int) -> Dict[str, int]:
-        """Split base value into component unit bins."""
-        data: Dict[str, int] = {}
-        for unit in reversed(self.units):
-            data[unit.unit], value = divmod(value, unit.base)
-
-        return data
-
-
-NS_UNITS = Units(
-    Unit(unit="ns", modifier=1000),
-    Unit(unit="us", modifier=1000),
-    Unit(unit="ms", modifier=1000),
-    Unit(unit="s", modifier=60),
-    Unit(unit="min", modifier=60),
-    Unit(unit="hr", modifier=24),
-    Unit(unit="days", modifier=7),
-    Unit(unit="weeks"),
-)
+_NO_WORK: Tuple[int, int] = (0, 0)
+# Per use state of a BenchMark, until entered while enabled
+_UNSET: Dict[str, Any] = {
+    "t0": 0,
+    "span": None,
+    "token": None,
+    "elapsed": None,
+    "states": None,
+}
 
 
 class BenchMark:
@@ -123,10 +82,46 @@ class BenchMark:
         log (logging.Logger):
         description (str): Message used to describe actions performed during benchmark.
         level (int): Logging Level
+        aggregate (bool | Aggregate): Feed durations into an accumulator, in place
+            of emitting a message per use. If True, the accumulator shared by all
+            BenchMarks of the same key is used (see `EpiLog.stats`).
+        key (str | None): Name of shared accumulator (defaults to description).
+        tree (bool): Track BenchMarks nested within this context as a tree of spans
+            (see `EpiLog.spans`), emitting a single indented report on exit.
+        correct (bool): Subtract the (calibrated) overhead of BenchMark itself from
+            reported and aggregated durations (see `EpiLog.calibration`).
+        resources (Sequence[ResourceCollector]): Collectors of resource usage (CPU
+            time, memory, getrusage counters) reported alongside the duration (see
+            `EpiLog.resources`). Not collected when disabled, nor aggregated.
+        items (int | None): Number of items processed per use, reported as a rate
+            alongside the duration. May be incremented within the context with `add`.
+        nbytes (int | None): Number of bytes processed per use, reported as a rate.
 
     Attributes:
         enabled (bool): If Benchmark level is compatible with log level to emit message.
+            Re-evaluated on entry once the `EpiLog.epoch` changes, so a BenchMark
+            may be reused across changes of the manager level.
         t0 (int): Entry time to benchmark suite.
+        accumulator (Aggregate | None): Destination of aggregated durations.
+        span (Span | None): Span of this BenchMark, when entered within a tree.
+        elapsed (int | None): Reported duration (ns) of the last use, once exited.
+        usage (Dict[str, int]): Resource usage of the last use, by label.
+        items (int): Items processed by the current (or last) use.
+        nbytes (int): Bytes processed by the current (or last) use.
+
+    Notes:
+        * A BenchMark entered within an open tree (of the same thread, asyncio
+            task, or copied context) records a child span in place of emitting its
+            own message. Aggregated durations are still added to the accumulator.
+        * New threads do not inherit context; run them within
+            `contextvars.copy_context().run` to attach spans to an enclosing tree.
+        * Per use state (`t0`, `span`, `elapsed`, `usage`, ...) is only stored once
+            entered while enabled, and otherwise reads as its default, keeping a
+            disabled BenchMark close to the cost of a bare context manager.
+        * Timer overhead and clock resolution are calibrated once per process, on
+            first use of a BenchMark emitting a message (or correcting durations).
+            Durations within noise of an empty BenchMark are flagged as "below
+            resolution". Spans of a tree are not corrected.
 
     Examples:
         ```python
@@ -136,50 +131,322 @@ class BenchMark:
         message: str = "this is a message"
         with Benchmark(log, message, logging.INFO):
             perform_task(...)
+
+        # Emit a single summary line, in place of one line per use
+        for item in items:
+            with Benchmark(log, message, aggregate=True):
+                perform_task(item)
+        EpiLog.stats.get_accumulator(message).emit()
+
+        # Report how time of a parent splits across nested BenchMarks
+        with Benchmark(log, "request", tree=True) as b:
+            with Benchmark(log, "parse"):
+                ...
+        flamegraph_input: str = b.span.collapsed()
+
+        # Benchmark every call of a function, coroutine, or (async) generator
+        @Benchmark(log, message, logging.DEBUG)
+        async def perform_async_task(...):
+            ...
         ```
 
     """
 
-    __slots__ = ("description", "enabled", "level", "log", "t0")
+    __slots__ = (
+        "accumulator",
+        "correct",
+        "description",
+        "elapsed",
+        "enabled",
+        "epoch",
+        "items",
+        "level",
+        "log",
+        "nbytes",
+        "resources",
+        "span",
+        "states",
+        "t0",
+        "token",
+        "tree",
+        "usage",
+        "work",
+    )
 
     level: int
     enabled: bool
+    epoch: int
     log: logging.Logger
     description: str
     t0: int
+    accumulator: Optional[Aggregate]
+    tree: bool
+    span: Optional[Span]
+    token: Optional[Token[Optional[Span]]]
+    correct: bool
+    elapsed: Optional[int]
+    resources: Sequence[ResourceCollector]
+    states: Optional[List[Any]]
+    usage: Dict[str, int]
+    items: int
+    nbytes: int
+    work: Tuple[int, int]
 
     def __init__(
         self,
         log: logging.Logger,
         description: str,
         level: int = logging.INFO,
+        aggregate: Union[bool, Aggregate] = False,
+        key: Optional[str] = None,
+        tree: bool = False,
+        correct: bool = False,
+        resources: Sequence[ResourceCollector] = (),
+        items: Optional[int] = None,
+        nbytes: Optional[int] = None,
     ) -> None:
         self.level = level
-        self.enabled = log.isEnabledFor(self.level)
+        self.epoch = EpiLog.epoch
+        self.enabled = log.isEnabledFor(level)
         self.log = log
         self.description = description
-        self.t0 = 0
+        self.tree = tree
+        self.correct = correct
+        self.resources = resources
+        self.work = _NO_WORK if items is nbytes is None else (items or 0, nbytes or 0)
+
+        if aggregate is False:
+            self.accumulator = None
+        elif aggregate is True:
+            self.accumulator = get_accumulator(key or description, log, level)
+        else:
+            self.accumulator = aggregate
+
+    def __getattr__(self, name: str) -> Any:
+        """Default of per use state, not stored until entered while enabled."""
+        if name in _UNSET:
+            return _UNSET[name]
+        if name == "usage":
+            return {}
+        if name == "items":
+            return self.work[0]
+        if name == "nbytes":
+            return self.work[1]
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def _fork(self) -> BenchMark:
+        """Fresh BenchMark of identical configuration, for a single decorated call."""
+        return BenchMark(
+            self.log,
+            self.description,
+            self.level,
+            self.accumulator or False,
+            tree=self.tree,
+            correct=self.correct,
+            resources=self.resources,
+            items=self.work[0],
+            nbytes=self.work[1],
+        )
+
+    def __call__(self, func: F) -> F:
+        """Decorate a callable, benchmarking each call.
+
+        Sync functions and coroutine functions are timed from call to return,
+        including total wall time across awaits. Sync and async generators are
+        timed from first iteration until exhausted (or closed). When the logger is
+        not enabled for the level, the original callable is called directly.
+
+        Notes:
+            * Async generator functions are decorated by a (sync) function returning
+                an async generator, which is the original one when not enabled, as
+                an async generator cannot delegate to another without proxying
+                every item.
+
+        """
+        enabled_for: Callable[[int], bool] = self.log.isEnabledFor
+        level: int = self.level
+        fork = self._fork
+
+        if inspect.isasyncgenfunction(func):
+
+            async def timed(agen: AsyncGenerator[Any, Any]) -> AsyncGenerator[Any, Any]:
+                with fork():
+                    try:
+                        value: Any = await agen.__anext__()
+                        while True:
+                            try:
+                                sent: Any = yield value
+                            except GeneratorExit:
+                                await agen.aclose()
+                                raise
+                            except BaseException as e:
+                                value = await agen.athrow(e)
+                            else:
+                                value = await agen.asend(sent)
+                    except StopAsyncIteration:
+                        return
+
+            @functools.wraps(func)
+            def async_generator(*args: Any, **kwargs: Any) -> AsyncGenerator[Any, Any]:
+                agen: AsyncGenerator[Any, Any] = func(*args, **kwargs)
+                if not enabled_for(level):
+                    return agen
+                return timed(agen)
+
+            return cast(F, async_generator)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def coroutine(*args: Any, **kwargs: Any) -> Any:
+                if not enabled_for(level):
+                    return await func(*args, **kwargs)
+                with fork():
+                    return await func(*args, **kwargs)
+
+            return cast(F, coroutine)
+
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def generator(*args: Any, **kwargs: Any) -> Generator[Any, Any, Any]:
+                if not enabled_for(level):
+                    return (yield from func(*args, **kwargs))
+                with fork():
+                    return (yield from func(*args, **kwargs))
+
+            return cast(F, generator)
+
+        @functools.wraps(func)
+        def function(*args: Any, **kwargs: Any) -> Any:
+            if not enabled_for(level):
+                return func(*args, **kwargs)
+            with fork():
+                return func(*args, **kwargs)
+
+        return cast(F, function)
+
+    def add(self, items: int = 0, nbytes: int = 0) -> None:
+        """Count items (and bytes) processed within the current use."""
+        self.items += items
+        self.nbytes += nbytes
 
     def __enter__(self) -> Self:
+        if self.epoch != EpiLog.epoch:
+            self.epoch = EpiLog.epoch
+            self.enabled = self.log.isEnabledFor(self.level)
         if self.enabled:
+            self.items, self.nbytes = self.work
+            parent: Optional[Span] = CURRENT_SPAN.get()
+            if parent is None and not self.tree:
+                self.span = None
+            else:
+                self.span = Span(self.description, parent)
+                self.token = CURRENT_SPAN.set(self.span)
+            self.states = (
+                [r.start() for r in self.resources]
+                if self.resources and self.accumulator is None
+                else None
+            )
             self.t0 = perf_counter_ns()
+            if self.span is not None:
+                self.span.start = self.t0
 
         return self
 
+    def _close_span(self, end: int) -> Optional[Span]:
+        """Close span of this BenchMark, restoring its parent as current span."""
+        span: Optional[Span] = self.span
+        if span is None:
+            return None
+
+        span.end = end
+        if self.token is not None:
+            try:
+                CURRENT_SPAN.reset(self.token)
+            except ValueError:
+                # Exited within another context, e.g. a generator closed elsewhere
+                ...
+            self.token = None
+
+        return span
+
     def __exit__(
         self,
         exc_type: Optional[type[BaseException]],
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ) -> None:
-        end: int = perf_counter_ns()
+        if not self.enabled:
+            if (
+                exc_type is not None
+                and exc_val is not None
+                and not isinstance(exc_val, GeneratorExit)
+            ):
+                self.log.error("Traceback:", exc_info=(exc_type, exc_val, exc_tb))
+            return
 
-        if exc_type is not None and exc_val is not None:
+        end: int = perf_counter_ns()
+        measurements: List[Measurement] = []
+        if self.states is not None:
+            for collector, state in zip(self.resources, self.states):
+                measurements.extend(collector.stop(state))
+            self.states = None
+            self.usage = {label: value for label, value, _ in measurements}
+        span: Optional[Span] = self._close_span(end)
+
+        # NOTE: A closed generator is not an error (see `BenchMark.__call__`)
+        if (
+            exc_type is not None
+            and exc_val is not None
+            and not isinstance(exc_val, GeneratorExit)
+        ):
             self.log.error("Traceback:", exc_info=(exc_type, exc_val, exc_tb))
             return
 
-        if not self.enabled:
+        duration: int = end - self.t0
+        if self.correct:
+            duration = calibrate().correct(duration)
+        self.elapsed = duration
+
+        if self.accumulator is not None:
+            self.accumulator.add(duration)
+            return
+
+        if span is not None:
+            if span.parent is None:
+                self.log.log(self.level, "%s", span.report())
+            return
+
+        value, unit = NS_UNITS.convert_units(duration)
+        below: bool = calibrate().below_resolution(end - self.t0)
+        if not below and not measurements and not self.items and not self.nbytes:
+            self.log.log(self.level, "%s: (%.4f %s)", self.description, value, unit)
             return
 
-        elapsed, unit = NS_UNITS.convert_units(end - self.t0)
-        self.log.log(self.level, "%s: (%.4f %s)", self.description, elapsed, unit)
+        parts: List[str] = [f"{value:.4f} {unit}"]
+        if below:
+            parts.append("below resolution")
+        parts.extend(_rates(duration, self.items, self.nbytes))
+        parts.extend(describe(measurements))
+        self.log.log(self.level, "%s: (%s)", self.description, ", ".join(parts))
+
+
+def _rates(duration: int, items: int, nbytes: int) -> List[str]:
+    """Describe items (and bytes) processed, with their rate over a duration (ns)."""
+    parts: List[str] = []
+    for label, count, units in (
+        ("items", items, ITEM_RATE_UNITS),
+        ("bytes", nbytes, BYTE_RATE_UNITS),
+    ):
+        if not count:
+            continue
+        if duration <= 0:
+            parts.append(f"{label}={count}")
+            continue
+        rate, unit = units.convert_units(count * 1e9 / duration)
+        parts.append(f"{label}={count} ({rate:.4f} {unit})")
+
+    return parts
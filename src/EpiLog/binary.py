@@ -0,0 +1,364 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compact binary log sink, and offline decoder rendering records with a Formatter.
+
+A binary log is a sequence of length prefixed frames, each a kind (1 byte) and
+payload length (4 bytes), followed by the payload:
+
+* header (`H`): format version, and session start time. Opens every session
+    (file open, or a full string table), and resets the string table.
+* string (`S`): id, and utf-8 text. Logger names, message templates, paths,
+    function and thread names are interned, each written once per session.
+* record (`R`): creation time, level, string ids, line number, process id,
+    flags, and marshalled (raw) arguments, then optional exception and stack text.
+
+Decode a log with `python -m EpiLog.binary app.bin`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import logging
+import marshal
+import os
+import struct
+import sys
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from .records import START_TIME
+
+
+VERSION: int = 1
+FRAME = struct.Struct("<cI")  # kind, payload length
+HEADER = struct.Struct("<Bd")  # version, session start time
+STRING = struct.Struct("<I")  # id (followed by utf-8 text)
+# created, levelno, name, template, pathname, lineno, funcName, threadName,
+# process, flags, length of arguments
+RECORD = struct.Struct("<dHIIIIIIIBI")
+FRAMED_RECORD = struct.Struct("<cI" + RECORD.format[1:])
+TEXT = struct.Struct("<I")  # length of optional text (followed by utf-8 text)
+
+KIND_HEADER: bytes = b"H"
+KIND_STRING: bytes = b"S"
+KIND_RECORD: bytes = b"R"
+
+FLAG_RENDERED: int = 1  # Arguments are not marshallable, message is pre-rendered
+FLAG_EXC: int = 2
+FLAG_STACK: int = 4
+
+MAX_STRINGS: int = 4096  # Default bound of interned strings, per session
+
+_EXCEPTIONS = logging.Formatter()
+_SESSION: bytes = FRAME.pack(KIND_HEADER, HEADER.size) + HEADER.pack(
+    VERSION, START_TIME
+)
+
+
+class BinaryHandler(logging.FileHandler):
+    """Handler appending records to a binary log, without formatting them.
+
+    Logger names, message templates, and caller information are interned as ids,
+    written to the log once per session. Arguments are stored raw (marshalled),
+    unless they cannot be marshalled, in which case the message is rendered.
+    Records are formatted later, offline, by `decode` (or `python -m EpiLog.binary`).
+
+    Args:
+        filename (str | os.PathLike): Path of binary log, appended to.
+        flush_level (int): Flush the file once a record at or above this level is
+            written. Otherwise, writes are buffered.
+        delay (bool): Defer opening the file until the first record.
+        max_strings (int): Bound of interned strings. Once reached, a new session
+            is opened, resetting the string table (of both handler and decoder).
+
+    Notes:
+        * The formatter of the handler is not used.
+        * Messages which are not constant (e.g. f-strings) are interned once each,
+            and so are best logged as templates with arguments.
+
+    """
+
+    flush_level: int
+    max_strings: int
+
+    def __init__(
+        self,
+        filename: Union[str, os.PathLike[str]],
+        flush_level: int = logging.ERROR,
+        delay: bool = False,
+        max_strings: int = MAX_STRINGS,
+    ) -> None:
+        self.flush_level = flush_level
+        self.max_strings = max_strings
+        self._strings: Dict[Optional[str], int] = {}
+        super().__init__(filename, mode="ab", delay=delay)
+
+    def _open(self) -> Any:
+        """Open file, opening a new session of the string table."""
+        stream: IO[Any] = open(self.baseFilename, self.mode)
+        self._strings = {}
+        stream.write(_SESSION)
+        return stream
+
+    def _intern(self, value: Optional[str], frames: List[bytes]) -> int:
+        if value is None:
+            return 0
+        index: Optional[int] = self._strings.get(value)
+        if index is None:
+            index = self._strings[value] = len(self._strings) + 1
+            text: bytes = value.encode("utf-8", "surrogatepass")
+            frames.append(FRAME.pack(KIND_STRING, STRING.size + len(text)))
+            frames.append(STRING.pack(index))
+            frames.append(text)
+        return index
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record (and strings it first references) to the binary log."""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            cast(IO[bytes], self.stream).write(self.encode(record))
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:  # pragma: no cover
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def encode(self, record: logging.LogRecord) -> bytes:
+        """Encode a record as frames, preceded by any newly interned strings."""
+        frames: List[bytes] = []
+        if len(self._strings) >= self.max_strings:
+            # NOTE: Bounds the table, as each record interns at most five strings
+            self._strings = {}
+            frames.append(_SESSION)
+        intern = self._intern
+        get = self._strings.get
+        flags: int = 0
+        msg: Any = record.msg
+        template: str = msg if msg.__class__ is str else str(msg)
+        try:
+            args: bytes = marshal.dumps(cast(Any, record.args) or (), 4)
+        except ValueError:
+            flags |= FLAG_RENDERED
+            args = record.getMessage().encode("utf-8", "surrogatepass")
+
+        size: int = RECORD.size + len(args)
+        texts: List[bytes] = []
+        if record.exc_info or record.exc_text or record.stack_info:
+            if record.exc_info and not record.exc_text:
+                record.exc_text = _EXCEPTIONS.formatException(record.exc_info)
+            if record.exc_text:
+                flags |= FLAG_EXC
+                texts.append(record.exc_text.encode("utf-8", "surrogatepass"))
+            if record.stack_info:
+                flags |= FLAG_STACK
+                texts.append(record.stack_info.encode("utf-8", "surrogatepass"))
+            size += sum(TEXT.size + len(t) for t in texts)
+
+        # NOTE: Interned ids are looked up inline, calling intern only on a miss
+        frames.append(
+            FRAMED_RECORD.pack(
+                KIND_RECORD,
+                size,
+                record.created,
+                record.levelno,
+                get(record.name) or intern(record.name, frames),
+                get(template) or intern(template, frames),
+                get(record.pathname) or intern(record.pathname, frames),
+                record.lineno or 0,
+                get(record.funcName) or intern(record.funcName, frames),
+                get(record.threadName) or intern(record.threadName, frames),
+                record.process or 0,
+                flags,
+                len(args),
+            )
+        )
+        frames.append(args)
+        for text in texts:
+            frames.append(TEXT.pack(len(text)))
+            frames.append(text)
+
+        return b"".join(frames)
+
+
+def _text(data: bytes, offset: int) -> Tuple[str, int]:
+    (size,) = TEXT.unpack_from(data, offset)
+    start: int = offset + TEXT.size
+    return data[start : start + size].decode("utf-8", "surrogatepass"), start + size
+
+
+def _record(
+    payload: bytes, strings: Dict[int, Optional[str]], start: float
+) -> logging.LogRecord:
+    (
+        created,
+        levelno,
+        name,
+        template,
+        pathname,
+        lineno,
+        func,
+        thread_name,
+        process,
+        flags,
+        size,
+    ) = RECORD.unpack_from(payload)
+    offset: int = RECORD.size
+    blob: bytes = payload[offset : offset + size]
+    offset += size
+
+    args: Any = ()
+    msg: Optional[str] = strings[template]
+    if flags & FLAG_RENDERED:
+        msg = blob.decode("utf-8", "surrogatepass")
+    else:
+        args = marshal.loads(blob)
+
+    path: str = strings[pathname] or ""
+    filename: str = os.path.basename(path)
+    record: logging.LogRecord = logging.makeLogRecord(
+        {
+            "name": strings[name],
+            "msg": msg,
+            "args": args or None,
+            "levelno": levelno,
+            "levelname": logging.getLevelName(levelno),
+            "pathname": path,
+            "filename": filename,
+            "module": os.path.splitext(filename)[0],
+            "lineno": lineno,
+            "funcName": strings[func],
+            "created": created,
+            "msecs": int((created - int(created)) * 1000) + 0.0,
+            "relativeCreated": (created - start) * 1000,
+            "threadName": strings[thread_name],
+            "process": process or None,
+        }
+    )
+    if flags & FLAG_EXC:
+        record.exc_text, offset = _text(payload, offset)
+    if flags & FLAG_STACK:
+        record.stack_info, offset = _text(payload, offset)
+
+    try:
+        record.getMessage()
+    except Exception:
+        # NOTE: Render a mismatched template and arguments, in place of raising
+        record.msg, record.args = f"{msg} {args!r}", None
+
+    return record
+
+
+def decode(stream: IO[bytes]) -> Iterator[logging.LogRecord]:
+    """Decode records of a binary log.
+
+    Raises:
+        ValueError: if the log is not a binary log, or of an unsupported version.
+
+    """
+    strings: Dict[int, Optional[str]] = {0: None}
+    start: float = 0.0
+    header: bool = False
+    while True:
+        frame: bytes = stream.read(FRAME.size)
+        if len(frame) < FRAME.size:
+            return
+        kind, size = FRAME.unpack(frame)
+        payload: bytes = stream.read(size)
+        if len(payload) < size:
+            # NOTE: A truncated final frame, e.g. of an interrupted process
+            return
+
+        if kind == KIND_RECORD and header:
+            yield _record(payload, strings, start)
+        elif kind == KIND_STRING and header:
+            (index,) = STRING.unpack_from(payload)
+            strings[index] = payload[STRING.size :].decode("utf-8", "surrogatepass")
+        elif kind == KIND_HEADER:
+            version, start = HEADER.unpack_from(payload)
+            if version != VERSION:
+                raise ValueError(f"Unsupported Binary Log Version: {version}")
+            strings = {0: None}
+            header = True
+        else:
+            raise ValueError(f"Unsupported Binary Log Frame: {kind!r}")
+
+
+def render(stream: IO[bytes], formatter: logging.Formatter) -> Iterator[str]:
+    """Render records of a binary log as text, with any formatter."""
+    for record in decode(stream):
+        yield formatter.format(record)
+
+
+def _load_formatter(spec: str) -> logging.Formatter:
+    """Import a formatter (instance, or class constructed without arguments)."""
+    module, _, attribute = spec.partition(":")
+    value: Any = getattr(importlib.import_module(module), attribute)
+    if isinstance(value, type):
+        value = value()
+    if not isinstance(value, logging.Formatter):
+        raise TypeError(f"Incorrect Formatter Type: {value.__class__}")
+    return value
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Render binary logs as text, to standard output."""
+    parser = argparse.ArgumentParser(
+        prog="python -m EpiLog.binary", description=main.__doc__
+    )
+    parser.add_argument("paths", nargs="+", help="binary log files")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--format", help="logging format string (default: EpiLog)")
+    group.add_argument(
+        "--formatter",
+        default="EpiLog.manager:defaultFormat",
+        help="import path of a formatter, e.g. EpiLog.formatters:JsonFormatter",
+    )
+    parser.add_argument("--style", default="%", choices=("%", "{", "$"))
+    parser.add_argument("--datefmt", default=None)
+    options = parser.parse_args(argv)
+
+    formatter: logging.Formatter = (
+        logging.Formatter(options.format, options.datefmt, options.style)
+        if options.format
+        else _load_formatter(options.formatter)
+    )
+    for path in options.paths:
+        with open(path, "rb") as f:
+            for line in render(f, formatter):
+                sys.stdout.write(line + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Calibration of BenchMark timer overhead and clock resolution, once per process."""
+
+from __future__ import annotations
+
+import contextvars
+import io
+import logging
+import statistics
+import threading
+import time
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class Calibration:
+    """Intrinsic cost of timing with a BenchMark, measured from empty contexts.
+
+    Args:
+        overhead (int): median duration (ns) measured by an empty BenchMark, i.e. the
+            cost of its own enter, exit, and clock reads.
+        noise (int): median absolute deviation (ns) of empty measurements.
+        ceiling (int): 99th percentile (ns) of empty measurements.
+        resolution (int): smallest observed (nonzero) step of the clock, in ns.
+        declared (float): resolution of the clock declared by the platform, in ns.
+        samples (int): number of empty measurements.
+
+    """
+
+    overhead: int
+    noise: int
+    ceiling: int
+    resolution: int
+    declared: float
+    samples: int
+
+    @property
+    def floor(self) -> int:
+        """Largest (uncorrected) duration indistinguishable from an empty context."""
+        return max(
+            self.ceiling,
+            self.overhead + max(self.resolution, 3 * self.noise),
+        )
+
+    def correct(self, duration: int) -> int:
+        """Subtract timer overhead from a measured duration (never below zero)."""
+        return max(duration - self.overhead, 0)
+
+    def below_resolution(self, duration: int) -> bool:
+        """An (uncorrected) duration is within noise of an empty context."""
+        return duration <= self.floor
+
+
+class _Discard(io.StringIO):
+    """Stream discarding written text."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+_CALIBRATION: Dict[str, Calibration] = {}
+_lock = threading.Lock()
+_local = threading.local()
+
+# Used by BenchMarks measured while calibrating (in this thread), which neither
+# correct nor flag their durations.
+_UNCALIBRATED = Calibration(
+    overhead=0, noise=0, ceiling=0, resolution=1, declared=0.0, samples=0
+)
+
+
+def _resolution(samples: int) -> int:
+    """Smallest observed nonzero difference of consecutive clock reads."""
+    smallest: Optional[int] = None
+    for _ in range(samples):
+        t0: int = perf_counter_ns()
+        t1: int = perf_counter_ns()
+        while t1 == t0:
+            t1 = perf_counter_ns()
+        if smallest is None or t1 - t0 < smallest:
+            smallest = t1 - t0
+    return smallest or 1
+
+
+def calibrate(samples: int = 1_000, force: bool = False) -> Calibration:
+    """Measure (once per process) the overhead, and noise, of an empty BenchMark.
+
+    Args:
+        samples (int): number of empty measurements.
+        force (bool): measure again, replacing the calibration of this process.
+
+    Returns:
+        (Calibration): calibration of this process.
+
+    """
+    if getattr(_local, "active", False):
+        return _UNCALIBRATED
+    calibration: Optional[Calibration] = _CALIBRATION.get("process")
+    if calibration is not None and not force:
+        return calibration
+
+    with _lock:
+        calibration = _CALIBRATION.get("process")
+        if calibration is not None and not force:
+            return calibration
+
+        # NOTE: measured within a fresh context, never attached to an open tree.
+        _local.active = True
+        try:
+            measured: List[int] = contextvars.Context().run(_measure, samples)
+        finally:
+            _local.active = False
+
+        overhead: int = int(statistics.median(measured))
+        calibration = Calibration(
+            overhead=overhead,
+            noise=int(statistics.median(abs(m - overhead) for m in measured)),
+            ceiling=measured[min(int(0.99 * len(measured)), len(measured) - 1)],
+            resolution=_resolution(max(samples // 10, 1)),
+            declared=time.get_clock_info("perf_counter").resolution * 1e9,
+            samples=len(measured),
+        )
+        _CALIBRATION["process"] = calibration
+
+    return calibration
+
+
+def _measure(samples: int) -> List[int]:
+    """Sorted durations of empty BenchMarks, which correct and emit as in use."""
+    # NOTE: imported here, as BenchMark corrects durations with this calibration.
+    from .benchmark import BenchMark
+
+    handler = logging.StreamHandler(_Discard())
+    handler.setFormatter(logging.Formatter("%(asctime)s | %(name)s | %(message)s"))
+    log = logging.Logger("EpiLog.calibration", logging.DEBUG)
+    log.addHandler(handler)
+
+    measured: List[int] = []
+    warmup: int = max(samples // 10, 1)
+    for _ in range(samples + warmup):
+        with BenchMark(log, "calibration", logging.DEBUG, correct=True) as b:
+            ...
+        measured.append(b.elapsed or 0)
+
+    return sorted(measured[warmup:])
+
+
+def get_calibration() -> Optional[Calibration]:
+    """Calibration of this process, or None if not yet calibrated."""
+    return _CALIBRATION.get("process")
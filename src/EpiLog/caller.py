@@ -0,0 +1,158 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Caller information policies, controlling the cost of `Logger.findCaller`."""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import traceback
+from io import StringIO
+from types import CodeType, FrameType
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
+
+
+Caller = Tuple[str, int, str, Optional[str]]
+CallerFinder = Callable[[bool, int], Caller]
+
+CALLER_FULL: str = "full"
+CALLER_CACHED: str = "cached"
+CALLER_OFF: str = "off"
+CALLER_POLICIES: FrozenSet[str] = frozenset({CALLER_FULL, CALLER_CACHED, CALLER_OFF})
+UNKNOWN_CALLER: Caller = ("(unknown file)", 0, "(unknown function)", None)
+
+# Identical to how the logging module identifies its own source file
+_SRCFILE: str = os.path.normcase(logging.addLevelName.__code__.co_filename)
+_internal: Dict[str, bool] = {}
+# Keyed on code object identities, which remain unique while their entry pins them
+_sites: Dict[Tuple[int, int, int, int], Tuple[CodeType, CodeType, Caller]] = {}
+
+
+def _check_caller(policy: str) -> bool:
+    return policy in CALLER_POLICIES
+
+
+def _is_internal(code: CodeType) -> bool:
+    """Determine (and memoize) whether code belongs to logging or importlib."""
+    filename: str = code.co_filename
+    internal: Optional[bool] = _internal.get(filename)
+    if internal is None:
+        normed: str = os.path.normcase(filename)
+        internal = normed == _SRCFILE or (
+            "importlib" in normed and "_bootstrap" in normed
+        )
+        _internal[filename] = internal
+
+    return internal
+
+
+def _resolve(f: FrameType, stacklevel: int) -> FrameType:
+    """Walk back from a frame, skipping logging internal frames."""
+    while stacklevel > 0:
+        next_f: Optional[FrameType] = f.f_back
+        if next_f is None:
+            break
+        f = next_f
+        if not _is_internal(f.f_code):
+            stacklevel -= 1
+
+    return f
+
+
+def find_caller_off(stack_info: bool = False, stacklevel: int = 1) -> Caller:
+    """Skip the stack walk entirely, reporting an unknown caller."""
+    return UNKNOWN_CALLER
+
+
+def find_caller_cached(stack_info: bool = False, stacklevel: int = 1) -> Caller:
+    """Find the calling frame, memoizing resolution per call site.
+
+    Notes:
+        * Must be called directly from `Logger._log`, as a replacement of
+            `Logger.findCaller`. Follows `stacklevel` semantics of python >= 3.11,
+            where logging internal frames are not counted.
+        * Call sites are keyed on the code object and last instruction of the
+            frame calling a logging method (e.g. `Logger.info`), so that a hit
+            skips both the stack walk and line number resolution. Sites resolving
+            beyond that frame (e.g. through a `LoggerAdapter`, or a `stacklevel`
+            above one) are walked on every call.
+
+    """
+    method: FrameType = sys._getframe(2)
+    site_frame: Optional[FrameType] = method.f_back
+    if stack_info or site_frame is None:
+        f: FrameType = _resolve(sys._getframe(1), stacklevel)
+        code: CodeType = f.f_code
+        sinfo: Optional[str] = None
+        if stack_info:
+            with StringIO() as sio:
+                sio.write("Stack (most recent call last):\n")
+                traceback.print_stack(f, file=sio)
+                sinfo = sio.getvalue().rstrip("\n")
+        return code.co_filename, f.f_lineno, code.co_name, sinfo
+
+    key: Tuple[int, int, int, int] = (
+        id(method.f_code),
+        id(site_frame.f_code),
+        site_frame.f_lasti,
+        stacklevel,
+    )
+    entry: Optional[Tuple[CodeType, CodeType, Caller]] = _sites.get(key)
+    if entry is not None:
+        return entry[2]
+
+    f = _resolve(sys._getframe(1), stacklevel)
+    code = f.f_code
+    site: Caller = (code.co_filename, f.f_lineno, code.co_name, None)
+    if f is site_frame:
+        _sites[key] = (method.f_code, code, site)
+
+    return site
+
+
+_FINDERS: Dict[str, Optional[CallerFinder]] = {
+    CALLER_FULL: None,
+    CALLER_CACHED: find_caller_cached,
+    CALLER_OFF: find_caller_off,
+}
+
+
+def apply_caller_policy(log: logging.Logger, policy: str) -> None:
+    """Replace (or restore) the caller resolution of a logger instance.
+
+    Args:
+        log (logging.Logger): logger to update.
+        policy (str): One of "full", "cached", or "off".
+
+    Raises:
+        ValueError: if caller policy is not supported.
+
+    """
+    if _check_caller(policy) is False:
+        raise ValueError(f"Unsupported Caller Policy: {policy}")
+
+    finder: Optional[CallerFinder] = _FINDERS[policy]
+    if finder is None:
+        vars(log).pop("findCaller", None)
+    else:
+        vars(log)["findCaller"] = finder
@@ -0,0 +1,454 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Load shedding filters of managed loggers, applied before records are formatted."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic, sleep
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple, Union
+
+
+# Seconds between background sweeps of summaries pending on filters.
+SWEEP_INTERVAL: float = 1.0
+
+
+@dataclass(frozen=True)
+class Limit:
+    """Load shedding configuration of a logger (or dotted prefix of loggers).
+
+    Args:
+        sample (float): Fraction of records kept (0 < sample <= 1). Records are
+            sampled deterministically, e.g. 0.25 keeps every fourth record.
+        rate (float | None): Sustained records per second admitted by a token
+            bucket, or None for no rate limit.
+        burst (float | None): Capacity of the token bucket (defaults to rate, and
+            at least one record).
+        interval (float): Minimum seconds between "N records suppressed" summaries.
+        level (int): Logging level of summaries.
+
+    Raises:
+        ValueError: if sample, rate, burst, or interval are out of range.
+
+    """
+
+    sample: float = 1.0
+    rate: Optional[float] = None
+    burst: Optional[float] = None
+    interval: float = 60.0
+    level: int = logging.WARNING
+
+    def __post_init__(self) -> None:
+        if not 0 < self.sample <= 1:
+            raise ValueError(f"Unsupported Sample Rate: {self.sample}")
+        if self.rate is not None and self.rate <= 0:
+            raise ValueError(f"Unsupported Rate Limit: {self.rate}")
+        if self.burst is not None and self.burst < 1:
+            raise ValueError(f"Unsupported Burst Size: {self.burst}")
+        if self.interval < 0:
+            raise ValueError(f"Unsupported Summary Interval: {self.interval}")
+
+    @property
+    def capacity(self) -> float:
+        """Capacity of the token bucket."""
+        if self.burst is not None:
+            return self.burst
+        return max(self.rate or 1.0, 1.0)
+
+
+def prefixes(name: str) -> Iterator[str]:
+    """Dotted prefixes of a logger name, from most to least specific (root "")."""
+    while name:
+        yield name
+        name = name.rpartition(".")[0]
+    yield ""
+
+
+def match_limit(name: str, limits: Dict[str, Limit]) -> Optional[Limit]:
+    """Limit of the most specific prefix of a logger name, if any."""
+    if not limits:
+        return None
+    for prefix in prefixes(name):
+        limit: Optional[Limit] = limits.get(prefix)
+        if limit is not None:
+            return limit
+    return None
+
+
+class LoadShedder(logging.Filter):
+    """Logger filter sampling and rate limiting records, counting those suppressed.
+
+    Once a record is admitted at least `interval` seconds after the previous
+    summary, a single "N records suppressed" record is first passed to the
+    handlers of the logger (bypassing filters). Without a later admitted record,
+    pending suppression is summarized by a background sweep once due.
+
+    Args:
+        log (logging.Logger): Filtered logger, through which summaries are emitted.
+        limit (Limit): Load shedding configuration.
+
+    Attributes:
+        suppressed (int): Total number of records suppressed.
+        pending (int): Number of records suppressed since the last summary.
+
+    """
+
+    log: logging.Logger
+    limit: Limit
+    suppressed: int
+    pending: int
+
+    def __init__(self, log: logging.Logger, limit: Limit) -> None:
+        super().__init__()
+        self.log = log
+        self.limit = limit
+        self.suppressed = 0
+        self.pending = 0
+
+        now: float = monotonic()
+        self._lock = threading.Lock()
+        self._credit: float = 1.0 - limit.sample  # Admit the first record
+        self._tokens: float = limit.capacity
+        self._stamp: float = now
+        self._next: float = now + limit.interval
+        _SWEEPER.register(self)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Admit or suppress a record."""
+        with self._lock:
+            if not self._admit():
+                self.suppressed += 1
+                self.pending += 1
+                return False
+            due: bool = self.pending > 0 and monotonic() >= self._next
+
+        if due:
+            self.summarize()
+        return True
+
+    def _admit(self) -> bool:
+        limit: Limit = self.limit
+        if limit.sample < 1.0:
+            self._credit += limit.sample
+            # NOTE: tolerance of accumulated rounding error, e.g. ten times 0.1
+            if self._credit < 1.0 - 1e-9:
+                return False
+            self._credit -= 1.0
+
+        if limit.rate is not None:
+            now: float = monotonic()
+            self._tokens = min(
+                limit.capacity, self._tokens + (now - self._stamp) * limit.rate
+            )
+            self._stamp = now
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+
+        return True
+
+    def expire(self) -> None:
+        """Emit a summary of suppressed records, if due."""
+        if not self.pending:
+            return
+        with self._lock:
+            due: bool = self.pending > 0 and monotonic() >= self._next
+        if due:
+            self.summarize()
+
+    def summarize(self) -> None:
+        """Emit a summary of records suppressed since the last summary, if any."""
+        with self._lock:
+            count: int = self.pending
+            self.pending = 0
+            self._next = monotonic() + self.limit.interval
+
+        if count == 0 or not self.log.isEnabledFor(self.limit.level):
+            return
+
+        record: logging.LogRecord = self.log.makeRecord(
+            self.log.name,
+            self.limit.level,
+            "",
+            0,
+            "%d records suppressed",
+            (count,),
+            None,
+        )
+        self.log.callHandlers(record)
+
+
+def get_shedder(log: logging.Logger) -> Optional[LoadShedder]:
+    """Load shedding filter of a logger, if any."""
+    for f in log.filters:
+        if isinstance(f, LoadShedder):
+            return f
+    return None
+
+
+def apply_limit(log: logging.Logger, limit: Optional[Limit]) -> None:
+    """Replace (or remove) the load shedding filter of a logger.
+
+    Records suppressed by a replaced filter are summarized first.
+
+    """
+    current: Optional[LoadShedder] = get_shedder(log)
+    if current is not None:
+        if current.limit == limit:
+            return
+        current.summarize()
+        log.removeFilter(current)
+
+    if limit is not None:
+        log.addFilter(LoadShedder(log, limit))
+
+
+class _Run:
+    """Repeats of a single message (name, levelno, msg, args)."""
+
+    __slots__ = ("count", "last", "record", "start")
+
+    def __init__(self, record: logging.LogRecord, now: float) -> None:
+        self.record = record
+        self.count: int = 0
+        self.start: float = now
+        self.last: float = now
+
+
+class Coalescer(logging.Filter):
+    """Logger filter suppressing repeats of a message within a sliding window.
+
+    Records are keyed by (name, levelno, msg, args). A record repeating a key seen
+    within the last `window` seconds is suppressed. A run of repeats ends once a
+    key is not seen for `window` seconds (or is evicted from the bounded table),
+    after which a single "last message repeated N times" record is passed to the
+    handlers of the logger. Runs outlasting a window are summarized once a window.
+
+    A single instance may be shared by many loggers.
+
+    Args:
+        window (float): Seconds after which a message is no longer a repeat.
+        maxsize (int): Bound of tracked messages, evicting the least recently seen.
+
+    Raises:
+        ValueError: if window is negative, or maxsize is not positive.
+
+    Notes:
+        * Records with unhashable arguments are never coalesced.
+        * Ended runs are detected by later records (of any key), by a background
+            sweep (once every `SWEEP_INTERVAL` seconds), or by `flush`.
+
+    """
+
+    window: float
+    maxsize: int
+
+    def __init__(self, window: float = 1.0, maxsize: int = 1024) -> None:
+        if window < 0:
+            raise ValueError(f"Unsupported Coalesce Window: {window}")
+        if maxsize < 1:
+            raise ValueError(f"Unsupported Coalesce Table Size: {maxsize}")
+
+        super().__init__()
+        self.window = window
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._runs: OrderedDict[Hashable, _Run] = OrderedDict()
+        self._loggers: weakref.WeakValueDictionary[str, logging.Logger] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Admit a record, or suppress a repeat."""
+        key: Tuple[Any, ...] = (record.name, record.levelno, record.msg, record.args)
+        try:
+            hash(key)
+        except TypeError:
+            return True
+
+        now: float = monotonic()
+        ended: List[_Run] = []
+        with self._lock:
+            run: Optional[_Run] = self._runs.get(key)
+            if run is not None and now - run.last <= self.window:
+                run.count += 1
+                run.last = now
+                run.record = record
+                self._runs.move_to_end(key)
+                if now - run.start < self.window:
+                    return False
+                # Summarize a long run once a window, suppressing this repeat
+                summary = _Run(record, now)
+                summary.count = run.count
+                run.count = 0
+                run.start = now
+                ended.append(summary)
+                admit: bool = False
+            else:
+                if run is not None and run.count:
+                    ended.append(run)
+                self._runs[key] = _Run(record, now)
+                self._runs.move_to_end(key)
+                admit = True
+            ended.extend(self._expire(now))
+
+        self._summarize(ended)
+        return admit
+
+    def _expire(self, now: float) -> List[_Run]:
+        """Remove ended runs, and least recently seen runs beyond table bound."""
+        ended: List[_Run] = []
+        while self._runs:
+            key, run = next(iter(self._runs.items()))
+            if now - run.last <= self.window and len(self._runs) <= self.maxsize:
+                break
+            del self._runs[key]
+            if run.count:
+                ended.append(run)
+        return ended
+
+    def expire(self) -> None:
+        """Summarize and forget runs ended without a later record."""
+        if not self._runs:
+            return
+        with self._lock:
+            ended: List[_Run] = self._expire(monotonic())
+        self._summarize(ended)
+
+    def flush(self, name: Optional[str] = None) -> None:
+        """Summarize and forget pending runs (of a single logger, if named)."""
+        with self._lock:
+            keys: List[Hashable] = [
+                key
+                for key, run in self._runs.items()
+                if name is None or run.record.name == name
+            ]
+            ended: List[_Run] = [self._runs.pop(key) for key in keys]
+
+        self._summarize([run for run in ended if run.count])
+
+    def attach(self, log: logging.Logger) -> None:
+        """Register a filtered logger, through which its summaries are emitted."""
+        self._loggers[log.name] = log
+        _SWEEPER.register(self)
+
+    def _summarize(self, runs: List[_Run]) -> None:
+        for run in runs:
+            record: logging.LogRecord = run.record
+            log: Optional[logging.Logger] = self._loggers.get(record.name)
+            if log is None:
+                log = logging.getLogger(record.name)
+            if not log.isEnabledFor(record.levelno):
+                continue
+            summary: logging.LogRecord = log.makeRecord(
+                record.name,
+                record.levelno,
+                record.pathname,
+                record.lineno,
+                "last message repeated %d times",
+                (run.count,),
+                None,
+                record.funcName,
+            )
+            log.callHandlers(summary)
+
+
+def apply_coalescer(log: logging.Logger, coalescer: Optional[Coalescer]) -> None:
+    """Replace (or remove) the coalescing filter of a logger, ahead of other filters.
+
+    Pending repeats of the logger are summarized by a replaced filter first.
+
+    """
+    for f in list(log.filters):
+        if isinstance(f, Coalescer):
+            if f is coalescer:
+                return
+            f.flush(log.name)
+            log.removeFilter(f)
+
+    if coalescer is not None:
+        coalescer.attach(log)
+        log.filters.insert(0, coalescer)
+
+
+class _Sweeper:
+    """Daemon thread expiring summaries pending on live filters, once an interval.
+
+    The thread is started by the first registered filter, and ends once no
+    registered filter remains.
+
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._filters: weakref.WeakSet[Union[LoadShedder, Coalescer]] = (
+            weakref.WeakSet()
+        )
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, f: Union[LoadShedder, Coalescer]) -> None:
+        """Register a filter, starting the sweeper thread if not running."""
+        with self._lock:
+            self._filters.add(f)
+            if self._thread is None:
+                self._start()
+
+    def _start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="EpiLog.sweeper", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            sleep(SWEEP_INTERVAL)
+            with self._lock:
+                if not self._filters:
+                    self._thread = None
+                    return
+            self.sweep()
+
+    def sweep(self) -> None:
+        """Expire summaries pending on every registered filter."""
+        for f in list(self._filters):
+            f.expire()
+
+    def _after_fork(self) -> None:
+        # NOTE: Threads of a forked parent do not exist within this process.
+        self._lock = threading.Lock()
+        self._thread = None
+        if self._filters:
+            self._start()
+
+
+_SWEEPER = _Sweeper()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_SWEEPER._after_fork)
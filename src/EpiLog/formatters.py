@@ -0,0 +1,257 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Structured (JSON lines) formatter, serializing records by a precompiled plan."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from json.encoder import encode_basestring, encode_basestring_ascii
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from .records import OPTIONAL_FIELDS
+
+
+# Attributes of every LogRecord, excluded when passing through all `extra` keys.
+RESERVED: FrozenSet[str] = frozenset(
+    vars(logging.makeLogRecord({})).keys() | {"message", "asctime", "taskName"}
+)
+DEFAULT_FIELDS: Tuple[str, ...] = (
+    "asctime",
+    "name",
+    "levelname",
+    "module",
+    "funcName",
+    "lineno",
+    "message",
+)
+
+Encoder = Callable[[Any], str]
+Plan = Callable[[logging.LogRecord], List[str]]
+
+
+def _encode_float(value: float) -> str:
+    # NOTE: NaN and Infinity are not valid JSON
+    if value != value or value in (float("inf"), float("-inf")):
+        return "null"
+    return float.__repr__(value)
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter of records as single line JSON objects.
+
+    The fields of each object are compiled once, at construction, into a single
+    function of precomputed key fragments and inlined attribute lookups, so that
+    formatting a record only encodes values. Strings are encoded inline, numbers,
+    booleans and None directly; any other value falls back to `json.dumps`, and to
+    its (string) repr if not serializable.
+
+    Args:
+        fields (Sequence[str]): Record attributes included, in order. Besides
+            record attributes, "message" (formatted message) and "asctime"
+            (`formatTime`) are supported.
+        extra (Sequence[str] | bool): Keys passed to a logging call as `extra` to
+            include when present, or True to include every non standard attribute.
+        rename (Dict[str, str] | None): Output keys of fields, by attribute name.
+        datefmt (str | None): Date format of "asctime".
+        ensure_ascii (bool): Escape non ASCII characters of strings.
+
+    Notes:
+        * Exception and stack information are added (as "exc_info" and
+            "stack_info") when present.
+        * A message which fails to format with its arguments is reported as the
+            template, and the repr of its arguments, in place of raising.
+        * Declares `record_fields`, so that slim records (see `EpiLog.records`)
+            populate only those costly attributes included.
+
+    Examples:
+        ```python
+        formatter = JsonFormatter(
+            ("created", "name", "levelname", "message"),
+            extra=("request_id",),
+            rename={"levelname": "level"},
+        )
+        manager = EpiLog(formatter=formatter)
+        ```
+
+    """
+
+    fields: Tuple[str, ...]
+    extra: Union[Tuple[str, ...], bool]
+    record_fields: FrozenSet[str]
+
+    def __init__(
+        self,
+        fields: Sequence[str] = DEFAULT_FIELDS,
+        extra: Union[Sequence[str], bool] = (),
+        rename: Optional[Dict[str, str]] = None,
+        datefmt: Optional[str] = None,
+        ensure_ascii: bool = False,
+    ) -> None:
+        super().__init__(datefmt=datefmt)
+        self._second: Tuple[int, Optional[str], str] = (-1, None, "")
+        self.fields = tuple(fields)
+        self.extra = extra if isinstance(extra, bool) else tuple(extra)
+        rename = rename or {}
+
+        self._string: Encoder = (
+            encode_basestring_ascii if ensure_ascii else encode_basestring
+        )
+        self._encoders: Dict[type, Encoder] = {
+            str: self._string,
+            int: int.__repr__,
+            float: _encode_float,
+            bool: lambda v: "true" if v else "false",
+            type(None): lambda _: "null",
+        }
+
+        self._plan: Plan = self._compile(
+            [(self._key(rename.get(f, f)), f) for f in self.fields]
+        )
+        self._extra: Tuple[Tuple[str, str], ...] = (
+            tuple((self._key(k), k) for k in self.extra)
+            if isinstance(self.extra, tuple)
+            else ()
+        )
+        self._exc_key: str = self._key(rename.get("exc_info", "exc_info"))
+        self._stack_key: str = self._key(rename.get("stack_info", "stack_info"))
+
+        self.record_fields = frozenset(self.fields) & OPTIONAL_FIELDS
+
+    def _key(self, key: str) -> str:
+        return "," + self._string(key) + ":"
+
+    def _compile(self, plan: Sequence[Tuple[str, str]]) -> Plan:
+        """Compile a field plan of (key fragment, field) into a single function.
+
+        The function returns the opening brace, followed by alternating key
+        fragments and encoded values, e.g. `["{", '"name":', '"app"']`.
+
+        """
+        items: List[str] = ['"{"']
+        for n, (key, field) in enumerate(plan):
+            if field == "message":
+                value = "_message(record)"
+            elif field == "asctime":
+                value = "_time(record, _datefmt)"
+            else:
+                value = f"get({field!r})"
+            items.append(repr(key[1:] if n == 0 else key))
+            items.append(f"(_S(v) if (v := {value}).__class__ is str else _E(v))")
+
+        source: str = (
+            "def plan(record):\n"
+            "    get = record.__dict__.get\n"
+            f"    return [{', '.join(items)}]\n"
+        )
+        namespace: Dict[str, Any] = {
+            "_S": self._string,
+            "_E": self._encode,
+            "_message": self._message,
+            "_time": self.formatTime,
+            "_datefmt": self.datefmt,
+        }
+        exec(source, namespace)
+        return cast(Plan, namespace["plan"])
+
+    @staticmethod
+    def _message(record: logging.LogRecord) -> str:
+        try:
+            return record.getMessage()
+        except Exception:
+            return f"{record.msg!s} {record.args!r}"
+
+    def _encode(self, value: Any) -> str:
+        encoder: Optional[Encoder] = self._encoders.get(type(value))
+        if encoder is not None:
+            return encoder(value)
+        try:
+            return json.dumps(
+                value, ensure_ascii=self._string is encode_basestring_ascii
+            )
+        except (TypeError, ValueError):
+            return self._string(repr(value))
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        """Format creation time, reusing the formatted second of a previous record."""
+        second: int = int(record.created)
+        cached: Tuple[int, Optional[str], str] = self._second
+        if cached[0] != second or cached[1] != datefmt:
+            text: str = time.strftime(
+                datefmt or self.default_time_format, self.converter(record.created)
+            )
+            cached = self._second = (second, datefmt, text)
+
+        if datefmt or not self.default_msec_format:
+            return cached[2]
+        return self.default_msec_format % (cached[2], record.msecs)
+
+    def usesTime(self) -> bool:
+        """Formatted records include "asctime"."""
+        return "asctime" in self.fields
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize a record as a single line JSON object."""
+        encode = self._encode
+        parts: List[str] = self._plan(record)
+
+        values: Dict[str, Any] = record.__dict__
+        if self.extra is True:
+            for name, value in values.items():
+                if name not in RESERVED:
+                    parts.append(self._key(name))
+                    parts.append(encode(value))
+        else:
+            for key, name in self._extra:
+                if name in values:
+                    parts.append(key)
+                    parts.append(encode(values[name]))
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            parts.append(self._exc_key)
+            parts.append(self._string(record.exc_text))
+        if record.stack_info:
+            parts.append(self._stack_key)
+            parts.append(self._string(self.formatStack(record.stack_info)))
+
+        if len(parts) == 1:
+            return "{}"
+        if not self.fields:
+            parts[1] = parts[1][1:]
+        parts.append("}")
+        return "".join(parts)
@@ -0,0 +1,381 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Logging Handlers used by the EpiLog Manager to decouple loggers from I/O."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+from dataclasses import dataclass, field
+from io import UnsupportedOperation
+from time import monotonic, perf_counter_ns
+from typing import IO, Any, Dict, FrozenSet, List, Optional
+
+
+OVERFLOW_BLOCK: str = "block"
+OVERFLOW_DROP_OLDEST: str = "drop-oldest"
+OVERFLOW_DROP_NEWEST: str = "drop-newest"
+OVERFLOW_POLICIES: FrozenSet[str] = frozenset(
+    {
+        OVERFLOW_BLOCK,
+        OVERFLOW_DROP_OLDEST,
+        OVERFLOW_DROP_NEWEST,
+    }
+)
+
+# Seconds the batch timer waits on the handler lock, before checking for close.
+_LOCK_POLL: float = 0.05
+
+
+def _check_overflow(policy: str) -> bool:
+    return policy in OVERFLOW_POLICIES
+
+
+class EnqueueHandler(logging.Handler):
+    """Cheap Handler which places records onto a queue without formatting them.
+
+    Args:
+        records (queue.Queue): Queue shared with a `QueueListener`.
+        overflow (str): Policy applied when a bounded queue is full. One of
+            "block", "drop-oldest", or "drop-newest".
+
+    Attributes:
+        dropped (int): Number of records discarded by a drop overflow policy.
+
+    Raises:
+        ValueError: if overflow policy is not supported.
+
+    Notes:
+        * Records are enqueued as is, so formatting (and evaluation of `args`) is
+            deferred to the listener thread. Mutable arguments should not be
+            modified after they are logged.
+
+    """
+
+    records: queue.Queue[Any]
+    overflow: str
+    dropped: int
+
+    def __init__(self, records: queue.Queue[Any], overflow: str = OVERFLOW_BLOCK):
+        if _check_overflow(overflow) is False:
+            raise ValueError(f"Unsupported Overflow Policy: {overflow}")
+
+        super().__init__()
+        self.records = records
+        self.overflow = overflow
+        self.dropped = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Enqueue a record, applying the overflow policy if the queue is full."""
+        try:
+            self.records.put_nowait(record)
+        except queue.Full:
+            self._overflow(record)
+
+    def _overflow(self, record: logging.LogRecord) -> None:
+        if self.overflow == OVERFLOW_BLOCK:
+            self.records.put(record)
+            return
+
+        self.dropped += 1
+        if self.overflow == OVERFLOW_DROP_NEWEST:
+            return
+
+        # Drop Oldest: Make room by evicting the head of the queue. Another producer
+        # may refill the vacated slot first, so we retry until our record fits.
+        while True:
+            try:
+                self.records.get_nowait()
+                self.records.task_done()
+            except queue.Empty:
+                pass
+
+            try:
+                self.records.put_nowait(record)
+                return
+            except queue.Full:
+                continue
+
+
+class QueueListener(logging.handlers.QueueListener):
+    """Background thread draining a record queue into the destination handler(s).
+
+    Args:
+        records (queue.Queue): Queue shared with an `EnqueueHandler`.
+        handlers (logging.Handler): Destination handlers.
+
+    Notes:
+        * A running listener is stopped (and the queue drained) at interpreter exit.
+
+    """
+
+    records: queue.Queue[Any]
+
+    def __init__(self, records: queue.Queue[Any], *handlers: logging.Handler):
+        super().__init__(records, *handlers, respect_handler_level=True)
+        self.records = records
+
+    @property
+    def running(self) -> bool:
+        """Listener thread is active."""
+        return self._thread is not None
+
+    def start(self) -> None:
+        """Start the listener thread, and register it to be stopped at exit."""
+        if self.running:
+            return
+        super().start()
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Drain the queue, stop the listener thread, and flush handlers."""
+        if not self.running:
+            return
+        atexit.unregister(self.stop)
+        super().stop()
+        self._flush_handlers()
+
+    def enqueue_sentinel(self) -> None:
+        """Enqueue the sentinel, waiting on a full bounded queue to make room."""
+        self.records.put(self._sentinel)  # type: ignore[attr-defined]
+
+    def flush(self) -> None:
+        """Block until every enqueued record has been handled, then flush handlers."""
+        thread = self._thread
+        # NOTE: Waiting on the queue from the listener thread itself (e.g. a handler
+        #       which logs) would never return.
+        if thread is not None and thread is not threading.current_thread():
+            self.records.join()
+        self._flush_handlers()
+
+    def swap(self, *handlers: logging.Handler) -> None:
+        """Replace destination handlers, after flushing pending records to current."""
+        self.flush()
+        self.handlers = handlers
+
+    def _flush_handlers(self) -> None:
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except UnsupportedOperation:
+                # NOTE: see `EpiLog.remove`, e.g. sys.stdin cannot be flushed.
+                ...
+
+
+@dataclass
+class BatchStats:
+    """Running statistics of batches written by a `BatchingHandler`.
+
+    Args:
+        batches (int): number of batches written
+        records (int): number of records written
+        size (int): number of characters written
+        max_batch (int): largest number of records written in a single batch
+        latency_ns (int): total time spent writing and flushing batches
+        max_latency_ns (int): longest time spent writing and flushing a batch
+        reasons (dict[str, int]): count of batches written by flush trigger
+
+    """
+
+    batches: int = 0
+    records: int = 0
+    size: int = 0
+    max_batch: int = 0
+    latency_ns: int = 0
+    max_latency_ns: int = 0
+    reasons: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def mean_batch(self) -> float:
+        """Mean number of records per batch."""
+        return self.records / self.batches if self.batches else 0.0
+
+    @property
+    def mean_latency_ns(self) -> float:
+        """Mean time spent writing and flushing a batch."""
+        return self.latency_ns / self.batches if self.batches else 0.0
+
+    def update(self, records: int, size: int, latency_ns: int, reason: str) -> None:
+        """Record a written batch."""
+        self.batches += 1
+        self.records += records
+        self.size += size
+        self.max_batch = max(self.max_batch, records)
+        self.latency_ns += latency_ns
+        self.max_latency_ns = max(self.max_latency_ns, latency_ns)
+        self.reasons[reason] = self.reasons.get(reason, 0) + 1
+
+
+class BatchingHandler(logging.StreamHandler):  # type: ignore[type-arg]
+    """Stream Handler gathering formatted records to write as a single batch.
+
+    A batch is written (and the stream flushed) once any threshold is reached, or
+    immediately when a record at or above the flush level arrives.
+
+    Args:
+        stream (IO[str]): Where batches are written to (defaults to sys.stderr).
+        max_bytes (int): Size (in characters) of buffer which triggers a write.
+        max_records (int): Number of buffered records which triggers a write.
+        max_latency (float | None): Maximum seconds a record may remain buffered,
+            enforced by a timer thread. None disables the timer.
+        flush_level (int): Records at or above this level are written immediately.
+
+    Attributes:
+        stats (BatchStats): Batch size and flush latency statistics.
+
+    Examples:
+        ```python
+        import logging
+        from EpiLog import EpiLog
+        from EpiLog.handlers import BatchingHandler
+
+        manager = EpiLog(stream=BatchingHandler(max_records=512, max_latency=0.5))
+        ```
+
+    """
+
+    max_bytes: int
+    max_records: int
+    max_latency: Optional[float]
+    flush_level: int
+    stats: BatchStats
+
+    def __init__(
+        self,
+        stream: Optional[IO[str]] = None,
+        max_bytes: int = 1 << 16,
+        max_records: int = 1024,
+        max_latency: Optional[float] = 1.0,
+        flush_level: int = logging.ERROR,
+    ):
+        super().__init__(stream)
+        self.max_bytes = max_bytes
+        self.max_records = max_records
+        self.max_latency = max_latency
+        self.flush_level = flush_level
+        self.stats = BatchStats()
+
+        self._buffer: List[str] = []
+        self._size: int = 0
+        self._deadline: Optional[float] = None
+        self._wake = threading.Event()
+        self._closing = threading.Event()
+        self._timer: Optional[threading.Thread] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Buffer a formatted record, writing the batch if a threshold is reached."""
+        try:
+            msg: str = self.format(record) + self.terminator
+            self._buffer.append(msg)
+            self._size += len(msg)
+
+            if record.levelno >= self.flush_level:
+                self._write("level")
+            elif self._size >= self.max_bytes:
+                self._write("bytes")
+            elif len(self._buffer) >= self.max_records:
+                self._write("records")
+            elif self._deadline is None and self.max_latency is not None:
+                self._deadline = monotonic() + self.max_latency
+                self._start_timer()
+                self._wake.set()
+
+        except RecursionError:  # See issue 36272 of cpython
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Write any buffered records, and flush the stream."""
+        self.acquire()
+        try:
+            self._write("flush")
+            super().flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Stop timer thread, and write any buffered records before closing."""
+        self._closing.set()
+        self._wake.set()
+        timer, self._timer = self._timer, None
+        if timer is not None and timer is not threading.current_thread():
+            timer.join()
+
+        try:
+            if not getattr(self.stream, "closed", False):
+                self.flush()
+        finally:
+            super().close()
+
+    def _write(self, reason: str) -> None:
+        # NOTE: Caller must hold the handler lock
+        self._deadline = None
+        if not self._buffer:
+            return
+
+        batch: str = "".join(self._buffer)
+        records: int = len(self._buffer)
+        self._buffer.clear()
+        self._size = 0
+
+        t0: int = perf_counter_ns()
+        self.stream.write(batch)
+        if hasattr(self.stream, "flush"):
+            self.stream.flush()
+        self.stats.update(records, len(batch), perf_counter_ns() - t0, reason)
+
+    def _start_timer(self) -> None:
+        if self._timer is not None or self._closing.is_set():
+            return
+        self._timer = threading.Thread(target=self._monitor, daemon=True)
+        self._timer.start()
+
+    def _monitor(self) -> None:
+        while not self._closing.is_set():
+            deadline: Optional[float] = self._deadline
+            if deadline is None:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+
+            remaining: float = deadline - monotonic()
+            if remaining > 0:
+                self._wake.wait(remaining)
+                self._wake.clear()
+                continue
+
+            # NOTE: close may be called with the lock held (see logging.shutdown),
+            #       and joins this thread, so closing is re-checked between tries.
+            lock: Any = self.lock
+            if not lock.acquire(timeout=_LOCK_POLL):
+                continue
+            try:
+                if self._deadline is not None and monotonic() >= self._deadline:
+                    self._write("latency")
+            except Exception:
+                self.handleError(logging.makeLogRecord({"msg": "Batch write failed."}))
+            finally:
+                lock.release()
@@ -0,0 +1,156 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Deferred evaluation of expensive log message arguments."""
+
+from __future__ import annotations
+
+import logging
+from types import FunctionType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+
+_PENDING: Any = object()
+
+
+class Lazy:
+    """Message argument evaluated once, only when a record is formatted.
+
+    The wrapped call is deferred until the message of a record is first formatted,
+    i.e. once the record passed the level and filters of its logger and reached a
+    handler. The value is cached, so records formatted by several handlers (or
+    shipped to another process) evaluate it once.
+
+    Args:
+        func (Callable[..., Any]): Callable computing the argument.
+        *args (Any): Positional arguments of func.
+        **kwargs (Any): Keyword arguments of func.
+
+    Examples:
+        ```python
+        log.debug("state: %s", Lazy(json.dumps, state, indent=2))
+        log.debug("mean: %.3f", Lazy(statistics.fmean, samples))
+        ```
+
+    Notes:
+        * Evaluation takes no lock, so a slow argument never blocks formatting of
+            others. Formatted concurrently by several threads, it may be evaluated
+            once by each, and the first value computed is retained.
+
+    """
+
+    __slots__ = ("_call", "_value")
+
+    _call: Optional[Tuple[Callable[..., Any], Tuple[Any, ...], Dict[str, Any]]]
+    _value: Any
+
+    def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self._call = (func, args, kwargs)
+        self._value = _PENDING
+
+    @property
+    def evaluated(self) -> bool:
+        """Value has been computed."""
+        return self._value is not _PENDING
+
+    @property
+    def value(self) -> Any:
+        """Computed value, evaluated on first access."""
+        if self._value is _PENDING:
+            # NOTE: Read as a whole, as another thread may release it once evaluated
+            call = self._call
+            if call is not None:
+                func, args, kwargs = call
+                value: Any = func(*args, **kwargs)
+                if self._value is _PENDING:
+                    self._value = value
+                # Release references held only for evaluation
+                self._call = None
+        return self._value
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+    def __repr__(self) -> str:
+        return repr(self.value)
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.value, format_spec)
+
+    def __int__(self) -> int:
+        return int(self.value)
+
+    def __float__(self) -> float:
+        return float(self.value)
+
+    def __index__(self) -> int:
+        return int(self.value.__index__())
+
+
+def deferred(value: Any) -> bool:
+    """Argument is a zero argument lambda, deferred by `LazyArgs`.
+
+    Other callables (functions, classes, builtins, bound methods, or callable
+    instances) are ordinary message arguments, and are never called.
+
+    """
+    if type(value) is not FunctionType or value.__name__ != "<lambda>":
+        return False
+    code: Any = value.__code__
+    return bool(code.co_argcount == 0 and code.co_kwonlyargcount == 0)
+
+
+class LazyArgs(logging.Filter):
+    """Logger filter deferring lambda message arguments, by wrapping them as Lazy.
+
+    Runs only for records of an enabled level, and never evaluates arguments. Zero
+    argument lambdas among positional arguments, or values of a single mapping
+    argument, are wrapped (see `deferred`).
+
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Wrap lambda arguments of a record, admitting it."""
+        args: Any = record.args
+        if not args:
+            return True
+        if isinstance(args, Mapping):
+            if any(deferred(v) for v in args.values()):
+                record.args = {k: _defer(v) for k, v in args.items()}
+        elif any(deferred(a) for a in args):
+            record.args = tuple(_defer(a) for a in args)
+        return True
+
+
+def _defer(value: Any) -> Any:
+    return Lazy(value) if deferred(value) else value
+
+
+LAZY_ARGS = LazyArgs()
+"""Filter shared by loggers of managers accepting lazy arguments."""
+
+
+def apply_lazy(log: logging.Logger, enabled: bool) -> None:
+    """Add (or remove) the filter deferring lambda arguments of a logger."""
+    if enabled:
+        log.addFilter(LAZY_ARGS)
+    else:
+        log.removeFilter(LAZY_ARGS)
@@ -23,10 +23,40 @@
 
 from __future__ import annotations
 
+import atexit
+import bisect
 import logging
+import queue
 import sys
+import threading
 from io import UnsupportedOperation
-from typing import FrozenSet, Union
+from multiprocessing.context import BaseContext
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .caller import CALLER_FULL, CALLER_OFF, _check_caller, apply_caller_policy
+from .filters import (
+    Coalescer,
+    Limit,
+    apply_coalescer,
+    apply_limit,
+    get_shedder,
+    match_limit,
+)
+from .handlers import OVERFLOW_BLOCK, EnqueueHandler, QueueListener
+from .lazy import apply_lazy
+from .multiproc import MANAGERS, Collector, ShippingHandler, worker_queue
+from .records import RecordFactory, apply_record_factory
+from .reporter import Reporter, Source, apply_counter
 
 
 PROTECTED_STREAMS = (sys.stderr, sys.stdin, sys.stdout)
@@ -51,12 +81,33 @@ defaultFormat = logging.Formatter(
         ]
     )
 )
+callerlessFormat = logging.Formatter(
+    " | ".join(
+        [
+            "%(asctime)s",
+            "%(name)s",
+            "%(levelname)s",
+            "%(message)s",
+        ]
+    )
+)
 
 
 def _check_level(level: int) -> bool:
     return level in LOGGING_LEVELS
 
 
+def _flush(handler: logging.Handler) -> None:
+    try:
+        handler.flush()
+    except UnsupportedOperation:
+        # NOTE: in the odd case where sys.stdin is used as the stream, which
+        #       cannot be flushed and raises an error. Read only streams do not
+        #       raise an error, as the implementation simply passes. Primarily
+        #       here for unit testing.
+        ...
+
+
 class EpiLog:
     """Log Manager designed to centralize Local Module or Task level logging control.
 
@@ -64,11 +115,61 @@ class EpiLog:
         level (int): Logging Level
         stream (logging.Handler): Where logs are written to
         formatter (logging.Formatter): Dictates how to logs are formatted
+        queued (bool): Dispatched loggers enqueue records, which are written to
+            stream from a background listener thread.
+        maxsize (int): Bound of record queue when queued (<= 0 is unbounded).
+        overflow (str): Policy when a bounded queue is full: "block",
+            "drop-oldest", or "drop-newest".
+        caller (str): Caller information policy of dispatched loggers. One of
+            "full" (walk the stack per record), "cached" (memoize per call site,
+            skipping the walk), or "off" (skip the stack walk, using
+            `callerlessFormat` in place of `defaultFormat`).
+        slim (bool): Dispatched loggers construct records populating only those
+            costly attributes referenced by the formatters of reachable handlers
+            (see `EpiLog.records`).
+        collect (bool): Start a collector, writing records shipped by worker
+            processes initialized with `EpiLog.multiproc.init_worker` (and
+            `worker_args`) to stream.
+        context (BaseContext | None): Multiprocessing context of the collector.
+        limits (Dict[str, Limit] | None): Load shedding (sampling and rate limits)
+            of dispatched loggers, keyed by logger name or dotted prefix. The most
+            specific prefix applies ("" applies to every logger).
+        coalesce (float | Coalescer | None): Suppress repeats of a message within
+            a sliding window (seconds), emitting "last message repeated N times"
+            once a run ends (see `EpiLog.filters.Coalescer`).
+        handlers (Sequence[logging.Handler]): Additional handlers attached alongside
+            stream, e.g. a `FlightRecorder` (see `attach`).
+        namespace (bool): Dispatched loggers are children of a single, manager owned
+            parent logger, which holds the handler(s) and the effective level, such
+            that changing level, formatter or stream is independent of the number of
+            managed loggers.
+        lazy (bool): Zero argument lambda message arguments of dispatched loggers
+            are deferred, evaluated (once) only when a record is formatted (see
+            `EpiLog.lazy`). Other callables remain ordinary arguments.
+
+    Attributes:
+        epoch (int): Configuration epoch shared by all managers, incremented once a
+            change of the level of managed loggers is applied. Long lived objects
+            (e.g. a reused `BenchMark`) re-evaluate cached levels when it changes.
 
     Notes:
         * Natively Supports only a single Stream per instantiated logger.
         * Designed for local control of logging (i.e. Logging events from globally
             imported libraries are not captured)
+        * When queued, the listener is started by `get_logger`, and stopped once the
+            last logger is removed (or at interpreter exit).
+        * A started reporter (see `start_reporter`) is stopped once its logger is
+            removed, once no other managed loggers remain, or at interpreter exit.
+        * Pending summaries of suppressed records and repeated messages are emitted
+            by a background sweep once due, and at interpreter exit.
+        * Within an initialized worker process, loggers of every manager ship
+            records to the collector of the parent, in place of writing to stream.
+        * Managers are thread safe. Retrieving a managed logger is lock free, while
+            dispatching, removing, and reconfiguring loggers are serialized.
+        * With a namespace, logger names (and records) are unchanged. Managed loggers
+            are re-parented under an (unregistered) parent logger, which propagates to
+            the root logger. Creating an ancestor of a dotted logger name afterwards
+            (e.g. `logging.getLogger("a")` of managed "a.b") re-parents it again.
 
     Examples:
         ``` python
@@ -84,25 +185,111 @@ class EpiLog:
 
     """
 
-    __slots__ = ("_formatter", "_level", "_stream", "loggers")
+    __slots__ = (
+        "__weakref__",
+        "_caller",
+        "_coalesce",
+        "_collector",
+        "_extras",
+        "_factory",
+        "_formatter",
+        "_handler",
+        "_lazy",
+        "_level",
+        "_limits",
+        "_listener",
+        "_lock",
+        "_names",
+        "_parent",
+        "_reporter",
+        "_slim",
+        "_stream",
+        "loggers",
+    )
 
+    _caller: str
+    _factory: Union[RecordFactory, None]
+    _slim: bool
     _level: int
     _stream: logging.Handler
+    _handler: logging.Handler
+    _listener: Union[QueueListener, None]
+    _collector: Union[Collector, None]
+    _limits: Dict[str, Limit]
+    _coalesce: Union[Coalescer, None]
+    _lazy: bool
+    _extras: List[logging.Handler]
+    _parent: Union[logging.Logger, None]
+    _reporter: Union[Reporter, None]
+    _names: List[str]
+    _lock: threading.RLock
     _formatter: logging.Formatter
     loggers: dict[str, logging.Logger]
+    epoch: ClassVar[int] = 0
 
     def __init__(
         self,
         level: int = logging.INFO,
         stream: Union[logging.Handler, None] = None,
         formatter: logging.Formatter = defaultFormat,
+        *,
+        queued: bool = False,
+        maxsize: int = 0,
+        overflow: str = OVERFLOW_BLOCK,
+        caller: str = CALLER_FULL,
+        slim: bool = False,
+        collect: bool = False,
+        context: Union[BaseContext, None] = None,
+        limits: Union[Dict[str, Limit], None] = None,
+        coalesce: Union[float, Coalescer, None] = None,
+        handlers: Sequence[logging.Handler] = (),
+        namespace: bool = False,
+        lazy: bool = False,
     ):
         self.loggers: dict[str, logging.Logger] = {}
+        self._lock = threading.RLock()
+        self._names = []
+        self._extras = []
+        self._parent = None
+        self._reporter = None
+        if namespace:
+            self._parent = logging.Logger(f"EpiLog.{id(self):x}")
+            self._parent.parent = logging.root
+        self._limits = {}
+        self._coalesce = None
+        self._listener = None
+        self._collector = None
+        self._caller = CALLER_FULL
+        self._factory = None
+        self._slim = slim
+        self._lazy = lazy
 
         # Use property setters to manage attributes
         self.stream = stream or logging.StreamHandler()
         self.level = level
         self.formatter = formatter
+        self.caller = caller
+        self.limits = limits
+        self.coalesce = coalesce
+        for handler in handlers:
+            self.attach(handler)
+
+        if queued:
+            records: queue.Queue[Any] = queue.Queue(maxsize)
+            self._handler = EnqueueHandler(records, overflow)
+            self._handler.setLevel(self.level)
+            self._listener = QueueListener(records, self.stream)
+
+        if self._parent is not None:
+            self._parent.addHandler(self._handler)
+
+        shipping: Any = worker_queue()
+        if shipping is not None:
+            self._ship(shipping)
+        elif collect:
+            self._collector = Collector(self.stream, context=context)
+            self._collector.start()
+        MANAGERS.add(self)
 
     def __getitem__(self, item: str) -> logging.Logger:
         """Retrieve Logger by name."""
@@ -111,6 +298,41 @@ class EpiLog:
     def __contains__(self, value: str) -> bool:
         return value in self.loggers
 
+    @property
+    def queued(self) -> bool:
+        """Records are written to stream from a background listener thread."""
+        return self._listener is not None
+
+    @property
+    def parent(self) -> Union[logging.Logger, None]:
+        """Manager owned parent logger of managed loggers, when namespaced."""
+        return self._parent
+
+    def _targets(self) -> Iterable[logging.Logger]:
+        """Loggers holding the handler(s) and level of managed loggers."""
+        if self._parent is not None:
+            return (self._parent,)
+        return self.loggers.values()
+
+    @property
+    def dropped(self) -> int:
+        """Number of records discarded by a queue overflow policy."""
+        if isinstance(self._handler, EnqueueHandler):
+            return self._handler.dropped
+        return 0
+
+    @property
+    def worker_args(self) -> Tuple[Any, ...]:
+        """Initializer arguments of worker processes (see `multiproc.init_worker`).
+
+        Raises:
+            ValueError: if manager is not collecting records of worker processes.
+
+        """
+        if self._collector is None:
+            raise ValueError("EpiLog manager is not collecting worker records.")
+        return (self._collector.records,)
+
     @property
     def level(self) -> int:
         """Logging Level."""
@@ -119,16 +341,31 @@ class EpiLog:
     @level.setter
     def level(self, value: int) -> None:
         """Set Logging Level."""
-        if _check_level(value) is False:
-            raise ValueError(f"Unsupported Logging Level: {value}")
-
-        self._level = value
-        self.stream.setLevel(self.level)
-        for log in self.loggers.values():
-            log.setLevel(self.level)
-            # Update the streams to reflect current level
-            for handle in log.handlers:
-                handle.setLevel(self.level)
+        with self._lock:
+            if _check_level(value) is False:
+                raise ValueError(f"Unsupported Logging Level: {value}")
+
+            self._level = value
+            self.stream.setLevel(self.level)
+            self._handler.setLevel(self.level)
+            for log in self._targets():
+                log.setLevel(self._logger_level())
+                # Update the streams to reflect current level
+                for handle in log.handlers:
+                    if handle not in self._extras:
+                        handle.setLevel(self.level)
+            self._advance()
+
+    @staticmethod
+    def _advance() -> None:
+        """Advance the configuration epoch, once a change has been applied."""
+        # NOTE: a lost (concurrent) increment is harmless, as each change is applied
+        #       before the epoch is read, such that either increment reveals both.
+        EpiLog.epoch += 1
+
+    def _logger_level(self) -> int:
+        """Level of managed loggers, the lowest of manager and attached handlers."""
+        return min([self.level, *(h.level for h in self._extras)])
 
     @property
     def formatter(self) -> logging.Formatter:
@@ -138,17 +375,140 @@ class EpiLog:
     @formatter.setter
     def formatter(self, value: Union[logging.Formatter, None]) -> None:
         """Set Logging Format."""
-        if value is None:
-            value = defaultFormat
+        with self._lock:
+            if value is None:
+                value = defaultFormat
+
+            if value is defaultFormat and self.caller == CALLER_OFF:
+                value = callerlessFormat
 
-        if not issubclass(value.__class__, logging.Formatter):
-            raise TypeError(f"Incorrect Formatter Type: {value.__class__}")
+            if not issubclass(value.__class__, logging.Formatter):
+                raise TypeError(f"Incorrect Formatter Type: {value.__class__}")
 
-        self._formatter: logging.Formatter = value
-        self.stream.setFormatter(self.formatter)
+            self._formatter: logging.Formatter = value
+            self.stream.setFormatter(self.formatter)
+            for log in self._targets():
+                for handle in log.handlers:
+                    if handle not in self._extras:
+                        handle.setFormatter(self.formatter)
+
+            self._derive_factory()
+
+    @property
+    def slim(self) -> bool:
+        """Records populate only those attributes referenced by the formatter."""
+        return self._slim
+
+    @slim.setter
+    def slim(self, value: bool) -> None:
+        """Enable or Disable slim records."""
+        with self._lock:
+            self._slim = value
+            self._derive_factory()
+
+    def _formatters(self) -> List[logging.Formatter]:
+        """Formatters of every handler reached by records of managed loggers."""
+        handlers: List[logging.Handler] = [self.stream, *self._extras]
+        log: Union[logging.Logger, None] = self._parent or logging.root
+        while log is not None:
+            handlers.extend(h for h in log.handlers if h is not self._handler)
+            log = log.parent if log.propagate else None
+
+        return [
+            self.formatter,
+            *(h.formatter or logging._defaultFormatter for h in handlers),  # type: ignore[attr-defined]
+        ]
+
+    def _derive_factory(self) -> None:
+        """Derive the record factory, applied to loggers only when it changes."""
+        factory: Union[RecordFactory, None] = None
+        if self.slim:
+            factory = RecordFactory.from_formatters(self._formatters())
+        if factory == self._factory:
+            return
+
+        self._factory = factory
         for log in self.loggers.values():
-            for handle in log.handlers:
-                handle.setFormatter(self.formatter)
+            apply_record_factory(log, factory)
+
+    @property
+    def caller(self) -> str:
+        """Caller Information Policy."""
+        return self._caller
+
+    @caller.setter
+    def caller(self, value: str) -> None:
+        """Set Caller Information Policy of managed loggers."""
+        with self._lock:
+            if _check_caller(value) is False:
+                raise ValueError(f"Unsupported Caller Policy: {value}")
+
+            self._caller = value
+            for log in self.loggers.values():
+                self._prepare(log)
+
+            # Default format is exchanged, as caller fields would be unknown.
+            if value == CALLER_OFF and self.formatter is defaultFormat:
+                self.formatter = callerlessFormat
+            elif value != CALLER_OFF and self.formatter is callerlessFormat:
+                self.formatter = defaultFormat
+
+    @property
+    def limits(self) -> Dict[str, Limit]:
+        """Load shedding limits, keyed by logger name or dotted prefix."""
+        return dict(self._limits)
+
+    @limits.setter
+    def limits(self, value: Union[Dict[str, Limit], None]) -> None:
+        """Set Load shedding limits of managed loggers."""
+        with self._lock:
+            value = dict(value or {})
+            for limit in value.values():
+                if not isinstance(limit, Limit):
+                    raise TypeError(f"Unsupported Limit Type: {limit.__class__}")
+
+            self._limits = value
+            for log in self.loggers.values():
+                self._prepare(log)
+
+    @property
+    def coalesce(self) -> Union[Coalescer, None]:
+        """Filter coalescing repeated messages of managed loggers."""
+        return self._coalesce
+
+    @coalesce.setter
+    def coalesce(self, value: Union[float, Coalescer, None]) -> None:
+        """Set (or disable) coalescing of repeated messages, by window in seconds."""
+        with self._lock:
+            if value is not None and not isinstance(value, Coalescer):
+                value = Coalescer(value)
+
+            self._coalesce = value
+            for log in self.loggers.values():
+                self._prepare(log)
+
+    @property
+    def lazy(self) -> bool:
+        """Lambda message arguments of managed loggers are deferred."""
+        return self._lazy
+
+    @lazy.setter
+    def lazy(self, value: bool) -> None:
+        """Enable or Disable deferred evaluation of lambda message arguments."""
+        with self._lock:
+            self._lazy = value
+            for log in self.loggers.values():
+                self._prepare(log)
+
+    @property
+    def suppressed(self) -> Dict[str, int]:
+        """Number of records suppressed by load shedding, per managed logger."""
+        counts: Dict[str, int] = {}
+        for name, log in list(self.loggers.items()):
+            shedder = get_shedder(log)
+            if shedder is not None:
+                counts[name] = shedder.suppressed
+        return counts
 
     @property
     def stream(self) -> logging.Handler:
@@ -158,56 +518,295 @@ class EpiLog:
     @stream.setter
     def stream(self, value: Union[logging.Handler, None]) -> None:
         """Replace Logging Handler Streams."""
-        if value is None:
-            value = logging.StreamHandler()
+        with self._lock:
+            if value is None:
+                value = logging.StreamHandler()
+
+            if not issubclass(value.__class__, (logging.Filterer, logging.Handler)):
+                raise TypeError(f"Unsupported Stream Handler: {value.__class__}")
+
+            if hasattr(self, "_stream"):
+                previous = self._stream
+                value.setFormatter(self.formatter)
+                value.setLevel(self.level)
+                self._stream: logging.Handler = value
+
+                if self._collector is not None:
+                    self._collector.swap(self.stream)
+
+                # Loggers remain attached to the enqueue handler
+                if self._listener is not None:
+                    self._listener.swap(self.stream)
+                    return
+
+                self._handler = value
+                # NOTE: added before the previous is removed, such that concurrent
+                #       records are never left without a handler.
+                if value is not previous:
+                    for log in self._targets():
+                        log.addHandler(self.stream)
+                        log.removeHandler(previous)
+
+            else:
+                self._stream = value
+                self._handler = value
+
+    @property
+    def handlers(self) -> Tuple[logging.Handler, ...]:
+        """Additional handlers attached alongside stream."""
+        return tuple(self._extras)
+
+    def attach(self, handler: logging.Handler) -> None:
+        """Attach an additional handler to managed loggers, alongside stream.
+
+        The handler retains its own level (the manager level, if unset), and its own
+        formatter (the manager formatter, if unset). Managed loggers are enabled for
+        the lowest level of the manager and attached handlers.
+
+        Raises:
+            TypeError: if handler is not a logging.Handler.
+
+        """
+        with self._lock:
+            if not isinstance(handler, logging.Handler):
+                raise TypeError(f"Unsupported Stream Handler: {handler.__class__}")
+            if handler in self._extras:
+                return
+
+            if handler.level == logging.NOTSET:
+                handler.setLevel(self.level)
+            if handler.formatter is None:
+                handler.setFormatter(self.formatter)
+
+            self._extras.append(handler)
+            for log in self._targets():
+                log.addHandler(handler)
+                log.setLevel(self._logger_level())
+            self._derive_factory()
+            self._advance()
+
+    def detach(self, handler: logging.Handler) -> None:
+        """Detach an additional handler from managed loggers (without closing it)."""
+        with self._lock:
+            if handler not in self._extras:
+                return
+
+            self._extras.remove(handler)
+            for log in self._targets():
+                log.removeHandler(handler)
+                log.setLevel(self._logger_level())
+            self._derive_factory()
+            self._advance()
+
+    def summarize(self) -> None:
+        """Emit summaries of pending suppressed records and repeated messages."""
+        for log in list(self.loggers.values()):
+            shedder = get_shedder(log)
+            if shedder is not None:
+                shedder.summarize()
+        if self._coalesce is not None:
+            self._coalesce.flush()
+
+    def flush(self) -> None:
+        """Write any pending (queued) records, and flush the stream."""
+        self.summarize()
+        if self._listener is not None:
+            self._listener.flush()
+        if self._collector is not None:
+            self._collector.flush()
+        _flush(self.stream)
 
-        if not issubclass(value.__class__, (logging.Filterer, logging.Handler)):
-            raise TypeError(f"Unsupported Stream Handler: {value.__class__}")
+    @property
+    def reporter(self) -> Union[Reporter, None]:
+        """Reporter of periodic summaries, once started."""
+        return self._reporter
 
-        if hasattr(self, "_stream"):
-            previous = self._stream
-            value.setFormatter(self.formatter)
-            value.setLevel(self.level)
-            self._stream: logging.Handler = value
+    def start_reporter(
+        self,
+        interval: float = 60.0,
+        name: str = "EpiLog.reporter",
+        level: int = logging.INFO,
+        sources: Iterable[Source] = (),
+    ) -> Reporter:
+        """Start a daemon thread reporting summaries once every interval.
+
+        Summaries of sources (and shared accumulators), and counts of records per
+        managed logger, are emitted through a managed logger of the given name. A
+        running reporter is replaced, after a final report.
+
+        Raises:
+            ValueError: if interval is not positive.
+
+        """
+        with self._lock:
+            self._stop_reporter()
+            reporter = Reporter(self.get_logger(name), interval, level)
+            for source in sources:
+                reporter.register(source)
+            self._reporter = reporter
             for log in self.loggers.values():
-                log.removeHandler(previous)
-                log.addHandler(self.stream)
+                self._prepare(log)
+            reporter.start()
+            return reporter
+
+    def stop_reporter(self) -> None:
+        """Stop a running reporter, after a final report."""
+        with self._lock:
+            self._stop_reporter()
+
+    def _stop_reporter(self) -> None:
+        reporter: Union[Reporter, None] = self._reporter
+        if reporter is None:
+            return
+        reporter.stop()
+        self._reporter = None
+        for log in self.loggers.values():
+            apply_counter(log, None)
 
-        else:
-            self._stream = value
+    def names(self, prefix: str = "") -> List[str]:
+        """Sorted names of managed loggers, optionally within a dotted prefix.
+
+        A prefix of "a.b" matches "a.b" and its descendants (e.g. "a.b.c"), but not
+        "a.bc". An empty prefix matches every logger.
+
+        """
+        with self._lock:
+            if not prefix:
+                return list(self._names)
+
+            names: List[str] = self._names
+            exact: int = bisect.bisect_left(names, prefix)
+            # NOTE: descendants are contiguous, from "a.b." to "a.b/" ("/" follows ".")
+            lo: int = bisect.bisect_left(names, prefix + ".")
+            hi: int = bisect.bisect_left(names, prefix + "/", lo)
+            found: List[str] = names[lo:hi]
+            if exact < len(names) and names[exact] == prefix:
+                found.insert(0, prefix)
+            return found
 
     def remove(self, name: Union[str, logging.Logger]) -> None:
         """Remove a logger from local and global registry, and close handler streams."""
         if isinstance(name, logging.Logger):
             name = name.name
-
-        logging.Logger.manager.loggerDict.pop(name)
-        log: logging.Logger = self.loggers.pop(name)
-
-        for handler in log.handlers:
-            try:
-                handler.flush()
-            except UnsupportedOperation:
-                # NOTE: in the odd case where sys.stdin is used as the stream, which
-                #       cannot be flushed and raises an error. Read only streams do not
-                #       raise an error, as the implementation simply passes. Primarily
-                #       here for unit testing.
-                ...
-
-            if id(handler) == id(self.stream):
-                continue
-            handler.close()
-
-            # NOTE: StreamHandler does not actually close the stream to prevent closing
-            #       the default stderr stream.
-            if (
-                hasattr(handler, "stream")
-                and not handler.stream.closed
-                and handler.stream not in PROTECTED_STREAMS
+        self._remove([name])
+
+    def remove_many(self, names: Iterable[Union[str, logging.Logger]]) -> None:
+        """Remove loggers by name (or instance), flushing shared handlers once.
+
+        Raises:
+            KeyError: if any logger is not managed, in which case none are removed.
+
+        """
+        self._remove([n.name if isinstance(n, logging.Logger) else n for n in names])
+
+    def remove_prefix(self, prefix: str) -> List[str]:
+        """Remove loggers within a dotted prefix (see `names`), returning names."""
+        names: List[str] = self.names(prefix)
+        self._remove(names)
+        return names
+
+    def clear(self) -> None:
+        """Remove every managed logger."""
+        self._remove(list(self._names))
+
+    def _remove(self, names: List[str]) -> None:
+        """Remove a batch of loggers, flushing shared handlers once per batch."""
+        with self._lock:
+            for name in names:
+                if name not in self.loggers:
+                    raise KeyError(name)
+            if not names:
+                return
+
+            # NOTE: the final report is emitted while loggers remain attached.
+            reporter: Union[Reporter, None] = self._reporter
+            if reporter is not None and (
+                reporter.log.name in names
+                or not set(self.loggers).difference(names, (reporter.log.name,))
             ):
-                handler.stream.close()
-
-        log.handlers.clear()
+                self._stop_reporter()
+
+            logs: List[logging.Logger] = []
+            for name in names:
+                logging.Logger.manager.loggerDict.pop(name, None)
+                log: logging.Logger = self.loggers.pop(name)
+                self._release(log)
+                if self._parent is not None and log.parent is self._parent:
+                    log.parent = logging.root
+                logs.append(log)
+            self._unindex(names)
+
+            if self._listener is not None:
+                self.flush()
+                if not self.loggers:
+                    self._listener.stop()
+
+            shared: List[logging.Handler] = [self.stream, self._handler, *self._extras]
+            for handler in shared:
+                _flush(handler)
+
+            for log in logs:
+                for handler in log.handlers:
+                    if any(handler is h for h in shared):
+                        continue
+                    _flush(handler)
+                    handler.close()
+
+                    # NOTE: StreamHandler does not actually close the stream to prevent
+                    #       closing the default stderr stream.
+                    if (
+                        hasattr(handler, "stream")
+                        and not handler.stream.closed
+                        and handler.stream not in PROTECTED_STREAMS
+                    ):
+                        handler.stream.close()
+
+                log.handlers.clear()
+
+    def _unindex(self, names: List[str]) -> None:
+        """Remove names from the sorted index of managed logger names."""
+        index: List[str] = self._names
+        if len(names) == 1:
+            del index[bisect.bisect_left(index, names[0])]
+        else:
+            removed = set(names)
+            index[:] = [n for n in index if n not in removed]
+
+    def _ship(self, records: Any) -> None:
+        """Redirect managed loggers to ship records to the collector of a parent."""
+        # NOTE: Threads of a forked parent do not exist within this process.
+        with self._lock:
+            for listener in (self._listener, self._collector):
+                if listener is not None:
+                    atexit.unregister(listener.stop)
+            self._listener = None
+            self._collector = None
+
+            handler = ShippingHandler(records)
+            handler.setLevel(self.level)
+            handler.setFormatter(self.formatter)
+            for log in self._targets():
+                log.addHandler(handler)
+                log.removeHandler(self._handler)
+            self._stream = self._handler = handler
+
+    def _prepare(self, log: logging.Logger) -> None:
+        """Apply per logger overrides of managed loggers."""
+        apply_caller_policy(log, self.caller)
+        apply_record_factory(log, self._factory)
+        apply_limit(log, match_limit(log.name, self._limits))
+        apply_coalescer(log, self._coalesce)
+        apply_lazy(log, self._lazy)
+        apply_counter(log, self._reporter.counter if self._reporter else None)
+
+    def _release(self, log: logging.Logger) -> None:
+        """Restore per logger overrides of removed loggers."""
+        apply_caller_policy(log, CALLER_FULL)
+        apply_record_factory(log, None)
+        apply_limit(log, None)
+        apply_coalescer(log, None)
+        apply_lazy(log, False)
+        apply_counter(log, None)
 
     def dispatch(self, name: str) -> logging.Logger:
         """Dispatch a new logger."""
@@ -215,12 +814,50 @@ class EpiLog:
 
     def get_logger(self, name: str) -> logging.Logger:
         """Initialize a new logger."""
-        if name in self:
-            return self[name]
-
-        log: logging.Logger = logging.getLogger(name)
-        log.setLevel(self.level)
-        log.addHandler(self.stream)
-        self.loggers[name] = log
-
-        return log
+        # NOTE: (atomic) lookup of an existing logger is lock free. Loggers are only
+        #       registered once fully prepared.
+        log: Union[logging.Logger, None] = self.loggers.get(name)
+        if log is not None:
+            return log
+
+        with self._lock:
+            log = self.loggers.get(name)
+            if log is not None:
+                return log
+
+            log = logging.getLogger(name)
+            if self._parent is not None:
+                # NOTE: setLevel clears the level cache of every registered logger,
+                #       so is avoided for (the usual case of) a new logger.
+                if log.level != logging.NOTSET:
+                    log.setLevel(logging.NOTSET)
+                log.parent = self._parent
+                log._cache.clear()  # type: ignore[attr-defined]
+            else:
+                log.setLevel(self._logger_level())
+                log.addHandler(self._handler)
+                for handler in self._extras:
+                    log.addHandler(handler)
+            self._prepare(log)
+            bisect.insort(self._names, name)
+            self.loggers[name] = log
+            self._advance()
+
+            if self._listener is not None and not self._listener.running:
+                self._listener.start()
+                # NOTE: exit functions are called in reverse order of registration,
+                #       so pending summaries are emitted ahead of stopping listeners.
+                atexit.unregister(_summarize_all)
+                atexit.register(_summarize_all)
+
+            return log
+
+
+def _summarize_all() -> None:
+    """Emit summaries pending on the filters of every manager."""
+    for manager in list(MANAGERS):
+        if isinstance(manager, EpiLog):
+            manager.summarize()
+
+
+atexit.register(_summarize_all)
@@ -0,0 +1,378 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Registry of counters and histograms, exported in the OpenMetrics text format."""
+
+from __future__ import annotations
+
+import bisect
+import os
+import re
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .shards import Shards
+
+
+Labels = Tuple[Tuple[str, str], ...]
+CONTENT_TYPE: str = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Upper bounds (ns) of histogram buckets, 1-2.5-5 per decade from 1 us to 10 s
+DEFAULT_BUCKETS: Tuple[int, ...] = (
+    *(int(m * 10**e) for e in range(3, 10) for m in (1, 2.5, 5)),
+    10**10,
+)
+
+_INVALID = re.compile(r"[^a-zA-Z0-9_]+")
+
+
+def metric_name(description: str) -> str:
+    """Sanitize a (BenchMark) description into a valid metric name."""
+    name: str = _INVALID.sub("_", description).strip("_").lower()
+    if not name or name[0].isdigit():
+        name = f"_{name}"
+    return name
+
+
+def _labels(labels: Optional[Dict[str, str]]) -> Labels:
+    if not labels:
+        return ()
+    for key in labels:
+        if not re.fullmatch(r"[a-zA-Z_][a-zA-Z0-9_]*", key):
+            raise ValueError(f"Unsupported Label Name: {key}")
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _render_labels(labels: Labels, extra: Labels = ()) -> str:
+    pairs: Labels = labels + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _fold(base: List[int], shard: List[int]) -> None:
+    for i, value in enumerate(shard):
+        base[i] += value
+
+
+class _Metric:
+    """Metric of per thread shards, each updated (lock free) by a single thread."""
+
+    kind: str = ""
+
+    def __init__(self, name: str, labels: Labels, size: int) -> None:
+        self.name = name
+        self.labels = labels
+        self._size = size
+        self._shards: Shards[List[int]] = Shards(lambda: [0] * size, _fold)
+
+    def _merged(self) -> List[int]:
+        totals: List[int] = [0] * self._size
+        with self._shards.lock:
+            for shard in self._shards.all():
+                _fold(totals, shard)
+        return totals
+
+
+class Counter(_Metric):
+    """Monotonic counter.
+
+    Args:
+        name (str): Metric (family) name.
+        labels (Labels): Sorted label name and value pairs.
+
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, labels: Labels = ()) -> None:
+        super().__init__(name, labels, 1)
+
+    def inc(self, amount: int = 1) -> None:
+        """Increment the counter by a (non-negative) amount."""
+        try:
+            shard: List[int] = self._shards.local.shard
+        except AttributeError:
+            shard = self._shards.create()
+        shard[0] += amount
+
+    add = inc
+
+    @property
+    def value(self) -> int:
+        """Total of increments, across threads."""
+        return self._merged()[0]
+
+    def samples(self) -> List[str]:
+        """OpenMetrics sample lines."""
+        return [f"{self.name}_total{_render_labels(self.labels)} {self.value}"]
+
+
+class Histogram(_Metric):
+    """Histogram of (nanosecond) durations, rendered in seconds.
+
+    Implements the `Aggregate` protocol (see `EpiLog.stats`), so a BenchMark may
+    report into it directly with `aggregate=histogram`.
+
+    Args:
+        name (str): Metric (family) name, excluding the unit suffix.
+        labels (Labels): Sorted label name and value pairs.
+        buckets (Sequence[int]): Ascending upper bounds of buckets, in ns.
+
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        labels: Labels = (),
+        buckets: Sequence[int] = DEFAULT_BUCKETS,
+    ) -> None:
+        if list(buckets) != sorted(set(buckets)) or not buckets:
+            raise ValueError(f"Unsupported Histogram Buckets: {buckets}")
+        self.buckets: Tuple[int, ...] = tuple(buckets)
+        # count, sum, per bucket counts (and an overflow bucket)
+        super().__init__(name, labels, len(self.buckets) + 3)
+
+    def add(self, value: int) -> None:
+        """Observe a duration, in ns."""
+        try:
+            shard: List[int] = self._shards.local.shard
+        except AttributeError:
+            shard = self._shards.create()
+        shard[0] += 1
+        shard[1] += value
+        shard[2 + bisect.bisect_left(self.buckets, value)] += 1
+
+    observe = add
+
+    @property
+    def count(self) -> int:
+        """Number of observations, across threads."""
+        return self._merged()[0]
+
+    def samples(self) -> List[str]:
+        """OpenMetrics sample lines (cumulative buckets, count and sum)."""
+        totals: List[int] = self._merged()
+        name: str = f"{self.name}_seconds"
+        lines: List[str] = []
+        cumulative: int = 0
+        for bound, n in zip(self.buckets, totals[2:]):
+            cumulative += n
+            le: Labels = (("le", repr(bound / 1e9)),)
+            lines.append(f"{name}_bucket{_render_labels(self.labels, le)} {cumulative}")
+        inf: Labels = (("le", "+Inf"),)
+        lines.append(f"{name}_bucket{_render_labels(self.labels, inf)} {totals[0]}")
+        lines.append(f"{name}_count{_render_labels(self.labels)} {totals[0]}")
+        lines.append(f"{name}_sum{_render_labels(self.labels)} {totals[1] / 1e9!r}")
+        return lines
+
+
+Metric = Union[Counter, Histogram]
+
+
+class MetricsRegistry:
+    """Counters and histograms, keyed by name (or BenchMark description) and labels.
+
+    Examples:
+        ```python
+        registry = MetricsRegistry()
+        latency = registry.histogram("Handle request", {"route": "/items"})
+        with BenchMark(log, "Handle request", aggregate=latency):
+            ...
+        registry.write("metrics.prom")
+        ```
+
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[Tuple[str, Labels], Metric] = {}
+        self._kinds: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, kind: type, name: str, labels: Labels, *args: Any) -> Any:
+        metric: Optional[Metric] = self._metrics.get((name, labels))
+        if metric is not None and isinstance(metric, kind):
+            return metric
+
+        with self._lock:
+            if self._kinds.setdefault(name, kind.kind) != kind.kind:  # type: ignore[attr-defined]
+                raise ValueError(f"Metric {name} is a {self._kinds[name]}.")
+            metric = self._metrics.get((name, labels))
+            if metric is None:
+                metric = self._metrics[(name, labels)] = kind(name, labels, *args)
+        return metric
+
+    def counter(self, name: str, labels: Optional[Dict[str, str]] = None) -> Counter:
+        """Retrieve (or register) a counter.
+
+        Raises:
+            ValueError: if name is registered as another kind, or labels are invalid.
+
+        """
+        return self._get(Counter, metric_name(name), _labels(labels))  # type: ignore[no-any-return]
+
+    def histogram(
+        self,
+        name: str,
+        labels: Optional[Dict[str, str]] = None,
+        buckets: Sequence[int] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Retrieve (or register) a histogram of durations (ns).
+
+        Raises:
+            ValueError: if name is registered as another kind, or labels are invalid.
+
+        """
+        return self._get(  # type: ignore[no-any-return]
+            Histogram, metric_name(name), _labels(labels), buckets
+        )
+
+    def render(self) -> str:
+        """Render all metrics in the OpenMetrics text format."""
+        with self._lock:
+            metrics: List[Metric] = sorted(
+                self._metrics.values(), key=lambda m: (m.name, m.labels)
+            )
+
+        lines: List[str] = []
+        family: Optional[str] = None
+        for metric in metrics:
+            if metric.name != family:
+                family = metric.name
+                if isinstance(metric, Histogram):
+                    lines.append(f"# TYPE {family}_seconds histogram")
+                    lines.append(f"# UNIT {family}_seconds seconds")
+                else:
+                    lines.append(f"# TYPE {family} counter")
+            lines.extend(metric.samples())
+        lines.append("# EOF")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Union[str, os.PathLike[str]]) -> None:
+        """Write rendered metrics to a file, atomically replacing any previous."""
+        path = os.fspath(path)
+        text: str = self.render()
+        fd, temporary = tempfile.mkstemp(
+            prefix=".metrics-", dir=os.path.dirname(os.path.abspath(path))
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def schedule(
+        self, path: Union[str, os.PathLike[str]], interval: float = 15.0
+    ) -> ScheduledWriter:
+        """Start writing rendered metrics to a file, every interval seconds."""
+        writer = ScheduledWriter(self, path, interval)
+        writer.start()
+        return writer
+
+    def serve(self, port: int = 0, host: str = "127.0.0.1") -> MetricsServer:
+        """Serve rendered metrics over HTTP, at `/metrics` (of localhost by default)."""
+        server = MetricsServer(self, port, host)
+        server.start()
+        return server
+
+
+class ScheduledWriter(threading.Thread):
+    """Daemon thread writing metrics of a registry to a file, at an interval."""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        path: Union[str, os.PathLike[str]],
+        interval: float,
+    ) -> None:
+        super().__init__(name="EpiLog.metrics.writer", daemon=True)
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.registry.write(self.path)
+
+    def stop(self) -> None:
+        """Stop writing, after a final write."""
+        self._stopped.set()
+        if self.is_alive():
+            self.join()
+        self.registry.write(self.path)
+
+
+class MetricsServer:
+    """Minimal HTTP endpoint serving metrics of a registry, from a daemon thread."""
+
+    def __init__(self, registry: MetricsRegistry, port: int, host: str) -> None:
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body: bytes = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None: ...
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="EpiLog.metrics.server",
+            daemon=True,
+        )
+
+    @property
+    def url(self) -> str:
+        """URL of the metrics endpoint."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}/metrics"
+
+    def start(self) -> None:
+        """Start serving requests."""
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop serving requests, and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+REGISTRY = MetricsRegistry()
@@ -0,0 +1,186 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Aggregate records of worker processes, written by a collector of the parent."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import multiprocessing
+import threading
+import weakref
+from multiprocessing.context import BaseContext
+from typing import Any, Dict, Iterator, Optional, Protocol
+
+from .handlers import QueueListener
+
+
+# Attributes of a record, all None until rebuilt from shipped (non None) values.
+_TEMPLATE: Dict[str, Any] = dict.fromkeys(vars(logging.makeLogRecord({})))
+_EXCEPTIONS = logging.Formatter()
+
+
+class Shippable(Protocol):
+    """Manager whose loggers may be redirected to ship records to a collector."""
+
+    def _ship(self, records: Any) -> None: ...
+
+
+MANAGERS: weakref.WeakSet[Shippable] = weakref.WeakSet()
+"""Managers of this process, redirected by `init_worker`."""
+
+# Queue of the parent collector, once this process is initialized as a worker.
+_WORKER: Dict[str, Any] = {}
+
+
+def worker_queue() -> Optional[Any]:
+    """Queue of the parent collector, if this process was initialized as a worker."""
+    return _WORKER.get("records")
+
+
+def init_worker(records: Any) -> None:
+    """Initialize a worker process, shipping records of EpiLog loggers to a parent.
+
+    Managers inherited by a forked worker are redirected, as is every manager
+    constructed afterwards (e.g. on import of a module by a spawned worker).
+
+    Args:
+        records (multiprocessing.Queue): Queue of the parent collector (see
+            `EpiLog.worker_args`).
+
+    Examples:
+        ```python
+        manager = EpiLog(stream=logging.FileHandler("app.log"), collect=True)
+        with ProcessPoolExecutor(
+            initializer=init_worker, initargs=manager.worker_args
+        ) as pool:
+            ...
+        ```
+
+    """
+    _WORKER["records"] = records
+    for manager in list(MANAGERS):
+        manager._ship(records)
+
+
+def ship(record: logging.LogRecord) -> Dict[str, Any]:
+    """Reduce a record to a (picklable) dictionary of its non None attributes.
+
+    Arguments are merged into the message, and exception information is rendered
+    as text, so neither needs to be picklable. The parent formats the record.
+
+    """
+    data: Dict[str, Any] = {k: v for k, v in vars(record).items() if v is not None}
+    data["msg"] = record.getMessage()
+    data.pop("args", None)
+    data.pop("message", None)
+    if record.exc_info:
+        data["exc_text"] = record.exc_text or _EXCEPTIONS.formatException(
+            record.exc_info
+        )
+        del data["exc_info"]
+
+    return data
+
+
+def rebuild(data: Dict[str, Any]) -> logging.LogRecord:
+    """Reconstruct a record from a shipped dictionary, without computing defaults."""
+    record: logging.LogRecord = logging.LogRecord.__new__(logging.LogRecord)
+    record.__dict__.update(_TEMPLATE)
+    record.__dict__.update(data)
+    return record
+
+
+class ShippingHandler(logging.Handler):
+    """Worker side Handler, placing shipped records onto the queue of a collector.
+
+    Args:
+        records (multiprocessing.Queue): Queue of the parent collector.
+
+    Notes:
+        * Records are pickled by the feeder thread of the queue, off the logging
+            thread. Values of `extra` must be picklable.
+
+    """
+
+    records: Any
+
+    def __init__(self, records: Any) -> None:
+        super().__init__()
+        self.records = records
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Ship a record to the collector."""
+        try:
+            self.records.put_nowait(ship(record))
+        except Exception:
+            self.handleError(record)
+
+
+class Collector(QueueListener):
+    """Parent side listener, writing records shipped by worker processes.
+
+    Records of each worker are written in the order they were logged, and records
+    of distinct workers in the order they arrive.
+
+    Args:
+        handlers (logging.Handler): Destination handlers.
+        context (BaseContext | None): Multiprocessing context of the record queue.
+
+    Notes:
+        * `flush` waits on records which have arrived. Records of a worker are
+            guaranteed to have arrived once that worker process has exited.
+
+    """
+
+    def __init__(
+        self,
+        *handlers: logging.Handler,
+        context: Optional[BaseContext] = None,
+    ) -> None:
+        ctx: Any = context or multiprocessing.get_context()
+        super().__init__(ctx.Queue(), *handlers)
+        self._tokens: Iterator[int] = itertools.count()
+        self._waiting: Dict[int, threading.Event] = {}
+
+    def prepare(self, record: Any) -> logging.LogRecord:
+        """Reconstruct a shipped record."""
+        return rebuild(record)
+
+    def handle(self, record: Any) -> None:
+        """Handle a shipped record, or release a pending flush (integer token)."""
+        if isinstance(record, int):
+            event: Optional[threading.Event] = self._waiting.pop(record, None)
+            if event is not None:
+                event.set()
+            return
+        super().handle(record)
+
+    def flush(self) -> None:
+        """Block until records which have arrived are written, then flush handlers."""
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            token: int = next(self._tokens)
+            event = self._waiting[token] = threading.Event()
+            self.records.put(token)
+            event.wait()
+        self._flush_handlers()
@@ -0,0 +1,248 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Flight recorder, retaining recent records within a memory mapped ring buffer."""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+import sys
+from typing import IO, Any, List, Optional, Union
+
+
+MAGIC: bytes = b"EPIRING1"
+# magic, capacity of ring, write offset within ring, ring has wrapped
+HEADER = struct.Struct("<8sQQQ")
+SEPARATOR: bytes = b"\x1e"  # Record separator, preceding each entry
+
+Target = Union[str, "os.PathLike[str]", IO[str], logging.StreamHandler, None]  # type: ignore[type-arg]
+
+
+class FlightRecorder(logging.Handler):
+    """Handler retaining the most recent formatted records in a fixed size ring.
+
+    The ring is a memory mapped file, so records are written without file I/O
+    (or memory growth) per record, and survive a crash of the process. The ring
+    is dumped (and cleared) once a record at or above the trigger level arrives,
+    or on demand with `dump`. Recover the ring of a crashed process with `read`.
+
+    Args:
+        filename (str | os.PathLike): Path of ring buffer file. An existing ring
+            of equal size is continued, retaining its records until overwritten.
+        size (int): Capacity of ring, in bytes.
+        level (int): Logging level of retained records.
+        trigger (int | None): Dump the ring once a record at or above this level
+            arrives, or None to dump only on demand.
+        target (str | os.PathLike | IO | logging.StreamHandler | None): Where the
+            ring is dumped: a file path (appended), text stream, or the stream of a
+            handler (e.g. the `EpiLog.stream`). Defaults to standard error.
+
+    Examples:
+        ```python
+        manager = EpiLog(logging.INFO, stream=logging.FileHandler("app.log"))
+        recorder = FlightRecorder("app.ring", 4 << 20, target=manager.stream)
+        manager.attach(recorder)  # DEBUG records are retained, not written
+        ```
+
+    """
+
+    filename: str
+    size: int
+    trigger: Optional[int]
+    target: Target
+
+    def __init__(
+        self,
+        filename: Union[str, os.PathLike[str]],
+        size: int = 4 << 20,
+        level: int = logging.DEBUG,
+        trigger: Optional[int] = logging.ERROR,
+        target: Target = None,
+    ) -> None:
+        if size <= len(SEPARATOR):
+            raise ValueError(f"Unsupported Flight Recorder Size: {size}")
+
+        super().__init__(level)
+        self.filename = os.path.abspath(os.fspath(filename))
+        self.size = size
+        self.trigger = trigger
+        self.target = target
+
+        total: int = HEADER.size + size
+        self._file: Optional[IO[bytes]] = open(
+            self.filename, "r+b" if os.path.exists(self.filename) else "w+b"
+        )
+        if os.fstat(self._file.fileno()).st_size != total:
+            self._file.truncate(total)
+        self._map: Optional[mmap.mmap] = mmap.mmap(self._file.fileno(), total)
+
+        magic, capacity, offset, wrapped = HEADER.unpack_from(self._map)
+        if magic != MAGIC or capacity != size or offset >= size:
+            offset, wrapped = 0, 0
+            HEADER.pack_into(self._map, 0, MAGIC, size, offset, wrapped)
+        self._offset: int = offset
+        self._wrapped: bool = bool(wrapped)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a formatted record into the ring, dumping it on a trigger."""
+        try:
+            self.write(self.format(record))
+            if self.trigger is not None and record.levelno >= self.trigger:
+                self._dump(self.target)
+        except RecursionError:  # pragma: no cover
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def write(self, text: str) -> None:
+        """Write an entry into the ring, overwriting the oldest entries."""
+        ring: Optional[mmap.mmap] = self._map
+        if ring is None:
+            return
+
+        data: bytes = SEPARATOR + text.replace("\x1e", " ").encode("utf-8", "replace")
+        if len(data) > self.size:
+            data = data[len(data) - self.size :]
+            data = SEPARATOR + data[len(SEPARATOR) :]
+
+        start: int = HEADER.size + self._offset
+        first: int = min(len(data), self.size - self._offset)
+        ring[start : start + first] = data[:first]
+        if first < len(data):
+            rest: int = len(data) - first
+            ring[HEADER.size : HEADER.size + rest] = data[first:]
+            self._offset = rest
+            self._wrapped = True
+        else:
+            self._offset += first
+            if self._offset == self.size:
+                self._offset = 0
+                self._wrapped = True
+
+        HEADER.pack_into(ring, 0, MAGIC, self.size, self._offset, self._wrapped)
+
+    def entries(self) -> List[str]:
+        """Retained entries, from oldest to newest."""
+        if self._map is None:
+            return []
+        return _entries(
+            self._map[HEADER.size : HEADER.size + self.size],
+            self._offset,
+            self._wrapped,
+        )
+
+    def clear(self) -> None:
+        """Discard retained entries."""
+        self._offset, self._wrapped = 0, False
+        if self._map is not None:
+            HEADER.pack_into(self._map, 0, MAGIC, self.size, 0, 0)
+
+    def dump(self, target: Target = None) -> int:
+        """Write retained entries to a target (defaults to `target`), and clear.
+
+        Returns:
+            (int): number of entries written.
+
+        """
+        with self.lock:  # type: ignore[union-attr]
+            return self._dump(target or self.target)
+
+    def _dump(self, target: Target) -> int:
+        entries: List[str] = self.entries()
+        if entries:
+            _write(target, entries, self.filename)
+        self.clear()
+        return len(entries)
+
+    @staticmethod
+    def read(filename: Union[str, os.PathLike[str]]) -> List[str]:
+        """Recover retained entries of a ring buffer file, e.g. after a crash.
+
+        Raises:
+            ValueError: if file is not a flight recorder ring buffer.
+
+        """
+        with open(filename, "rb") as f:
+            data: bytes = f.read()
+
+        if len(data) < HEADER.size:
+            raise ValueError(f"Not a Flight Recorder: {filename}")
+        magic, capacity, offset, wrapped = HEADER.unpack_from(data)
+        if magic != MAGIC or len(data) < HEADER.size + capacity:
+            raise ValueError(f"Not a Flight Recorder: {filename}")
+
+        return _entries(
+            data[HEADER.size : HEADER.size + capacity], offset, bool(wrapped)
+        )
+
+    def flush(self) -> None:
+        """Schedule modified pages of the ring to be written to file."""
+        with self.lock:  # type: ignore[union-attr]
+            if self._map is not None:
+                self._map.flush()
+
+    def close(self) -> None:
+        """Flush, and unmap the ring."""
+        with self.lock:  # type: ignore[union-attr]
+            if self._map is not None:
+                self._map.flush()
+                self._map.close()
+                self._map = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        super().close()
+
+
+def _entries(ring: bytes, offset: int, wrapped: bool) -> List[str]:
+    """Split ordered ring contents into entries, skipping a partial oldest entry."""
+    if wrapped:
+        ordered: bytes = ring[offset:] + ring[:offset]
+        # NOTE: the oldest entry may be partially overwritten
+        start: int = ordered.find(SEPARATOR)
+        ordered = ordered[start:] if start >= 0 else b""
+    else:
+        ordered = ring[:offset]
+
+    return [
+        entry.decode("utf-8", "replace") for entry in ordered.split(SEPARATOR) if entry
+    ]
+
+
+def _write(target: Target, entries: List[str], name: str) -> None:
+    header: str = f"--- flight recorder {name}: {len(entries)} records ---\n"
+    footer: str = "--- end of flight recorder ---\n"
+    text: str = header + "\n".join(entries) + "\n" + footer
+
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "a", encoding="utf-8") as f:
+            f.write(text)
+    elif isinstance(target, logging.StreamHandler):
+        with target.lock:  # type: ignore[union-attr]
+            target.stream.write(text)
+            target.flush()
+    else:
+        stream: Any = target if target is not None else sys.stderr
+        stream.write(text)
+        stream.flush()
@@ -0,0 +1,258 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Format aware LogRecord factory, populating only referenced record attributes."""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections.abc import Mapping
+from types import TracebackType
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Set, Tuple, Type, Union
+
+
+ExcInfo = Union[
+    Tuple[Type[BaseException], BaseException, Optional[TracebackType]],
+    Tuple[None, None, None],
+    None,
+]
+
+# Record attributes which are costly to compute, and only populated on demand. Every
+# other attribute is always populated, so that records remain safe to format by any
+# handler they reach (e.g. those of the root logger through propagation).
+OPTIONAL_FIELDS: FrozenSet[str] = frozenset({"processName", "taskName"})
+_UNSET: Dict[str, None] = dict.fromkeys(OPTIONAL_FIELDS)
+# File name and module name, keyed by path name of the emitting source file.
+_SOURCES: Dict[str, Tuple[str, str]] = {}
+
+
+def _start_time() -> float:
+    """Time (in seconds since the epoch) the logging module was loaded."""
+    start: Union[int, float] = logging._startTime  # type: ignore[attr-defined]
+    # NOTE: Recorded by `time.time_ns` (rather than `time.time`) from python 3.13
+    return start / 1e9 if isinstance(start, int) else start
+
+
+START_TIME: float = _start_time()
+
+
+class SlimRecord(logging.LogRecord):
+    """LogRecord populating only inexpensive attributes on construction.
+
+    Optional attributes (see `OPTIONAL_FIELDS`) are computed by a `RecordFactory`
+    only when referenced by a formatter, and are otherwise None, as the logging
+    module does when e.g. `logging.logMultiprocessing` is disabled.
+
+    Notes:
+        * Records retain an instance `__dict__` (rather than `__slots__`), as
+            `logging.Formatter` styles format directly from it. Unreferenced
+            attributes are present (as None), and numeric attributes (`process`,
+            `thread`, `msecs`, ...) are always populated, so records remain safe
+            to format by other handlers, e.g. those of the root logger.
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        level: int,
+        pathname: str,
+        lineno: int,
+        msg: object,
+        args: Any,
+        exc_info: ExcInfo,
+        func: Optional[str] = None,
+        sinfo: Optional[str] = None,
+    ) -> None:
+        if args and len(args) == 1 and isinstance(args[0], Mapping) and args[0]:
+            args = args[0]
+
+        self.name = name
+        self.msg = msg
+        self.args = args
+        self.levelname = logging.getLevelName(level)
+        self.levelno = level
+        self.pathname = pathname
+        self.lineno = lineno
+        self.funcName = func  # type: ignore[assignment]
+        self.exc_info = exc_info
+        self.exc_text = None
+        self.stack_info = sinfo
+        self.created = created = time.time()
+        self.msecs = int((created - int(created)) * 1000) + 0.0
+        self.relativeCreated = (created - START_TIME) * 1000
+
+        source: Optional[Tuple[str, str]] = _SOURCES.get(pathname)
+        if source is None:
+            source = _SOURCES[pathname] = _source(pathname)
+        self.filename, self.module = source
+
+        if logging.logThreads:
+            self.thread = threading.get_ident()
+            self.threadName = threading.current_thread().name
+        else:
+            self.thread = self.threadName = None
+        self.process = os.getpid() if logging.logProcesses else None
+        self.__dict__.update(_UNSET)
+
+
+def record_fields(formatter: logging.Formatter) -> Optional[FrozenSet[str]]:
+    """Determine optional record attributes referenced by a formatter.
+
+    A formatter may declare the attributes it uses with a `record_fields`
+    attribute. Otherwise, fields are parsed from the format string of formatters
+    which do not override `format` or `formatMessage`.
+
+    Args:
+        formatter (logging.Formatter): formatter to inspect
+
+    Returns:
+        (FrozenSet[str] | None): referenced optional fields, or None when unknown.
+
+    """
+    declared: Optional[FrozenSet[str]] = getattr(formatter, "record_fields", None)
+    if declared is not None:
+        return frozenset(declared) & OPTIONAL_FIELDS
+
+    cls = type(formatter)
+    if (
+        cls.format is not logging.Formatter.format
+        or cls.formatMessage is not logging.Formatter.formatMessage
+    ):
+        return None
+
+    fmt: str = formatter._fmt or ""
+    return frozenset(f for f in OPTIONAL_FIELDS if re.search(rf"\b{f}\b", fmt))
+
+
+class RecordFactory:
+    """Logger `makeRecord` replacement, constructing a `SlimRecord`.
+
+    Args:
+        fields (FrozenSet[str]): optional record attributes to populate.
+
+    """
+
+    __slots__ = ("fields", "process_name", "task_name")
+
+    fields: FrozenSet[str]
+
+    def __init__(self, fields: FrozenSet[str] = frozenset()) -> None:
+        self.fields = frozenset(fields) & OPTIONAL_FIELDS
+        self.process_name: bool = (
+            "processName" in self.fields and logging.logMultiprocessing
+        )
+        self.task_name: bool = "taskName" in self.fields
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RecordFactory):
+            return NotImplemented
+        return (self.fields, self.process_name) == (other.fields, other.process_name)
+
+    def __hash__(self) -> int:
+        return hash((self.fields, self.process_name))
+
+    @classmethod
+    def from_formatter(cls, formatter: logging.Formatter) -> Optional[RecordFactory]:
+        """Construct a factory for a formatter, or None if fields are unknown."""
+        return cls.from_formatters((formatter,))
+
+    @classmethod
+    def from_formatters(
+        cls, formatters: Iterable[logging.Formatter]
+    ) -> Optional[RecordFactory]:
+        """Construct a factory for several formatters, or None if any are unknown."""
+        fields: Set[str] = set()
+        for formatter in formatters:
+            used: Optional[FrozenSet[str]] = record_fields(formatter)
+            if used is None:
+                return None
+            fields |= used
+        return cls(frozenset(fields))
+
+    def __call__(
+        self,
+        name: str,
+        level: int,
+        fn: str,
+        lno: int,
+        msg: object,
+        args: Any,
+        exc_info: ExcInfo,
+        func: Optional[str] = None,
+        extra: Optional[Mapping[str, object]] = None,
+        sinfo: Optional[str] = None,
+    ) -> logging.LogRecord:
+        rv = SlimRecord(name, level, fn, lno, msg, args, exc_info, func, sinfo)
+
+        if self.process_name:
+            rv.processName = _process_name()
+        if self.task_name:
+            rv.__dict__["taskName"] = _task_name()
+
+        if extra is not None:
+            for key in extra:
+                if key in ("message", "asctime") or key in rv.__dict__:
+                    raise KeyError(f"Attempt to overwrite {key!r} in LogRecord")
+                rv.__dict__[key] = extra[key]
+
+        return rv
+
+
+def _source(pathname: str) -> Tuple[str, str]:
+    try:
+        filename: str = os.path.basename(pathname)
+        return filename, os.path.splitext(filename)[0]
+    except (TypeError, ValueError, AttributeError):
+        return pathname, "Unknown module"
+
+
+def _process_name() -> Optional[str]:
+    mp = sys.modules.get("multiprocessing")
+    if mp is not None:
+        try:
+            return str(mp.current_process().name)
+        except Exception:  # pragma: no cover
+            ...
+    return "MainProcess"
+
+
+def _task_name() -> Optional[str]:
+    asyncio = sys.modules.get("asyncio")
+    if asyncio is not None:
+        try:
+            return str(asyncio.current_task().get_name())
+        except Exception:
+            ...
+    return None
+
+
+def apply_record_factory(log: logging.Logger, factory: Optional[RecordFactory]) -> None:
+    """Replace (or restore) the record construction of a logger instance."""
+    if factory is None:
+        vars(log).pop("makeRecord", None)
+    else:
+        vars(log)["makeRecord"] = factory
@@ -0,0 +1,234 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Background reporter, emitting periodic summaries and record counts per logger."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from time import monotonic
+from typing import Dict, List, Optional, Protocol
+
+from .shards import Shards
+from .stats import ACCUMULATORS
+
+
+class Source(Protocol):
+    """Summarized measurements, e.g. an `Accumulator` or a `SharedAccumulator`."""
+
+    def emit(
+        self, log: Optional[logging.Logger] = None, reset: bool = True
+    ) -> None: ...
+
+
+def _fold(base: Dict[str, int], shard: Dict[str, int]) -> None:
+    for name, count in list(shard.items()):
+        base[name] = base.get(name, 0) + count
+
+
+class RecordCounter(logging.Filter):
+    """Logger filter counting records (admitted by preceding filters) per logger.
+
+    Each thread counts into its own table, without a lock, folded once the thread
+    ends (see `EpiLog.shards`). A single instance may be shared by many loggers.
+
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._shards: Shards[Dict[str, int]] = Shards(dict, _fold)
+        self._baseline: Dict[str, int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Count a record, admitting it."""
+        try:
+            shard: Dict[str, int] = self._shards.local.shard
+        except AttributeError:
+            shard = self._shards.create()
+        shard[record.name] = shard.get(record.name, 0) + 1
+        return True
+
+    def snapshot(self, reset: bool = False) -> Dict[str, int]:
+        """Records counted per logger (since the last reset), sorted by name."""
+        with self._shards.lock:
+            totals: Dict[str, int] = {}
+            for shard in self._shards.all():
+                _fold(totals, shard)
+            baseline: Dict[str, int] = self._baseline
+            if reset:
+                self._baseline = totals
+
+        counts: Dict[str, int] = {}
+        for name in sorted(totals):
+            delta: int = totals[name] - baseline.get(name, 0)
+            if delta:
+                counts[name] = delta
+        return counts
+
+
+def get_counter(log: logging.Logger) -> Optional[RecordCounter]:
+    """Record counting filter of a logger, if any."""
+    for f in log.filters:
+        if isinstance(f, RecordCounter):
+            return f
+    return None
+
+
+def apply_counter(log: logging.Logger, counter: Optional[RecordCounter]) -> None:
+    """Replace (or remove) the record counting filter of a logger, after others."""
+    current: Optional[RecordCounter] = get_counter(log)
+    if current is not None:
+        log.removeFilter(current)
+    if counter is not None:
+        log.addFilter(counter)
+
+
+class Reporter:
+    """Daemon thread emitting summaries through a logger, once every interval.
+
+    Each report emits (and resets) a summary of every registered source, and of
+    every shared accumulator (see `EpiLog.stats.get_accumulator`), followed by a
+    single line of records counted per logger since the last report.
+
+    Reports are scheduled on absolute deadlines, such that time spent reporting
+    does not accumulate as drift. Deadlines missed by an overrunning report are
+    skipped, keeping the phase of the schedule.
+
+    Args:
+        log (logging.Logger): Logger through which summaries are emitted.
+        interval (float): Seconds between reports.
+        level (int): Logging level of the record counts line.
+        accumulators (bool): Report every shared accumulator, alongside sources.
+
+    Raises:
+        ValueError: if interval is not positive.
+
+    Attributes:
+        counter (RecordCounter): Filter counting records of managed loggers.
+        reports (int): Number of reports emitted.
+
+    """
+
+    log: logging.Logger
+    interval: float
+    level: int
+    accumulators: bool
+    counter: RecordCounter
+    reports: int
+
+    def __init__(
+        self,
+        log: logging.Logger,
+        interval: float = 60.0,
+        level: int = logging.INFO,
+        accumulators: bool = True,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError(f"Unsupported Report Interval: {interval}")
+
+        self.log = log
+        self.interval = interval
+        self.level = level
+        self.accumulators = accumulators
+        self.counter = RecordCounter()
+        self.reports = 0
+
+        self._sources: List[Source] = []
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Reporter thread is active."""
+        return self._thread is not None
+
+    @property
+    def sources(self) -> List[Source]:
+        """Registered sources, in order of registration."""
+        return list(self._sources)
+
+    def register(self, source: Source) -> None:
+        """Register a source, reported (and reset) once every interval."""
+        with self._lock:
+            if not any(s is source for s in self._sources):
+                self._sources.append(source)
+
+    def unregister(self, source: Source) -> None:
+        """Unregister a source, if registered."""
+        with self._lock:
+            self._sources = [s for s in self._sources if s is not source]
+
+    def report(self) -> None:
+        """Emit (and reset) summaries of sources, and record counts per logger."""
+        with self._lock:
+            sources: List[Source] = list(self._sources)
+        if self.accumulators:
+            sources.extend(a for a in list(ACCUMULATORS.values()) if a not in sources)
+
+        for source in sources:
+            source.emit(self.log, reset=True)
+
+        counts: Dict[str, int] = self.counter.snapshot(reset=True)
+        counts.pop(self.log.name, None)
+        if counts:
+            self.log.log(
+                self.level,
+                "records: (%s)",
+                ", ".join(f"{name}={count}" for name, count in counts.items()),
+            )
+        self.reports += 1
+
+    def _run(self) -> None:
+        deadline: float = monotonic() + self.interval
+        while not self._stopped.wait(max(deadline - monotonic(), 0.0)):
+            self.report()
+            deadline += self.interval
+            now: float = monotonic()
+            if deadline <= now:
+                deadline += (now - deadline) // self.interval * self.interval
+                deadline += self.interval
+
+    def start(self) -> None:
+        """Start the reporter thread, and register it to be stopped at exit."""
+        if self.running:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="EpiLog.reporter", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self, report: bool = True) -> None:
+        """Stop the reporter thread, emitting a final report by default."""
+        thread: Optional[threading.Thread] = self._thread
+        if thread is None:
+            return
+        atexit.unregister(self.stop)
+        self._stopped.set()
+        if thread is not threading.current_thread():
+            thread.join()
+        self._thread = None
+        if report:
+            self.report()
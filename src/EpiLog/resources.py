@@ -0,0 +1,181 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Opt-in resource usage collectors of BenchMark (CPU time, memory, and rusage)."""
+
+from __future__ import annotations
+
+import threading
+import time
+import tracemalloc
+from typing import Any, List, Optional, Protocol, Sequence, Tuple
+
+from .units import BYTE_UNITS, NS_UNITS, Units
+
+
+# Python on Windows (and other non POSIX platforms) does not provide getrusage
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+# Label, value (in base units of its table), and unit table (or None for a count)
+Measurement = Tuple[str, int, Optional[Units]]
+
+
+class ResourceCollector(Protocol):
+    """Collector of resource usage over the duration of a BenchMark.
+
+    `start` returns the state of a single use, given back to `stop`, such that one
+    collector may be shared by many (nested, or concurrent) BenchMarks.
+
+    """
+
+    def start(self) -> Any: ...
+
+    def stop(self, state: Any) -> List[Measurement]: ...
+
+
+class CpuTime:
+    """CPU time (user and system) of the whole process."""
+
+    def start(self) -> int:
+        return time.process_time_ns()
+
+    def stop(self, state: int) -> List[Measurement]:
+        return [("cpu", time.process_time_ns() - state, NS_UNITS)]
+
+
+class ThreadTime:
+    """CPU time (user and system) of the current thread."""
+
+    def start(self) -> int:
+        return time.thread_time_ns()
+
+    def stop(self, state: int) -> List[Measurement]:
+        return [("thread_cpu", time.thread_time_ns() - state, NS_UNITS)]
+
+
+class Memory:
+    """Peak and net memory allocated by Python (traced with `tracemalloc`).
+
+    Tracing is started on first use (if not already tracing), and stopped once the
+    last use started by a collector ends. Tracing slows allocation considerably.
+
+    Notes:
+        * The peak is reset on start (Python >= 3.9), so overlapping uses observe
+            the peak since the latest start. On Python 3.8, the peak is that since
+            tracing started.
+
+    """
+
+    _lock = threading.Lock()
+    _active: int = 0
+    _started: bool = False
+
+    def start(self) -> int:
+        with Memory._lock:
+            if Memory._active == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                Memory._started = True
+            Memory._active += 1
+            reset_peak = getattr(tracemalloc, "reset_peak", None)
+            if reset_peak is not None:
+                reset_peak()
+            return tracemalloc.get_traced_memory()[0]
+
+    def stop(self, state: int) -> List[Measurement]:
+        current, peak = tracemalloc.get_traced_memory()
+        with Memory._lock:
+            Memory._active -= 1
+            if Memory._active == 0 and Memory._started:
+                tracemalloc.stop()
+                Memory._started = False
+
+        return [
+            ("peak", max(peak - state, 0), BYTE_UNITS),
+            ("net", current - state, BYTE_UNITS),
+        ]
+
+
+# Counters of getrusage reported, by label
+_RUSAGE: Tuple[Tuple[str, str], ...] = (
+    ("minflt", "ru_minflt"),
+    ("majflt", "ru_majflt"),
+    ("nvcsw", "ru_nvcsw"),
+    ("nivcsw", "ru_nivcsw"),
+    ("inblock", "ru_inblock"),
+    ("oublock", "ru_oublock"),
+)
+
+
+class Usage:
+    """Deltas of getrusage counters: page faults, context switches, and block I/O.
+
+    Args:
+        thread (bool): Counters of the calling thread (`RUSAGE_THREAD`, Linux only),
+            in place of the whole process.
+
+    Notes:
+        * Collects nothing where the `resource` module is unavailable (Windows).
+
+    """
+
+    __slots__ = ("who",)
+
+    who: Optional[int]
+
+    def __init__(self, thread: bool = False) -> None:
+        if resource is None:
+            self.who = None
+        elif thread:
+            self.who = getattr(resource, "RUSAGE_THREAD", resource.RUSAGE_SELF)
+        else:
+            self.who = resource.RUSAGE_SELF
+
+    def start(self) -> Any:
+        if self.who is None:
+            return None
+        return resource.getrusage(self.who)
+
+    def stop(self, state: Any) -> List[Measurement]:
+        if self.who is None or state is None:
+            return []
+
+        usage = resource.getrusage(self.who)
+        return [
+            (label, getattr(usage, field) - getattr(state, field), None)
+            for label, field in _RUSAGE
+        ]
+
+
+def describe(measurements: Sequence[Measurement]) -> List[str]:
+    """Describe measurements, with values converted to most relevant units."""
+    parts: List[str] = []
+    for label, value, units in measurements:
+        if units is None:
+            parts.append(f"{label}={value}")
+            continue
+        converted, unit = units.convert_units(abs(value))
+        sign: str = "-" if value < 0 else ""
+        parts.append(f"{label}={sign}{converted:.4f} {unit}")
+
+    return parts
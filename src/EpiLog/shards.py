@@ -0,0 +1,118 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Per thread shards of partial aggregates, folded once their thread ends."""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Callable, Dict, Generic, List, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class _Owner(Generic[T]):
+    """Thread local owner of a shard, folding it into the base once released."""
+
+    __slots__ = ("ref", "shard")
+
+    def __init__(self, ref: weakref.ref[Shards[T]], shard: T) -> None:
+        self.ref = ref
+        self.shard = shard
+
+    def __del__(self) -> None:
+        shards: Optional[Shards[T]] = self.ref()
+        if shards is not None:
+            shards._fold(self.shard)
+
+
+class Shards(Generic[T]):
+    """Per thread shards of a partial aggregate, each updated by a single thread.
+
+    A thread creates its shard on first use. Once the thread ends, its shard is
+    folded into a base shard, so that retained shards are bounded by the number
+    of live threads rather than of every thread ever started.
+
+    Args:
+        factory (Callable[[], T]): Constructs an empty shard.
+        fold (Callable[[T, T], None]): Merges a shard (second) into the base shard.
+
+    Notes:
+        * Hot paths may read the shard of the current thread directly from `local`
+            (as `local.shard`), creating it on AttributeError (see `get`).
+        * Readers merge `all` shards while holding `lock`, which excludes folding,
+            so that a shard is never counted both live and within the base.
+
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "_factory",
+        "_fold_into",
+        "_live",
+        "base",
+        "local",
+        "lock",
+    )
+
+    base: T
+    local: threading.local
+    lock: threading.Lock
+
+    def __init__(self, factory: Callable[[], T], fold: Callable[[T, T], None]) -> None:
+        self._factory = factory
+        self._fold_into = fold
+        self.local = threading.local()
+        self._live: Dict[int, T] = {}
+        self.lock = threading.Lock()
+        self.base = factory()
+
+    def __len__(self) -> int:
+        """Number of shards of live threads."""
+        return len(self._live)
+
+    def get(self) -> T:
+        """Shard of the current thread."""
+        try:
+            return self.local.shard  # type: ignore[no-any-return]
+        except AttributeError:
+            return self.create()
+
+    def create(self) -> T:
+        """Create (and register) the shard of the current thread."""
+        shard: T = self._factory()
+        with self.lock:
+            # NOTE: keyed by identity, as (e.g. list) shards may compare equal.
+            self._live[id(shard)] = shard
+        self.local.shard = shard
+        self.local.owner = _Owner(weakref.ref(self), shard)
+        return shard
+
+    def _fold(self, shard: T) -> None:
+        with self.lock:
+            if self._live.pop(id(shard), None) is not None:
+                self._fold_into(self.base, shard)
+
+    def all(self) -> List[T]:
+        """Base shard and shards of live threads (to be read holding `lock`)."""
+        return [self.base, *self._live.values()]
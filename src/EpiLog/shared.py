@@ -0,0 +1,301 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Aggregate statistics of measurements across processes, in shared memory."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+import weakref
+from multiprocessing import shared_memory
+from multiprocessing.context import BaseContext
+from time import monotonic
+from typing import Any, List, Optional, Tuple
+
+from .stats import NBUCKETS, Summary, bucket_bounds, bucket_index, percentile
+from .units import NS_UNITS, Units
+
+
+# Fixed layout: a row of int64 per slot (process), of fields followed by the
+# histogram buckets of `EpiLog.stats`. Squares are stored as a float64.
+PID, COUNT, TOTAL, MINIMUM, MAXIMUM, SQUARES = range(6)
+FIELDS: int = 6
+ROW: int = FIELDS + NBUCKETS
+WORD: int = 8
+
+# count, total, squares, buckets
+_Totals = Tuple[int, int, float, List[int]]
+
+# Accumulators of this process, whose rows are released in a forked child.
+_INSTANCES: weakref.WeakSet[SharedAccumulator] = weakref.WeakSet()
+
+
+def _after_fork() -> None:
+    for acc in list(_INSTANCES):
+        acc._base = -1
+        acc._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+class SharedAccumulator:
+    """Aggregate of measurements added by many processes, read live by the parent.
+
+    Each process claims a row of a shared memory block on its first `add`, and is
+    the only writer of that row. Adding a measurement is therefore a handful of
+    writes to local memory, with no IPC nor cross process lock. The parent sums
+    rows on `snapshot`, and emits summaries through its own logger.
+
+    An accumulator is shared with workers by pickling it while spawning them, e.g.
+    through the `initargs` of a pool initializer, or the arguments of a Process.
+
+    Args:
+        key (str): Name identifying aggregated measurements.
+        log (logging.Logger | None): Logger through which summaries are emitted.
+        level (int): Logging level of emitted summaries.
+        slots (int): Maximum number of processes adding measurements.
+        units (Units): Unit table used to describe measurements.
+        context (BaseContext | None): Multiprocessing context of the slot lock.
+
+    Raises:
+        ValueError: if slots is not positive.
+
+    Notes:
+        * A row is read while its process may be writing it, so a live snapshot
+            may be off by the measurements in flight.
+        * Reset leaves rows untouched (the parent never writes them): later
+            snapshots report the difference from the reset, with minimum and
+            maximum estimated from histogram buckets.
+        * Rows of exited processes are retained, and not reused.
+
+    Examples:
+        ```python
+        acc = SharedAccumulator("task", log)
+        with ProcessPoolExecutor(initializer=init, initargs=(acc,)) as pool:
+            pool.map(work, items)  # with BenchMark(log, "task", aggregate=acc)
+        acc.emit()
+        acc.close()
+        ```
+
+    """
+
+    key: str
+    log: Optional[logging.Logger]
+    level: int
+    slots: int
+    units: Units
+
+    def __init__(
+        self,
+        key: str,
+        log: Optional[logging.Logger] = None,
+        level: int = logging.INFO,
+        slots: int = 64,
+        units: Units = NS_UNITS,
+        context: Optional[BaseContext] = None,
+    ) -> None:
+        if slots < 1:
+            raise ValueError(f"Unsupported Slot Count: {slots}")
+        ctx: Any = context or multiprocessing.get_context()
+        memory = shared_memory.SharedMemory(create=True, size=slots * ROW * WORD)
+        self._setup(key, log, level, slots, units, memory, ctx.Lock(), True)
+
+    def _setup(
+        self,
+        key: str,
+        log: Optional[logging.Logger],
+        level: int,
+        slots: int,
+        units: Units,
+        memory: shared_memory.SharedMemory,
+        lock: Any,
+        owner: bool,
+    ) -> None:
+        self.key = key
+        self.log = log
+        self.level = level
+        self.slots = slots
+        self.units = units
+
+        self._memory = memory
+        buffer: Any = memory.buf
+        self._ints: memoryview = buffer.cast("q")
+        self._floats: memoryview = buffer.cast("d")
+        self._claim_lock = lock
+        self._owner = owner
+        self._base: int = -1
+        self._lock = threading.Lock()
+        self._start: float = monotonic()
+        self._baseline: Optional[_Totals] = None
+        _INSTANCES.add(self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (
+            _attach,
+            (
+                self._memory.name,
+                self.key,
+                self.level,
+                self.slots,
+                self.units,
+                self._claim_lock,
+            ),
+        )
+
+    def _claim(self) -> None:
+        """Claim a free row for this process (once created, forked, or attached)."""
+        ints: memoryview = self._ints
+        pid: int = os.getpid()
+        with self._claim_lock:
+            for slot in range(self.slots):
+                if ints[slot * ROW + PID] == 0:
+                    ints[slot * ROW + PID] = pid
+                    break
+            else:
+                raise ValueError(f"Not enough slots of shared accumulator: {self.key}")
+
+        self._base = slot * ROW
+
+    def add(self, value: int) -> None:
+        """Add a measurement to the row of this process.
+
+        Raises:
+            ValueError: if every row is claimed by another process.
+
+        """
+        if self._base < 0:
+            self._claim()
+
+        ints: memoryview = self._ints
+        base: int = self._base
+        with self._lock:
+            if value < ints[base + MINIMUM] or ints[base + COUNT] == 0:
+                ints[base + MINIMUM] = value
+            if value > ints[base + MAXIMUM]:
+                ints[base + MAXIMUM] = value
+            ints[base + TOTAL] += value
+            self._floats[base + SQUARES] += float(value) * value  # type: ignore[call-overload]
+            ints[base + FIELDS + bucket_index(value)] += 1
+            ints[base + COUNT] += 1
+
+    def _totals(self) -> Tuple[_Totals, int, int]:
+        """Sum rows of all processes, and exact bounds of measurements."""
+        ints: memoryview = self._ints
+        floats: memoryview = self._floats
+        count: int = 0
+        total: int = 0
+        squares: float = 0.0
+        minimum: int = 0
+        maximum: int = 0
+        buckets: List[int] = [0] * NBUCKETS
+        for slot in range(self.slots):
+            base: int = slot * ROW
+            if ints[base + PID] == 0:
+                break
+            n: int = ints[base + COUNT]
+            if not n:
+                continue
+            low: int = ints[base + MINIMUM]
+            minimum = min(minimum, low) if count else low
+            maximum = max(maximum, ints[base + MAXIMUM])
+            count += n
+            total += ints[base + TOTAL]
+            squares += floats[base + SQUARES]
+            for i, b in enumerate(ints[base + FIELDS : base + ROW].tolist()):
+                buckets[i] += b
+
+        return (count, total, squares, buckets), minimum, maximum
+
+    def snapshot(self, reset: bool = False) -> Summary:
+        """Sum rows into a summary of measurements, optionally resetting."""
+        with self._lock:
+            current, minimum, maximum = self._totals()
+            baseline: Optional[_Totals] = self._baseline
+            now: float = monotonic()
+            window: float = now - self._start
+            if reset:
+                self._start = now
+                self._baseline = current
+
+        count, total, squares, buckets = current
+        if baseline is not None and baseline[0]:
+            count -= baseline[0]
+            total -= baseline[1]
+            squares -= baseline[2]
+            buckets = [b - p for b, p in zip(buckets, baseline[3])]
+            filled: List[int] = [i for i, b in enumerate(buckets) if b > 0]
+            if filled:
+                minimum = max(minimum, bucket_bounds(filled[0])[0])
+                maximum = min(maximum, bucket_bounds(filled[-1])[1] - 1)
+
+        if count <= 0:
+            return Summary(window=window)
+
+        mean: float = total / count
+        return Summary(
+            count=count,
+            total=total,
+            minimum=minimum,
+            maximum=maximum,
+            mean=mean,
+            variance=max(squares / count - mean * mean, 0.0),
+            p50=percentile(buckets, count, 0.50, minimum, maximum),
+            p90=percentile(buckets, count, 0.90, minimum, maximum),
+            p99=percentile(buckets, count, 0.99, minimum, maximum),
+            window=window,
+        )
+
+    def emit(self, log: Optional[logging.Logger] = None, reset: bool = True) -> None:
+        """Emit a single summary line of accumulated measurements, if any."""
+        log = log or self.log
+        summary: Summary = self.snapshot(reset)
+        if log is None or summary.count == 0:
+            return
+
+        log.log(self.level, "%s: (%s)", self.key, summary.describe(self.units))
+
+    def close(self) -> None:
+        """Release shared memory of this process, freeing it from the creator."""
+        self._ints.release()
+        self._floats.release()
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+
+def _attach(
+    name: str,
+    key: str,
+    level: int,
+    slots: int,
+    units: Units,
+    lock: Any,
+) -> SharedAccumulator:
+    """Attach to the shared memory of an accumulator (unpickled by a worker)."""
+    acc: SharedAccumulator = SharedAccumulator.__new__(SharedAccumulator)
+    memory = shared_memory.SharedMemory(name=name)
+    acc._setup(key, None, level, slots, units, memory, lock, False)
+    return acc
@@ -0,0 +1,182 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Hierarchical timing trees of nested (BenchMark) spans, tracked by contextvars."""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .units import NS_UNITS, Units
+
+
+class Span:
+    """Timed node within a tree of nested spans.
+
+    A span registers itself as a child of its parent on construction. As child
+    spans of concurrent threads or asyncio tasks may overlap, child time may
+    exceed elapsed time of a parent, in which case self time is reported as zero.
+
+    Args:
+        name (str): Description of span.
+        parent (Span | None): Enclosing span, or None for the root of a tree.
+        start (int): Start time (nanoseconds, from `time.perf_counter_ns`).
+
+    Attributes:
+        children (List[Span]): Spans nested within this span, in order of entry.
+        end (int): End time (nanoseconds), or zero while the span is still open.
+
+    """
+
+    __slots__ = ("children", "end", "name", "parent", "start")
+
+    name: str
+    parent: Optional[Span]
+    start: int
+    end: int
+    children: List[Span]
+
+    def __init__(
+        self, name: str, parent: Optional[Span] = None, start: int = 0
+    ) -> None:
+        self.name = name
+        self.parent = parent
+        self.start = start
+        self.end = 0
+        self.children = []
+        if parent is not None:
+            # NOTE: list.append is atomic, children may be added from many threads
+            parent.children.append(self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, elapsed={self.elapsed})"
+
+    @property
+    def elapsed(self) -> int:
+        """Total duration of span (nanoseconds), zero while open."""
+        return self.end - self.start if self.end else 0
+
+    @property
+    def child_time(self) -> int:
+        """Total duration of (closed) child spans."""
+        return sum(child.elapsed for child in list(self.children))
+
+    @property
+    def self_time(self) -> int:
+        """Duration of span not spent within child spans."""
+        return max(self.elapsed - self.child_time, 0)
+
+    def walk(self, depth: int = 0) -> Iterator[Tuple[int, Span]]:
+        """Depth first iteration over (depth, span) pairs of tree."""
+        yield depth, self
+        for child in list(self.children):
+            yield from child.walk(depth + 1)
+
+    def report(self, units: Units = NS_UNITS, indent: str = "  ") -> str:
+        """Indented text report of tree, merging sibling spans sharing a name.
+
+        Examples:
+            ```
+            request: (12.0000 ms, self=1.0000 ms)
+              parse: (4.0000 ms, self=4.0000 ms)
+              query [x3]: (7.0000 ms, self=7.0000 ms)
+            ```
+
+        """
+        lines: List[str] = []
+        for depth, node in _merge([self])[0].walk():
+            total, unit = units.convert_units(node.elapsed)
+            own, own_unit = units.convert_units(node.self_time)
+            count: str = f" [x{node.count}]" if node.count > 1 else ""
+            lines.append(
+                f"{indent * depth}{node.name}{count}: "
+                f"({total:.4f} {unit}, self={own:.4f} {own_unit})"
+            )
+
+        return "\n".join(lines)
+
+    def collapsed(self) -> str:
+        """Collapsed stack text of tree, as read by flame graph tools.
+
+        Each line holds a semicolon separated stack of span names, followed by
+        the self time (nanoseconds) of that stack, e.g. `request;query 7000000`.
+
+        """
+        lines: List[str] = []
+        stack: List[str] = []
+        for depth, node in _merge([self])[0].walk():
+            del stack[depth:]
+            stack.append(_sanitize(node.name))
+            if node.self_time > 0:
+                lines.append(f"{';'.join(stack)} {node.self_time}")
+
+        return "\n".join(lines)
+
+
+class _Node:
+    """Sibling spans sharing a name, merged for reporting."""
+
+    __slots__ = ("children", "count", "elapsed", "name", "self_time")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.count: int = 0
+        self.elapsed: int = 0
+        self.self_time: int = 0
+        self.children: List[_Node] = []
+
+    def walk(self, depth: int = 0) -> Iterator[Tuple[int, _Node]]:
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+
+def _merge(spans: Iterable[Span]) -> List[_Node]:
+    nodes: Dict[str, _Node] = {}
+    grouped: Dict[str, List[Span]] = {}
+    for span in spans:
+        node: Optional[_Node] = nodes.get(span.name)
+        if node is None:
+            node = nodes[span.name] = _Node(span.name)
+            grouped[span.name] = []
+        node.count += 1
+        node.elapsed += span.elapsed
+        node.self_time += span.self_time
+        grouped[span.name].extend(span.children)
+
+    for name, node in nodes.items():
+        node.children = _merge(grouped[name])
+
+    return list(nodes.values())
+
+
+def _sanitize(name: str) -> str:
+    return name.replace(";", ":").replace("\n", " ")
+
+
+CURRENT_SPAN: ContextVar[Optional[Span]] = ContextVar("CURRENT_SPAN", default=None)
+"""Innermost open span of the current context (thread or asyncio task)."""
+
+
+def current_span() -> Optional[Span]:
+    """Innermost open span of the current context, if any."""
+    return CURRENT_SPAN.get()
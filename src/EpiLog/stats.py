@@ -0,0 +1,355 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Aggregate statistics of repeated (nanosecond) measurements."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from dataclasses import dataclass
+from time import monotonic
+from typing import Dict, List, Optional, Protocol, Sequence, Tuple
+
+from .shards import Shards
+from .units import NS_UNITS, Units
+
+
+# Log bucketed histogram: values below 8 have exact buckets, above which each power
+# of two is split into 4 linear sub buckets (relative error below 25%).
+SUB_BITS: int = 2
+NBUCKETS: int = 256
+
+
+def bucket_index(value: int) -> int:
+    """Histogram bucket index of a (non-negative, below 2**64) value."""
+    if value < 8:
+        return max(value, 0)
+    shift: int = value.bit_length() - SUB_BITS - 1
+    return (shift << SUB_BITS) + (value >> shift)
+
+
+def bucket_bounds(index: int) -> Tuple[int, int]:
+    """Inclusive lower, and exclusive upper bound of values within a bucket."""
+    if index < 8:
+        return index, index + 1
+    shift: int = (index >> SUB_BITS) - 1
+    mantissa: int = index - (shift << SUB_BITS)
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+def percentile(
+    buckets: Sequence[int],
+    count: int,
+    q: float,
+    minimum: int = 0,
+    maximum: Optional[int] = None,
+) -> float:
+    """Estimate a percentile (0 <= q <= 1) from histogram bucket counts.
+
+    The midpoint of the containing bucket is reported, clamped to observed bounds.
+
+    """
+    if count <= 0:
+        return 0.0
+
+    rank: float = q * count
+    cumulative: int = 0
+    index: int = 0
+    for index, n in enumerate(buckets):  # noqa: B007
+        cumulative += n
+        if n and cumulative >= rank:
+            break
+
+    lo, hi = bucket_bounds(index)
+    estimate: float = (lo + hi - 1) / 2
+    if maximum is not None:
+        estimate = min(estimate, maximum)
+    return max(estimate, minimum)
+
+
+_DESCRIBED: Tuple[Tuple[str, str], ...] = (
+    ("mean", "mean"),
+    ("std", "stdev"),
+    ("min", "minimum"),
+    ("max", "maximum"),
+    ("p50", "p50"),
+    ("p90", "p90"),
+    ("p99", "p99"),
+)
+
+
+@dataclass
+class Summary:
+    """Summary statistics of aggregated measurements.
+
+    Args:
+        count (int): number of measurements
+        total (int): sum of measurements
+        minimum (int): smallest measurement
+        maximum (int): largest measurement
+        mean (float): mean of measurements
+        variance (float): (population) variance of measurements
+        p50 (float): estimated median
+        p90 (float): estimated 90th percentile
+        p99 (float): estimated 99th percentile
+        window (float): seconds elapsed over which measurements were aggregated
+
+    """
+
+    count: int = 0
+    total: int = 0
+    minimum: int = 0
+    maximum: int = 0
+    mean: float = 0.0
+    variance: float = 0.0
+    p50: float = 0.0
+    p90: float = 0.0
+    p99: float = 0.0
+    window: float = 0.0
+
+    @property
+    def stdev(self) -> float:
+        """Standard Deviation of measurements."""
+        return float(self.variance**0.5)
+
+    @property
+    def rate(self) -> float:
+        """Number of measurements per second of window."""
+        return self.count / self.window if self.window > 0 else 0.0
+
+    def describe(self, units: Units = NS_UNITS) -> str:
+        """Describe summary, with values converted to most relevant units."""
+        parts: List[str] = [f"n={self.count}"]
+        for label, name in _DESCRIBED:
+            value, unit = units.convert_units(getattr(self, name))
+            parts.append(f"{label}={value:.4f} {unit}")
+        if self.window > 0:
+            parts.append(f"rate={self.rate:.2f}/s")
+
+        return ", ".join(parts)
+
+
+class Aggregate(Protocol):
+    """Destination of aggregated (nanosecond) measurements."""
+
+    def add(self, value: int) -> None: ...
+
+
+class _Shard:
+    """Per thread partial aggregate, guarded by an (uncontended) lock."""
+
+    __slots__ = (
+        "buckets",
+        "count",
+        "lock",
+        "m2",
+        "maximum",
+        "mean",
+        "minimum",
+        "total",
+    )
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.count: int = 0
+        self.total: int = 0
+        self.minimum: int = 0
+        self.maximum: int = 0
+        self.mean: float = 0.0
+        self.m2: float = 0.0
+        self.buckets: List[int] = [0] * NBUCKETS
+
+    def add(self, value: int) -> None:
+        with self.lock:
+            self.count += 1
+            self.total += value
+            if self.count == 1:
+                self.minimum = self.maximum = value
+            elif value < self.minimum:
+                self.minimum = value
+            elif value > self.maximum:
+                self.maximum = value
+
+            # Welford online update of mean and variance
+            delta: float = value - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (value - self.mean)
+            self.buckets[bucket_index(value)] += 1
+
+    def merge(self, other: _Shard) -> None:
+        """Combine measurements of another shard into this one."""
+        if not other.count:
+            return
+        # Chan et al. parallel combination of mean and variance
+        n: int = self.count + other.count
+        delta: float = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / n
+        self.mean += delta * other.count / n
+        self.minimum = min(self.minimum, other.minimum) if self.count else other.minimum
+        self.maximum = max(self.maximum, other.maximum)
+        self.count = n
+        self.total += other.total
+        for i, b in enumerate(other.buckets):
+            self.buckets[i] += b
+
+
+class Accumulator:
+    """Thread safe aggregate of measurements, emitting summaries through a logger.
+
+    Each thread accumulates into its own shard, such that the lock taken by `add`
+    is (nearly) always uncontended. Shards are merged by `snapshot`, and folded
+    once their thread ends (see `EpiLog.shards`).
+
+    Args:
+        key (str): Name identifying aggregated measurements.
+        log (logging.Logger | None): Logger through which summaries are emitted.
+        level (int): Logging level of emitted summaries.
+        interval (float | None): Emit (and reset) a summary from `add`, once this
+            many seconds have elapsed since the last summary.
+        units (Units): Unit table used to describe measurements.
+
+    Examples:
+        ```python
+        acc = Accumulator("query", log, interval=60)
+        for _ in range(100_000):
+            with BenchMark(log, "query", aggregate=acc):
+                perform_query(...)
+        acc.emit()
+        ```
+
+    """
+
+    key: str
+    log: Optional[logging.Logger]
+    level: int
+    interval: Optional[float]
+    units: Units
+
+    def __init__(
+        self,
+        key: str,
+        log: Optional[logging.Logger] = None,
+        level: int = logging.INFO,
+        interval: Optional[float] = None,
+        units: Units = NS_UNITS,
+    ) -> None:
+        self.key = key
+        self.log = log
+        self.level = level
+        self.interval = interval
+        self.units = units
+
+        self._shards: Shards[_Shard] = Shards(_Shard, _Shard.merge)
+        self._lock = threading.Lock()
+        self._start: float = monotonic()
+        self._next: float = self._start + interval if interval else float("inf")
+
+    def add(self, value: int) -> None:
+        """Add a measurement."""
+        try:
+            shard: _Shard = self._shards.local.shard
+        except AttributeError:
+            shard = self._shards.create()
+        shard.add(value)
+
+        if self.interval is not None and monotonic() >= self._next:
+            self.emit()
+
+    def snapshot(self, reset: bool = False) -> Summary:
+        """Merge shards into a summary of measurements, optionally resetting."""
+        with self._lock:
+            now: float = monotonic()
+            window: float = now - self._start
+            if reset:
+                self._start = now
+                if self.interval:
+                    self._next = now + self.interval
+
+        merged = _Shard()
+        with self._shards.lock:
+            for shard in self._shards.all():
+                with shard.lock:
+                    merged.merge(shard)
+                    if reset:
+                        shard.reset()
+
+        count: int = merged.count
+        minimum: int = merged.minimum
+        maximum: int = merged.maximum
+        buckets: List[int] = merged.buckets
+        return Summary(
+            count=count,
+            total=merged.total,
+            minimum=minimum,
+            maximum=maximum,
+            mean=merged.mean,
+            variance=merged.m2 / count if count else 0.0,
+            p50=percentile(buckets, count, 0.50, minimum, maximum),
+            p90=percentile(buckets, count, 0.90, minimum, maximum),
+            p99=percentile(buckets, count, 0.99, minimum, maximum),
+            window=window,
+        )
+
+    def emit(self, log: Optional[logging.Logger] = None, reset: bool = True) -> None:
+        """Emit a single summary line of accumulated measurements, if any."""
+        log = log or self.log
+        summary: Summary = self.snapshot(reset)
+        if log is None or summary.count == 0:
+            return
+
+        log.log(self.level, "%s: (%s)", self.key, summary.describe(self.units))
+
+
+ACCUMULATORS: Dict[str, Accumulator] = {}
+_registry_lock = threading.Lock()
+
+
+def get_accumulator(
+    key: str,
+    log: Optional[logging.Logger] = None,
+    level: int = logging.INFO,
+    interval: Optional[float] = None,
+) -> Accumulator:
+    """Retrieve (or register) the shared accumulator of a key."""
+    acc: Optional[Accumulator] = ACCUMULATORS.get(key)
+    if acc is not None:
+        return acc
+
+    with _registry_lock:
+        acc = ACCUMULATORS.get(key)
+        if acc is None:
+            acc = ACCUMULATORS[key] = Accumulator(key, log, level, interval)
+
+    return acc
+
+
+def emit_all(reset: bool = True) -> None:
+    """Emit summaries of all registered accumulators."""
+    for acc in list(ACCUMULATORS.values()):
+        acc.emit(reset=reset)
+
+
+atexit.register(emit_all)
@@ -0,0 +1,130 @@
+# MIT License
+
+# Copyright (c) 2023 Spill-Tea
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Unit tables, converting a base unit value into the most relevant unit."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, Tuple, Union
+
+
+@dataclass
+class Unit:
+    """Unit comparing string id to a modifier of the next unit.
+
+    Args:
+        unit (str): name of unit
+        base (int): value of unit
+        modifier (int | None): multiplier describing 1 of next unit
+
+    """
+
+    unit: str
+    base: int = 1
+    modifier: Union[int, None] = None
+
+
+class Units:
+    """Container of Units.
+
+    Args:
+        units (Unit): unit definitions
+
+    Raises:
+        ValueError: if modifier value of units is not defined.
+
+    """
+
+    units: Tuple[Unit, ...]
+
+    def __init__(self, *units: Unit) -> None:
+        self.units = units
+        self._update()
+
+    def _update(self) -> None:
+        for n, current in enumerate(self.units[1:]):
+            previous = self.units[n]
+            if previous.modifier is None:
+                raise ValueError(
+                    f"Modifier value of unit '{previous.unit}' cannot be None."
+                )
+            current.base = previous.base * previous.modifier
+
+    def __iter__(self) -> Iterator[Unit]:
+        yield from self.units
+
+    def convert_units(self, value: float) -> Tuple[float, str]:
+        """Convert base unit into most relevant unit."""
+        new_time: float = float(value)
+        text: str = ""
+
+        for u in self:
+            new_time = value / u.base
+            text = u.unit
+            if u.modifier is None or new_time < u.modifier:
+                break
+
+        return new_time, text
+
+    def breakdown_units(self, value: int) -> Dict[str, int]:
+        """Split base value into component unit bins."""
+        data: Dict[str, int] = {}
+        for unit in reversed(self.units):
+            data[unit.unit], value = divmod(value, unit.base)
+
+        return data
+
+
+NS_UNITS = Units(
+    Unit(unit="ns", modifier=1000),
+    Unit(unit="us", modifier=1000),
+    Unit(unit="ms", modifier=1000),
+    Unit(unit="s", modifier=60),
+    Unit(unit="min", modifier=60),
+    Unit(unit="hr", modifier=24),
+    Unit(unit="days", modifier=7),
+    Unit(unit="weeks"),
+)
+
+BYTE_UNITS = Units(
+    Unit(unit="B", modifier=1024),
+    Unit(unit="KiB", modifier=1024),
+    Unit(unit="MiB", modifier=1024),
+    Unit(unit="GiB", modifier=1024),
+    Unit(unit="TiB"),
+)
+
+# Rates, per second
+ITEM_RATE_UNITS = Units(
+    Unit(unit="/s", modifier=1000),
+    Unit(unit="K/s", modifier=1000),
+    Unit(unit="M/s", modifier=1000),
+    Unit(unit="G/s"),
+)
+
+BYTE_RATE_UNITS = Units(
+    Unit(unit="B/s", modifier=1024),
+    Unit(unit="KiB/s", modifier=1024),
+    Unit(unit="MiB/s", modifier=1024),
+    Unit(unit="GiB/s", modifier=1024),
+    Unit(unit="TiB/s"),
+)
@@ -4,17 +4,19 @@ from __future__ import annotations
 
 import logging
 import os
-from io import IOBase
-from typing import Callable, Generator, Optional
+from io import IOBase, StringIO
+from typing import Any, Callable, Generator, List, Optional, Tuple
 
 import pytest
 
 from EpiLog.manager import EpiLog
+from EpiLog.stats import ACCUMULATORS
 
 
 def teardown_handler(handler: logging.Handler):
     """Teardown a single handler."""
-    if not handler.stream.closed:
+    stream = getattr(handler, "stream", None)
+    if stream is None or not stream.closed:
         handler.flush()
         handler.close()
 
@@ -34,6 +36,12 @@ def teardown_logger_handlers(log: logging.Logger):
 
 def teardown_epilogs(epilog: EpiLog) -> None:
     """Handle Teardown of EpiLog Manager."""
+    if epilog._reporter is not None:
+        epilog._reporter.stop(report=False)
+    if epilog._listener is not None:
+        epilog._listener.stop()
+    if epilog._collector is not None:
+        epilog._collector.stop()
     for key, logger in epilog.loggers.items():
         logging.Logger.manager.loggerDict.pop(key)
         teardown_logger_handlers(logger)
@@ -58,6 +66,78 @@ def build_manager() -> Generator[Callable[..., EpiLog], None, None]:
         teardown_epilogs(instance)
 
 
+@pytest.fixture
+def stream() -> Generator[StringIO, None, None]:
+    """StringIO stream, written by managers of `stream_manager`."""
+    with StringIO() as buffer:
+        yield buffer
+
+
+@pytest.fixture
+def stream_manager(
+    stream: StringIO,
+    build_manager: Callable[..., EpiLog],
+) -> Generator[Callable[..., EpiLog], None, None]:
+    """Construct an EpiLog Instance writing messages to the `stream` fixture.
+
+    The builder takes the format string of the manager formatter, followed by
+    keyword arguments of EpiLog.
+
+    """
+
+    def builder(fmt: str = "%(levelname)s | %(message)s", **kwargs) -> EpiLog:
+        return build_manager(
+            stream=logging.StreamHandler(stream),
+            formatter=logging.Formatter(fmt),
+            **kwargs,
+        )
+
+    yield builder
+
+    ACCUMULATORS.clear()
+
+
+@pytest.fixture
+def stream_construct(
+    request: pytest.FixtureRequest,
+    stream: StringIO,
+    stream_manager: Callable[..., EpiLog],
+) -> Tuple[StringIO, logging.Logger]:
+    """Construct a logger (named after the test module) writing to a StringIO stream.
+
+    Indirectly parametrized by keyword arguments of `stream_manager`, if any.
+
+    """
+    kwargs = getattr(request, "param", {})
+    name: str = request.module.__name__.rpartition("test_")[2]
+    return stream, stream_manager(**kwargs).get_logger(name)
+
+
+def _record(
+    msg: str = "value a", level: int = logging.INFO, args: Any = (), **extra: Any
+) -> logging.LogRecord:
+    """Construct a record (at line 10 of this module), updated with extra attributes."""
+    record = logging.LogRecord("record", level, __file__, 10, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class _Collector(logging.Handler):
+    """Handler which retains emitted records."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    @property
+    def messages(self) -> List[str]:
+        """Messages of emitted records."""
+        return [record.getMessage() for record in self.records]
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
 def _assert_msg_in_output(stream: IOBase, msg: str) -> None:
     stream.seek(0)
     output: str = stream.read()
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
+import re
+import time
 from io import StringIO
-from typing import Callable, Dict, Generator, Tuple
+from typing import AsyncGenerator, Callable, Dict, Generator, List, Tuple
 
 import pytest
 
 from EpiLog import EpiLog
 from EpiLog.benchmark import NS_UNITS, BenchMark, Unit, Units
+from EpiLog.units import BYTE_RATE_UNITS, ITEM_RATE_UNITS
 
 from .conftest import _assert_msg_in_output
 
@@ -127,3 +132,241 @@ def test_breakdown(value: int, expected: dict) -> None:
     container.update(expected)
 
     assert result == container, "Expected Equal Output."
+
+
+def _elapsed_ms(stream: StringIO, description: str) -> float:
+    stream.seek(0)
+    for line in stream.read().splitlines():
+        if f"{description}: (" in line:
+            value, unit = line.rsplit("(", 1)[1].rstrip(")").split()
+            scale = {"ns": 1e-6, "us": 1e-3, "ms": 1.0, "s": 1e3}[unit]
+            return float(value) * scale
+    raise AssertionError(f"Benchmark message not found: {description}")
+
+
+def test_decorate_function(construct: Tuple[StringIO, EpiLog]) -> None:
+    """Test a decorated function is benchmarked per call, preserving metadata."""
+    stream, manager = construct
+    log: logging.Logger = manager.get_logger("decorated")
+
+    @BenchMark(log, "add")
+    def add(a: int, b: int) -> int:
+        """Add two numbers."""
+        return a + b
+
+    assert add(1, 2) == 3
+    assert add.__name__ == "add" and add.__doc__ == "Add two numbers."
+    _assert_msg_in_output(stream, "INFO | add: (")
+
+
+def test_decorate_disabled(construct: Tuple[StringIO, EpiLog]) -> None:
+    """Test a decorated function is called directly when logging is disabled."""
+    stream, manager = construct
+    manager.level = logging.WARNING
+    log: logging.Logger = manager.get_logger("decorated_disabled")
+
+    @BenchMark(log, "quiet", logging.DEBUG)
+    def quiet() -> str:
+        return "result"
+
+    assert quiet() == "result"
+    assert stream.getvalue() == "", "Expected no benchmark message."
+
+    manager.level = logging.DEBUG
+    assert quiet() == "result"
+    _assert_msg_in_output(stream, "DEBUG | quiet: (")
+
+
+def test_decorate_error(construct: Tuple[StringIO, EpiLog]) -> None:
+    """Test an error raised from a decorated function is logged and propagated."""
+    stream, manager = construct
+    log: logging.Logger = manager.get_logger("decorated_error")
+
+    @BenchMark(log, "failure")
+    def failure() -> None:
+        raise RuntimeError("Intentional")
+
+    with pytest.raises(RuntimeError):
+        failure()
+    _assert_msg_in_output(stream, "ERROR | Traceback:")
+
+
+def test_decorate_coroutine(construct: Tuple[StringIO, EpiLog]) -> None:
+    """Test a decorated coroutine is timed across awaits."""
+    stream, manager = construct
+    log: logging.Logger = manager.get_logger("decorated_coroutine")
+
+    @BenchMark(log, "sleeper")
+    async def sleeper(delay: float) -> float:
+        await asyncio.sleep(delay)
+        return delay
+
+    assert inspect.iscoroutinefunction(sleeper)
+    assert asyncio.run(sleeper(0.02)) == 0.02
+    assert _elapsed_ms(stream, "sleeper") >= 15.0, "Expected time across awaits."
+
+    manager.level = logging.WARNING
+    assert asyncio.run(sleeper(0.0)) == 0.0
+
+
+def test_decorate_generator(construct: Tuple[StringIO, EpiLog]) -> None:
+    """Test a decorated generator is timed until exhausted or closed."""
+    stream, manager = construct
+    log: logging.Logger = manager.get_logger("decorated_generator")
+
+    @BenchMark(log, "counter")
+    def counter(n: int) -> Generator[int, int, str]:
+        total: int = 0
+        for i in range(n):
+            total += (yield i) or 0
+        return f"total {total}"
+
+    assert inspect.isgeneratorfunction(counter)
+    assert list(counter(3)) == [0, 1, 2]
+    _assert_msg_in_output(stream, "INFO | counter: (")
+
+    gen = counter(3)
+    next(gen)
+    gen.send(5)
+    with pytest.raises(StopIteration) as stop:
+        gen.send(6)
+        next(gen)
+    assert stop.value.value == "total 11"
+
+    # Closing a generator early is not an error
+    gen = counter(10)
+    next(gen)
+    gen.close()
+    assert "ERROR" not in stream.getvalue()
+
+    manager.level = logging.WARNING
+    assert list(counter(2)) == [0, 1]
+
+
+def test_decorate_async_generator(construct: Tuple[StringIO, EpiLog]) -> None:
+    """Test a decorated async generator forwards asend and athrow, and is timed."""
+    stream, manager = construct
+    log: logging.Logger = manager.get_logger("decorated_async_generator")
+
+    @BenchMark(log, "ticker")
+    async def ticker(n: int) -> AsyncGenerator[int, int]:
+        i: int = 0
+        while i < n:
+            try:
+                sent = yield i
+            except ValueError:
+                sent = 100
+            i = sent or i + 1
+
+    async def main() -> List[int]:
+        output: List[int] = [i async for i in ticker(3)]
+        agen = ticker(200)
+        output.append(await agen.__anext__())
+        output.append(await agen.asend(10))
+        output.append(await agen.athrow(ValueError("Intentional")))
+        await agen.aclose()
+        return output
+
+    assert inspect.isasyncgen(ticker(0))
+    assert asyncio.run(main()) == [0, 1, 2, 0, 10, 100]
+    _assert_msg_in_output(stream, "INFO | ticker: (")
+    assert "ERROR" not in stream.getvalue()
+
+    manager.level = logging.WARNING
+
+    async def disabled() -> List[int]:
+        return [i async for i in ticker(2)]
+
+    assert asyncio.run(disabled()) == [0, 1]
+    agen = ticker(2)
+    assert agen.ag_code is inspect.unwrap(ticker).__code__, "Expected no proxy."
+    asyncio.run(agen.aclose())
+
+
+@pytest.mark.parametrize(
+    ["units", "value", "expected"],
+    [
+        (ITEM_RATE_UNITS, 12.5, (12.5, "/s")),
+        (ITEM_RATE_UNITS, 2_500_000, (2.5, "M/s")),
+        (BYTE_RATE_UNITS, 3 * 1024**2, (3.0, "MiB/s")),
+    ],
+)
+def test_rate_units(units: Units, value: float, expected: Tuple[float, str]) -> None:
+    """Test rates convert to the most relevant unit per second."""
+    assert units.convert_units(value) == expected
+
+
+def test_throughput(construct: Tuple[StringIO, EpiLog]) -> None:
+    """Test items and bytes, set up front or added, are reported as rates."""
+    stream, manager = construct
+    log: logging.Logger = manager.get_logger("throughput")
+
+    bench = BenchMark(log, "batch", items=1000)
+    for _ in range(2):
+        with bench:
+            time.sleep(0.002)
+            bench.add(nbytes=4096)
+        assert (bench.items, bench.nbytes) == (1000, 4096), "Expected per use counts."
+
+    lines: List[str] = stream.getvalue().splitlines()
+    pattern: str = (
+        r"INFO \| batch: \([\d.]+ ms, "
+        r"items=1000 \([\d.]+ K/s\), bytes=4096 \([\d.]+ (KiB|MiB)/s\)\)"
+    )
+    assert len(lines) == 2
+    assert all(re.fullmatch(pattern, line) for line in lines), lines
+
+    with BenchMark(log, "counted") as b:
+        for _ in range(3):
+            b.add(1)
+    assert "counted: (" in stream.getvalue() and "items=3 (" in stream.getvalue()
+
+
+def test_throughput_disabled(construct: Tuple[StringIO, EpiLog]) -> None:
+    """Test a disabled BenchMark reports nothing, while still counting cheaply."""
+    stream, manager = construct
+    log: logging.Logger = manager.get_logger("throughput_disabled")
+    with BenchMark(log, "batch", logging.DEBUG, items=10) as b:
+        b.add(5)
+    assert b.items == 15
+    assert stream.getvalue() == ""
+
+
+def test_disabled_state(construct: Tuple[StringIO, EpiLog]) -> None:
+    """Test per use state of a disabled BenchMark reads as its defaults."""
+    _, manager = construct
+    log: logging.Logger = manager.get_logger("disabled_state")
+    with BenchMark(log, "hidden", logging.DEBUG, items=2) as b:
+        ...
+
+    assert (b.t0, b.span, b.elapsed, b.usage) == (0, None, None, {})
+    assert (b.items, b.nbytes) == (2, 0)
+    with pytest.raises(AttributeError):
+        b.missing  # noqa: B018
+
+
+def test_reuse_tracks_level(construct: Tuple[StringIO, EpiLog]) -> None:
+    """Test a reused BenchMark follows later changes of the manager level."""
+    stream, manager = construct
+    manager.level = logging.INFO
+    log: logging.Logger = manager.get_logger("reused")
+
+    bench = BenchMark(log, "reused", logging.DEBUG)
+    with bench:
+        ...
+    assert not bench.enabled
+
+    epoch: int = EpiLog.epoch
+    manager.level = logging.DEBUG
+    assert EpiLog.epoch > epoch, "Expected epoch advanced by level change."
+    with bench:
+        ...
+    assert bench.enabled
+    assert bench.epoch == EpiLog.epoch
+    _assert_msg_in_output(stream, "DEBUG | reused: (")
+
+    manager.level = logging.WARNING
+    with bench:
+        ...
+    assert not bench.enabled
+    assert stream.getvalue().count("reused: (") == 1
@@ -0,0 +1,180 @@
+"""Test Expected Behavior of the EpiLog Binary Module."""
+
+from __future__ import annotations
+
+import io
+import logging
+import struct
+import sys
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+
+from EpiLog import EpiLog
+from EpiLog.binary import (
+    FRAME,
+    HEADER,
+    KIND_HEADER,
+    BinaryHandler,
+    decode,
+    main,
+    render,
+)
+from EpiLog.manager import defaultFormat
+
+
+VERBOSE = logging.Formatter(
+    "%(created)f %(msecs)d %(name)s %(levelno)d %(levelname)s %(pathname)s "
+    "%(filename)s %(module)s %(funcName)s %(lineno)d %(threadName)s %(process)d "
+    "%(message)s"
+)
+
+
+class _Unmarshallable:
+    def __str__(self) -> str:
+        return "custom"
+
+
+def _records() -> List[logging.LogRecord]:
+    log = logging.Logger("binary.records")
+    records: List[logging.LogRecord] = [
+        log.makeRecord(log.name, logging.INFO, __file__, 1, "plain", (), None),
+        log.makeRecord(log.name, logging.DEBUG, __file__, 2, "%d %s", (1, "é"), None),
+        log.makeRecord(log.name, logging.INFO, __file__, 3, "%(a)s", ({"a": 1},), None),
+        log.makeRecord(
+            "other", logging.WARNING, __file__, 4, "%s", (_Unmarshallable(),), None
+        ),
+        log.makeRecord(log.name, logging.INFO, __file__, 5, "%d", ("x",), None),
+    ]
+    try:
+        raise ValueError("broken")
+    except ValueError:
+        records.append(
+            log.makeRecord(
+                log.name, logging.ERROR, __file__, 6, "failed", (), sys.exc_info()
+            )
+        )
+    records[-1].stack_info = "Stack (most recent call last):\n  here"
+    return records
+
+
+@pytest.mark.parametrize("formatter", [defaultFormat, VERBOSE])
+def test_binary_roundtrip(tmp_path: Path, formatter: logging.Formatter) -> None:
+    """Test decoded records render identically to the original records."""
+    path: Path = tmp_path / "roundtrip.bin"
+    handler = BinaryHandler(path)
+    records: List[logging.LogRecord] = _records()[:4]
+    for record in records:
+        handler.handle(record)
+    handler.close()
+
+    with open(path, "rb") as f:
+        rendered: List[str] = list(render(f, formatter))
+    assert rendered == [formatter.format(r) for r in records]
+
+
+def test_binary_exception_and_fallbacks(tmp_path: Path) -> None:
+    """Test exception text, stack information and message fallbacks are decoded."""
+    path: Path = tmp_path / "fallback.bin"
+    handler = BinaryHandler(path)
+    for record in _records():
+        handler.handle(record)
+    handler.close()
+
+    with open(path, "rb") as f:
+        decoded: List[logging.LogRecord] = list(decode(f))
+
+    for record, expected in zip(decoded, _records()):
+        assert abs(record.relativeCreated - expected.relativeCreated) < 1000
+    assert decoded[3].getMessage() == "custom", "Expected a pre-rendered message."
+    assert decoded[4].getMessage() == "%d ('x',)", "Expected a mismatch rendered."
+    output: str = defaultFormat.format(decoded[5])
+    assert "ValueError: broken" in output
+    assert output.endswith("Stack (most recent call last):\n  here")
+
+
+def test_binary_interned(tmp_path: Path) -> None:
+    """Test strings are written once per session, and sessions are appended."""
+    path: Path = tmp_path / "interned.bin"
+    record: logging.LogRecord = _records()[1]
+    for _ in range(2):
+        handler = BinaryHandler(path)
+        for _ in range(100):
+            handler.handle(record)
+        handler.close()
+
+    data: bytes = path.read_bytes()
+    assert data.count(record.msg.encode()) == 2, "Expected one template per session."
+    assert len(data) < 100 * 2 * len(defaultFormat.format(record))
+
+    with open(path, "rb") as f:
+        assert len(list(decode(f))) == 200
+
+
+def test_binary_bounded(tmp_path: Path) -> None:
+    """Test the string table is bounded, by opening new sessions."""
+    path: Path = tmp_path / "bounded.bin"
+    log = logging.Logger("binary.bounded")
+    handler = BinaryHandler(path, max_strings=64)
+    sizes: List[int] = []
+    for index in range(1000):
+        handler.handle(
+            log.makeRecord(log.name, logging.INFO, __file__, 1, f"{index}", (), None)
+        )
+        sizes.append(len(handler._strings))
+    handler.close()
+
+    assert max(sizes) < 64 + 5, "Expected at most five strings beyond the bound."
+    data: bytes = path.read_bytes()
+    assert data.count(FRAME.pack(KIND_HEADER, HEADER.size)) > 1000 // 64
+    with open(path, "rb") as f:
+        messages: List[str] = [record.getMessage() for record in decode(f)]
+    assert messages == [f"{index}" for index in range(1000)]
+
+
+def test_binary_truncated(tmp_path: Path) -> None:
+    """Test decoding stops at a truncated final frame."""
+    path: Path = tmp_path / "truncated.bin"
+    handler = BinaryHandler(path)
+    for record in _records():
+        handler.handle(record)
+    handler.close()
+
+    data: bytes = path.read_bytes()
+    decoded = list(decode(io.BytesIO(data[:-3])))
+    assert len(decoded) == len(_records()) - 1
+
+
+def test_binary_errors() -> None:
+    """Test ValueError is raised on an unsupported version or frame."""
+    header = FRAME.pack(KIND_HEADER, HEADER.size) + HEADER.pack(99, 0.0)
+    with pytest.raises(ValueError):
+        list(decode(io.BytesIO(header)))
+
+    with pytest.raises(ValueError):
+        list(decode(io.BytesIO(struct.pack("<cI", b"X", 0))))
+
+
+def test_binary_cli(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    build_manager: Callable[..., EpiLog],
+) -> None:
+    """Test the decoder renders a log of the manager to standard output."""
+    path: Path = tmp_path / "cli.bin"
+    manager: EpiLog = build_manager(stream=BinaryHandler(path), level=logging.DEBUG)
+    log: logging.Logger = manager.get_logger("binary_cli")
+    log.debug("value %d", 42)
+    manager.remove(log)
+
+    main([str(path), "--format", "%(levelname)s | %(message)s"])
+    assert capsys.readouterr().out == "DEBUG | value 42\n"
+
+    main([str(path), "--formatter", "EpiLog.formatters:JsonFormatter"])
+    assert '"message":"value 42"' in capsys.readouterr().out
+
+    main([str(path)])
+    assert (
+        "| binary_cli | DEBUG | test_binary.test_binary_cli:" in capsys.readouterr().out
+    )
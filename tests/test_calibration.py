@@ -0,0 +1,124 @@
+"""Test Expected Behavior of the EpiLog Calibration Module."""
+
+from __future__ import annotations
+
+import logging
+import statistics
+import time
+from io import StringIO
+from typing import List, Tuple
+
+import pytest
+
+from EpiLog.benchmark import BenchMark
+from EpiLog.calibration import (
+    _CALIBRATION,
+    Calibration,
+    calibrate,
+    get_calibration,
+)
+
+
+def test_calibration_methods() -> None:
+    """Test correction, and resolution floor of a calibration."""
+    calibration = Calibration(
+        overhead=100, noise=10, ceiling=120, resolution=20, declared=1.0, samples=1
+    )
+    assert calibration.floor == 130
+    assert calibration.correct(150) == 50
+    assert calibration.correct(50) == 0, "Expected no negative durations."
+    assert calibration.below_resolution(130)
+    assert not calibration.below_resolution(131)
+
+    noisy = Calibration(
+        overhead=100, noise=1, ceiling=300, resolution=1, declared=1.0, samples=1
+    )
+    assert noisy.floor == 300
+
+
+def test_calibrate_once() -> None:
+    """Test calibration is measured once per process, unless forced."""
+    calibration: Calibration = calibrate()
+    assert get_calibration() is calibration
+    assert calibrate() is calibration
+
+    forced: Calibration = calibrate(samples=100, force=True)
+    assert forced is not calibration and get_calibration() is forced
+    assert forced.samples == 100
+    assert forced.overhead > 0 and forced.resolution > 0 and forced.declared > 0
+
+
+def test_benchmark_below_resolution(
+    stream_construct: Tuple[StringIO, logging.Logger],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test durations within the calibrated floor are flagged, and others are not."""
+    stream, log = stream_construct
+    coarse = Calibration(
+        overhead=0, noise=0, ceiling=10**9, resolution=1, declared=1.0, samples=1
+    )
+    monkeypatch.setitem(_CALIBRATION, "process", coarse)
+    with BenchMark(log, "empty") as b:
+        ...
+    assert b.elapsed is not None
+    assert stream.getvalue().endswith(", below resolution)\n")
+
+    fine = Calibration(
+        overhead=0, noise=0, ceiling=0, resolution=1, declared=1.0, samples=1
+    )
+    monkeypatch.setitem(_CALIBRATION, "process", fine)
+    with BenchMark(log, "sleep"):
+        time.sleep(0.001)
+    assert stream.getvalue().splitlines()[-1].endswith(" ms)")
+
+
+def test_benchmark_correct(stream_construct: Tuple[StringIO, logging.Logger]) -> None:
+    """Test corrected durations exclude the overhead of BenchMark itself."""
+    _, log = stream_construct
+    calibration: Calibration = calibrate()
+    with BenchMark(log, "corrected", correct=True) as b:
+        time.sleep(0.001)
+    assert b.elapsed is not None
+    assert 1_000_000 - calibration.overhead <= b.elapsed
+
+    durations = []
+
+    class _Sink:
+        def add(self, value: int) -> None:
+            durations.append(value)
+
+    for _ in range(100):
+        with BenchMark(log, "aggregated", aggregate=_Sink(), correct=True):
+            ...
+    assert min(durations) == 0, "Expected empty contexts corrected to zero."
+
+    with BenchMark(log, "disabled", logging.DEBUG) as b:
+        ...
+    assert b.elapsed is None, "Expected no duration when disabled."
+
+
+def test_benchmark_correct_empty(
+    stream_construct: Tuple[StringIO, logging.Logger],
+) -> None:
+    """Test empty emitting contexts are corrected to about zero, and flagged."""
+    stream, log = stream_construct
+    calibration: Calibration = calibrate(force=True)
+    elapsed: List[int] = []
+    for _ in range(200):
+        with BenchMark(log, "empty", correct=True) as b:
+            ...
+        elapsed.append(b.elapsed or 0)
+
+    flagged: int = stream.getvalue().count("below resolution")
+    assert flagged >= 100, "Expected most empty contexts flagged."
+    assert statistics.median(elapsed) <= calibration.floor - calibration.overhead
+
+
+def test_calibrate_within_tree(
+    stream_construct: Tuple[StringIO, logging.Logger],
+) -> None:
+    """Test calibrating within an open tree attaches no spans to it."""
+    _, log = stream_construct
+    with BenchMark(log, "tree", tree=True) as b:
+        calibrate(samples=100, force=True)
+    assert b.span is not None and b.span.children == []
@@ -0,0 +1,163 @@
+"""Test Expected Behavior of the EpiLog Caller Module."""
+
+from __future__ import annotations
+
+import logging
+from io import StringIO
+from typing import Callable, List
+
+import pytest
+
+from EpiLog import EpiLog
+from EpiLog.caller import (
+    CALLER_CACHED,
+    CALLER_FULL,
+    CALLER_OFF,
+    UNKNOWN_CALLER,
+    apply_caller_policy,
+)
+from EpiLog.manager import callerlessFormat, defaultFormat
+
+from .conftest import _Collector
+
+
+def _helper(log: logging.Logger) -> None:
+    log.info("from helper", stacklevel=2)
+
+
+def _emit(policy: str, **kwargs) -> logging.LogRecord:
+    log = logging.Logger(f"caller.{policy}")
+    handler = _Collector()
+    log.addHandler(handler)
+    apply_caller_policy(log, policy)
+    log.info("message", **kwargs)
+    return handler.records[0]
+
+
+@pytest.mark.parametrize("policy", [CALLER_FULL, CALLER_CACHED])
+def test_caller_resolution(policy: str) -> None:
+    """Test cached caller resolution is identical to that of the logging module."""
+    expected: logging.LogRecord = _emit(CALLER_FULL)
+    record: logging.LogRecord = _emit(policy)
+
+    assert record.funcName == "_emit", "Expected calling function name."
+    assert record.pathname == expected.pathname
+    assert record.lineno == expected.lineno
+    assert record.stack_info is None
+
+
+def test_caller_cached_repeat() -> None:
+    """Test repeated calls from a single site resolve to the same caller."""
+    first: logging.LogRecord = _emit(CALLER_CACHED)
+    second: logging.LogRecord = _emit(CALLER_CACHED)
+    assert (first.pathname, first.lineno) == (second.pathname, second.lineno)
+
+
+def test_caller_cached_sites() -> None:
+    """Test distinct call sites sharing a code object and line resolve apart."""
+    log = logging.Logger("caller.sites")
+    handler = _Collector()
+    log.addHandler(handler)
+    apply_caller_policy(log, CALLER_CACHED)
+    for _ in range(2):
+        log.info("first"), log.warning("second")
+        log.info("third")
+
+    lines: List[int] = [record.lineno for record in handler.records]
+    assert lines[:3] == lines[3:], "Expected repeated sites to resolve alike."
+    assert lines[0] == lines[1] and lines[2] == lines[0] + 1
+    assert all(
+        record.funcName == "test_caller_cached_sites" for record in handler.records
+    )
+
+
+def test_caller_cached_adapter() -> None:
+    """Test calls through a logger adapter resolve to the calling frame."""
+    log = logging.Logger("caller.adapter")
+    handler = _Collector()
+    log.addHandler(handler)
+    apply_caller_policy(log, CALLER_CACHED)
+    adapter = logging.LoggerAdapter(log, {})
+    for _ in range(2):
+        adapter.info("adapted")
+
+    assert [record.funcName for record in handler.records] == [
+        "test_caller_cached_adapter"
+    ] * 2
+
+
+def test_caller_cached_stacklevel() -> None:
+    """Test stacklevel skips the frame of a logging helper function."""
+    log = logging.Logger("caller.stacklevel")
+    handler = _Collector()
+    log.addHandler(handler)
+    apply_caller_policy(log, CALLER_CACHED)
+    _helper(log)
+
+    assert handler.records[0].funcName == "test_caller_cached_stacklevel"
+
+
+def test_caller_cached_stack_info() -> None:
+    """Test stack information is gathered when requested."""
+    record: logging.LogRecord = _emit(CALLER_CACHED, stack_info=True)
+    assert record.stack_info is not None
+    assert record.stack_info.startswith("Stack (most recent call last):")
+    assert "_emit" in record.stack_info
+
+
+def test_caller_off() -> None:
+    """Test caller information is unknown when policy is off."""
+    record: logging.LogRecord = _emit(CALLER_OFF)
+    expected = UNKNOWN_CALLER
+    assert (record.pathname, record.lineno, record.funcName) == expected[:3]
+
+
+def test_caller_policy_restore() -> None:
+    """Test restoring full policy removes instance override."""
+    log = logging.Logger("caller.restore")
+    apply_caller_policy(log, CALLER_OFF)
+    assert "findCaller" in vars(log)
+    apply_caller_policy(log, CALLER_FULL)
+    assert "findCaller" not in vars(log)
+
+
+def test_caller_policy_error(build_manager: Callable[..., EpiLog]) -> None:
+    """Test ValueError is raised with an unsupported caller policy."""
+    with pytest.raises(ValueError):
+        apply_caller_policy(logging.Logger("caller.error"), "sometimes")
+
+    with pytest.raises(ValueError):
+        build_manager(caller="sometimes")
+
+
+def test_manager_caller_off(build_manager: Callable[..., EpiLog]) -> None:
+    """Test manager exchanges default format when caller information is off."""
+    with StringIO() as stream:
+        manager: EpiLog = build_manager(
+            stream=logging.StreamHandler(stream), caller=CALLER_OFF
+        )
+        assert manager.formatter is callerlessFormat
+
+        log: logging.Logger = manager.get_logger("caller_off")
+        log.info("no caller")
+        assert "(unknown function)" not in stream.getvalue()
+        assert "| INFO | no caller" in stream.getvalue()
+
+        manager.caller = CALLER_FULL
+        assert manager.formatter is defaultFormat
+        assert "findCaller" not in vars(log)
+
+
+def test_manager_caller_cached(build_manager: Callable[..., EpiLog]) -> None:
+    """Test manager applies cached policy to loggers, and restores on removal."""
+    with StringIO() as stream:
+        manager: EpiLog = build_manager(stream=logging.StreamHandler(stream))
+        log: logging.Logger = manager.get_logger("caller_cached")
+        manager.caller = CALLER_CACHED
+        assert manager.formatter is defaultFormat
+
+        log.info("cached caller")
+        assert "test_manager_caller_cached" in stream.getvalue()
+
+        manager.remove(log)
+        assert "findCaller" not in vars(log)
@@ -0,0 +1,328 @@
+"""Test Expected Behavior of the EpiLog Filters Module."""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import sys
+import textwrap
+import time
+from io import StringIO
+from typing import Callable, List, Tuple
+
+import pytest
+
+from EpiLog import EpiLog
+from EpiLog.filters import (
+    Coalescer,
+    Limit,
+    LoadShedder,
+    apply_coalescer,
+    apply_limit,
+    get_shedder,
+    match_limit,
+    prefixes,
+)
+
+from .conftest import _Collector
+
+
+FORMAT: str = "%(name)s | %(levelname)s | %(message)s"
+
+
+def test_prefixes() -> None:
+    """Test dotted prefixes of a logger name, from most to least specific."""
+    assert list(prefixes("a.b.c")) == ["a.b.c", "a.b", "a", ""]
+    assert list(prefixes("")) == [""]
+
+
+def test_match_limit() -> None:
+    """Test the most specific prefix limit applies to a logger."""
+    fallback, specific = Limit(sample=0.5), Limit(rate=10)
+    limits = {"": fallback, "app.db": specific}
+    assert match_limit("app.db", limits) is specific
+    assert match_limit("app.db.query", limits) is specific
+    assert match_limit("app.dbx", limits) is fallback
+    assert match_limit("app", {"app.db": specific}) is None
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"sample": 0}, {"sample": 1.5}, {"rate": 0}, {"burst": 0.5}, {"interval": -1}],
+)
+def test_limit_error(kwargs) -> None:
+    """Test ValueError is raised with out of range limits."""
+    with pytest.raises(ValueError):
+        Limit(**kwargs)
+
+
+def test_sample() -> None:
+    """Test sampling deterministically keeps the configured fraction of records."""
+    log = logging.Logger("filters.sample")
+    shedder = LoadShedder(log, Limit(sample=0.25))
+    record = logging.makeLogRecord({"msg": "sampled"})
+    kept: List[bool] = [shedder.filter(record) for _ in range(100)]
+
+    assert kept[:4] == [True, False, False, False]
+    assert sum(kept) == 25
+    assert shedder.suppressed == shedder.pending == 75
+
+
+def test_token_bucket() -> None:
+    """Test a token bucket admits a burst, then refills at the configured rate."""
+    log = logging.Logger("filters.bucket")
+    shedder = LoadShedder(log, Limit(rate=100, burst=5))
+    record = logging.makeLogRecord({"msg": "limited"})
+
+    assert sum(shedder.filter(record) for _ in range(10)) == 5
+    time.sleep(0.05)
+    admitted: int = sum(shedder.filter(record) for _ in range(10))
+    assert 3 <= admitted <= 5, "Expected bucket to refill at rate."
+
+
+def test_apply_limit() -> None:
+    """Test a filter is replaced only when the limit changes, and removed."""
+    log = logging.Logger("filters.apply")
+    apply_limit(log, Limit(sample=0.5))
+    shedder = get_shedder(log)
+    assert shedder is not None
+
+    apply_limit(log, Limit(sample=0.5))
+    assert get_shedder(log) is shedder, "Expected an equal limit to retain state."
+
+    apply_limit(log, None)
+    assert get_shedder(log) is None and log.filters == []
+
+
+def test_manager_limits(
+    stream: StringIO,
+    stream_manager: Callable[..., EpiLog],
+) -> None:
+    """Test manager sheds load before formatting, and summarizes suppression."""
+    limits = {"shed": Limit(sample=0.1, interval=0)}
+    manager: EpiLog = stream_manager(FORMAT, limits=limits)
+    log: logging.Logger = manager.get_logger("shed.loop")
+    other: logging.Logger = manager.get_logger("unlimited")
+
+    for i in range(20):
+        log.info("iteration %d", i)
+    other.info("kept")
+
+    lines: List[str] = stream.getvalue().splitlines()
+    assert lines == [
+        "shed.loop | INFO | iteration 0",
+        "shed.loop | WARNING | 9 records suppressed",
+        "shed.loop | INFO | iteration 10",
+        "unlimited | INFO | kept",
+    ]
+    assert manager.suppressed == {"shed.loop": 18}
+
+    manager.flush()
+    assert stream.getvalue().endswith("shed.loop | WARNING | 9 records suppressed\n")
+
+
+def test_manager_limits_update(
+    stream: StringIO,
+    stream_manager: Callable[..., EpiLog],
+) -> None:
+    """Test limits are applied to, and removed from, existing loggers."""
+    manager: EpiLog = stream_manager(FORMAT)
+    log: logging.Logger = manager.get_logger("update")
+    assert get_shedder(log) is None
+
+    manager.limits = {"": Limit(rate=1, burst=1)}
+    for _ in range(5):
+        log.info("limited")
+    assert manager.suppressed == {"update": 4}
+
+    manager.limits = None
+    assert get_shedder(log) is None
+    assert stream.getvalue().endswith("update | WARNING | 4 records suppressed\n")
+
+    with pytest.raises(TypeError):
+        manager.limits = {"": 0.5}  # type: ignore[dict-item]
+
+
+def test_manager_remove_summary(
+    stream: StringIO,
+    stream_manager: Callable[..., EpiLog],
+) -> None:
+    """Test pending suppression is summarized when a logger is removed."""
+    manager: EpiLog = stream_manager(FORMAT, limits={"": Limit(sample=0.5)})
+    log: logging.Logger = manager.get_logger("removed")
+    for _ in range(4):
+        log.info("sampled")
+
+    manager.remove(log)
+    assert stream.getvalue().endswith("removed | WARNING | 2 records suppressed\n")
+    assert log.filters == []
+
+
+def _coalesced(name: str, coalescer: Coalescer) -> Tuple[logging.Logger, _Collector]:
+    log = logging.Logger(name)
+    handler = _Collector()
+    log.addHandler(handler)
+    apply_coalescer(log, coalescer)
+    return log, handler
+
+
+@pytest.mark.parametrize("kwargs", [{"window": -1}, {"maxsize": 0}])
+def test_coalescer_error(kwargs) -> None:
+    """Test ValueError is raised with an unsupported window or table size."""
+    with pytest.raises(ValueError):
+        Coalescer(**kwargs)
+
+
+def test_coalescer_window() -> None:
+    """Test repeats within a window are suppressed, and summarized once ended."""
+    coalescer = Coalescer(window=0.05)
+    log, handler = _coalesced("filters.coalesce", coalescer)
+    for _ in range(5):
+        log.error("failed %s", "db")
+    log.error("failed %s", "cache")
+    assert handler.messages == ["failed db", "failed cache"]
+
+    time.sleep(0.06)
+    log.error("failed %s", "db")
+    assert handler.messages[2:] == [
+        "last message repeated 4 times",
+        "failed db",
+    ]
+
+
+def test_coalescer_long_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a run outlasting its window is summarized once a window."""
+    # NOTE: a fake clock, so scheduling delays never end the run early
+    clock: List[float] = [0.0]
+    monkeypatch.setattr("EpiLog.filters.monotonic", lambda: clock[0])
+    coalescer = Coalescer(window=0.02)
+    log, handler = _coalesced("filters.coalesce.long", coalescer)
+    log.info("spam")
+    for _ in range(50):
+        clock[0] += 0.001
+        log.info("spam")
+
+    summaries = [m for m in handler.messages if m.startswith("last message")]
+    assert handler.messages[0] == "spam"
+    assert 1 <= len(summaries) <= 3
+    assert "spam" not in handler.messages[1:], "Expected every repeat suppressed."
+
+
+def test_coalescer_eviction() -> None:
+    """Test the least recently seen message is evicted, and summarized."""
+    coalescer = Coalescer(window=60, maxsize=2)
+    log, handler = _coalesced("filters.coalesce.lru", coalescer)
+    for msg in ("a", "a", "b", "c"):
+        log.warning(msg)
+
+    assert len(coalescer) == 2
+    assert handler.messages == ["a", "b", "last message repeated 1 times", "c"]
+
+
+def test_coalescer_unhashable() -> None:
+    """Test records with unhashable arguments are never coalesced."""
+    log, handler = _coalesced("filters.coalesce.unhashable", Coalescer(60))
+    for _ in range(3):
+        log.info("%s", [1])
+    assert handler.messages == ["[1]"] * 3
+
+
+def test_manager_coalesce(build_manager: Callable[..., EpiLog]) -> None:
+    """Test manager coalesces repeats, ahead of load shedding, and flushes runs."""
+    with StringIO() as stream:
+        manager: EpiLog = build_manager(
+            stream=logging.StreamHandler(stream),
+            formatter=logging.Formatter("%(name)s | %(levelname)s | %(message)s"),
+            limits={"": Limit(rate=1, burst=1)},
+            coalesce=60,
+        )
+        log: logging.Logger = manager.get_logger("coalesced")
+        assert isinstance(manager.coalesce, Coalescer)
+        assert isinstance(log.filters[0], Coalescer)
+
+        for _ in range(100):
+            log.error("connection refused")
+        assert manager.suppressed == {"coalesced": 0}
+
+        manager.coalesce = None
+        assert stream.getvalue().splitlines() == [
+            "coalesced | ERROR | connection refused",
+            "coalesced | ERROR | last message repeated 99 times",
+        ]
+        assert not any(isinstance(f, Coalescer) for f in log.filters)
+
+
+def test_expire(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test summaries pending without a later record are emitted once expired."""
+    clock: List[float] = [0.0]
+    monkeypatch.setattr("EpiLog.filters.monotonic", lambda: clock[0])
+    coalescer = Coalescer(window=1)
+    log, handler = _coalesced("filters.expire", coalescer)
+    shedder = LoadShedder(log, Limit(sample=0.5, interval=1))
+    log.addFilter(shedder)
+    for _ in range(4):
+        log.info("repeat")
+    for n in range(3):
+        log.info("sampled %d", n)
+    coalescer.expire()
+    shedder.expire()
+    assert handler.messages == ["repeat", "sampled 1"]
+
+    clock[0] = 2.0
+    coalescer.expire()
+    shedder.expire()
+    assert len(coalescer) == 0
+    # NOTE: either may be summarized first by a concurrent background sweep
+    assert sorted(handler.messages[2:]) == [
+        "2 records suppressed",
+        "last message repeated 3 times",
+    ]
+
+
+def test_sweep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a background sweep summarizes runs ended without a later record."""
+    monkeypatch.setattr("EpiLog.filters.SWEEP_INTERVAL", 0.01)
+    log, handler = _coalesced("filters.sweep", Coalescer(window=0.01))
+    log.warning("swept")
+    log.warning("swept")
+
+    deadline: float = time.monotonic() + 5
+    while len(handler.messages) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert handler.messages == ["swept", "last message repeated 1 times"]
+
+
+def test_manager_summarize_exit() -> None:
+    """Test pending summaries of a queued manager are written at exit."""
+    script: str = textwrap.dedent(
+        """
+        import logging
+        import sys
+
+        from EpiLog import EpiLog
+        from EpiLog.filters import Limit
+
+        manager = EpiLog(
+            stream=logging.StreamHandler(sys.stdout),
+            formatter=logging.Formatter("%(message)s"),
+            queued=True,
+            limits={"": Limit(sample=0.5)},
+            coalesce=60,
+        )
+        log = manager.get_logger("exit")
+        for n in range(4):
+            log.info("sampled %d", n)
+        for _ in range(3):
+            log.info("repeat")
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.splitlines() == [
+        "sampled 0",
+        "sampled 2",
+        "repeat",
+        "2 records suppressed",
+        "last message repeated 2 times",
+    ]
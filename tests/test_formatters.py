@@ -0,0 +1,149 @@
+"""Test Expected Behavior of the EpiLog Formatters Module."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sys
+from io import StringIO
+from typing import Any, Callable, Dict
+
+import pytest
+
+from EpiLog import EpiLog
+from EpiLog.formatters import DEFAULT_FIELDS, JsonFormatter
+from EpiLog.records import RecordFactory, record_fields
+
+from .conftest import _record
+
+
+def test_json_default_fields() -> None:
+    """Test default fields mirror those of the default format."""
+    record: logging.LogRecord = _record()
+    data: Dict[str, Any] = json.loads(JsonFormatter().format(record))
+
+    assert tuple(data) == DEFAULT_FIELDS
+    assert data["message"] == "value a"
+    assert data["lineno"] == 10
+    assert data["module"] == "conftest"
+    assert data["asctime"] == logging.Formatter().formatTime(record)
+
+
+def test_json_values() -> None:
+    """Test values of each type are encoded as valid JSON."""
+    fields = ("str", "int", "float", "nan", "true", "none", "list", "unknown")
+    formatter = JsonFormatter(fields)
+    record: logging.LogRecord = _record(
+        str='quote " and é',
+        int=3,
+        float=0.5,
+        nan=float("nan"),
+        true=True,
+        none=None,
+        list=[1, "2"],
+        unknown=object(),
+    )
+    data: Dict[str, Any] = json.loads(formatter.format(record))
+
+    assert data["str"] == 'quote " and é'
+    assert (data["int"], data["float"], data["nan"]) == (3, 0.5, None)
+    assert (data["true"], data["none"], data["list"]) == (True, None, [1, "2"])
+    assert data["unknown"].startswith("<object object at")
+
+    ascii_output: str = JsonFormatter(("str",), ensure_ascii=True).format(record)
+    assert ascii_output.isascii()
+    assert json.loads(ascii_output)["str"] == 'quote " and é'
+
+
+def test_json_rename_extra() -> None:
+    """Test renamed keys, and passthrough of selected or all extra keys."""
+    record: logging.LogRecord = _record(request_id=7, user="u")
+    selected = JsonFormatter(
+        ("levelname", "message"),
+        extra=("request_id", "missing"),
+        rename={"levelname": "level"},
+    )
+    assert (
+        selected.format(record) == '{"level":"INFO","message":"value a","request_id":7}'
+    )
+
+    everything = JsonFormatter((), extra=True)
+    assert json.loads(everything.format(record)) == {"request_id": 7, "user": "u"}
+    assert JsonFormatter(()).format(record) == "{}"
+
+
+def test_json_message_error() -> None:
+    """Test a message failing to format with its arguments does not raise."""
+    data = json.loads(JsonFormatter(("message",)).format(_record("%d", args=("x",))))
+    assert data["message"] == "%d ('x',)"
+
+
+def test_json_exception() -> None:
+    """Test exception and stack information are included when present."""
+    try:
+        raise ValueError("broken")
+    except ValueError:
+        record = logging.LogRecord(
+            "json", logging.ERROR, __file__, 1, "failed", (), sys.exc_info()
+        )
+    record.stack_info = "Stack (most recent call last):\n  here"
+
+    data: Dict[str, Any] = json.loads(JsonFormatter(("message",)).format(record))
+    assert data["exc_info"].startswith("Traceback (most recent call last):")
+    assert "ValueError: broken" in data["exc_info"]
+    assert data["stack_info"].endswith("here")
+    assert "\n" not in JsonFormatter(("message",)).format(record)
+
+
+def test_json_record_fields() -> None:
+    """Test declared record fields derive a slim record factory."""
+    formatter = JsonFormatter(("asctime", "processName", "message"))
+    assert record_fields(formatter) == frozenset({"processName"})
+    assert formatter.usesTime()
+
+    factory = RecordFactory.from_formatter(formatter)
+    assert factory is not None and factory.fields == frozenset({"processName"})
+
+
+def test_manager_json(build_manager: Callable[..., EpiLog]) -> None:
+    """Test the manager writes records as JSON lines, with slim records."""
+    with StringIO() as stream:
+        manager: EpiLog = build_manager(
+            stream=logging.StreamHandler(stream),
+            formatter=JsonFormatter(("name", "levelname", "message"), extra=("key",)),
+            slim=True,
+        )
+        log: logging.Logger = manager.get_logger("json_manager")
+        log.info("first %d", 1, extra={"key": "k"})
+        log.warning("second")
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert lines == [
+            {
+                "name": "json_manager",
+                "levelname": "INFO",
+                "message": "first 1",
+                "key": "k",
+            },
+            {"name": "json_manager", "levelname": "WARNING", "message": "second"},
+        ]
+
+
+@pytest.mark.parametrize("extra", [("a",), True])
+def test_json_compact(extra) -> None:
+    """Test output is a single, compact line."""
+    output: str = JsonFormatter(("message",), extra=extra).format(_record(a=1))
+    assert output == '{"message":"value a","a":1}'
+
+
+def test_json_format_time() -> None:
+    """Test cached time formatting matches that of the logging module."""
+    formatter, expected = JsonFormatter(), logging.Formatter()
+    first, second = _record(), _record()
+    second.created += 1.5
+    second.msecs = 500.0
+    for record in (first, first, second):
+        assert formatter.formatTime(record) == expected.formatTime(record)
+        assert formatter.formatTime(record, "%H:%M") == expected.formatTime(
+            record, "%H:%M"
+        )
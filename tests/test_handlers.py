@@ -0,0 +1,243 @@
+"""Test Expected Behavior of the EpiLog Handlers Module."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from io import StringIO
+from typing import Any, Callable, List
+
+import pytest
+
+from EpiLog import EpiLog
+from EpiLog.handlers import (
+    OVERFLOW_BLOCK,
+    OVERFLOW_DROP_NEWEST,
+    OVERFLOW_DROP_OLDEST,
+    BatchingHandler,
+    BatchStats,
+    EnqueueHandler,
+    QueueListener,
+)
+
+from .conftest import _record
+
+
+def _drain(records: queue.Queue[Any]) -> List[str]:
+    output: List[str] = []
+    while not records.empty():
+        output.append(records.get_nowait().msg)
+    return output
+
+
+def test_enqueue_handler_policy_error() -> None:
+    """Confirm an unsupported overflow policy raises ValueError."""
+    with pytest.raises(ValueError):
+        EnqueueHandler(queue.Queue(), "explode")
+
+
+def test_enqueue_drop_newest() -> None:
+    """Test that records beyond capacity are discarded and counted."""
+    records: queue.Queue[Any] = queue.Queue(2)
+    handler = EnqueueHandler(records, OVERFLOW_DROP_NEWEST)
+    for n in range(5):
+        handler.handle(_record(str(n)))
+
+    assert handler.dropped == 3, "Expected three records to be dropped."
+    assert _drain(records) == ["0", "1"], "Expected oldest records to be kept."
+
+
+def test_enqueue_drop_oldest() -> None:
+    """Test that the oldest records are evicted to make room for newer records."""
+    records: queue.Queue[Any] = queue.Queue(2)
+    handler = EnqueueHandler(records, OVERFLOW_DROP_OLDEST)
+    for n in range(5):
+        handler.handle(_record(str(n)))
+
+    assert handler.dropped == 3, "Expected three records to be dropped."
+    assert _drain(records) == ["3", "4"], "Expected newest records to be kept."
+
+
+def test_enqueue_block() -> None:
+    """Test that a blocking policy waits for the queue to make room."""
+    records: queue.Queue[Any] = queue.Queue(1)
+    handler = EnqueueHandler(records, OVERFLOW_BLOCK)
+    handler.handle(_record("first"))
+
+    thread = threading.Thread(target=handler.handle, args=(_record("second"),))
+    thread.start()
+    thread.join(0.05)
+    assert thread.is_alive(), "Expected producer to block on a full queue."
+
+    assert records.get_nowait().msg == "first"
+    thread.join()
+    assert records.get_nowait().msg == "second"
+    assert handler.dropped == 0, "Expected no records to be dropped."
+
+
+def test_listener_flush_and_stop() -> None:
+    """Test listener writes records to handler, and stop is idempotent."""
+    with StringIO() as stream:
+        records: queue.Queue[Any] = queue.Queue()
+        listener = QueueListener(records, logging.StreamHandler(stream))
+        handler = EnqueueHandler(records)
+        listener.start()
+        listener.start()
+        assert listener.running, "Expected listener thread to be running."
+
+        for n in range(100):
+            handler.handle(_record(f"message {n}"))
+        listener.flush()
+        assert stream.getvalue().count("\n") == 100, "Expected all records written."
+
+        listener.stop()
+        listener.stop()
+        assert not listener.running, "Expected listener thread to be stopped."
+
+
+def test_listener_swap() -> None:
+    """Test pending records are written to previous handler before swapping."""
+    with StringIO() as stream_a, StringIO() as stream_b:
+        records: queue.Queue[Any] = queue.Queue()
+        listener = QueueListener(records, logging.StreamHandler(stream_a))
+        handler = EnqueueHandler(records)
+        listener.start()
+
+        handler.handle(_record("before"))
+        listener.swap(logging.StreamHandler(stream_b))
+        handler.handle(_record("after"))
+        listener.stop()
+
+        assert stream_a.getvalue() == "before\n"
+        assert stream_b.getvalue() == "after\n"
+
+
+class _CountingStream(StringIO):
+    """StringIO which counts the number of write calls."""
+
+    writes: int = 0
+
+    def write(self, s: str) -> int:
+        self.writes += 1
+        return super().write(s)
+
+
+def test_batching_records_threshold() -> None:
+    """Test records are written as a single batch once record threshold is hit."""
+    with _CountingStream() as stream:
+        handler = BatchingHandler(stream, max_records=10, max_latency=None)
+        for n in range(9):
+            handler.handle(_record(str(n)))
+        assert stream.writes == 0, "Expected records to remain buffered."
+
+        handler.handle(_record("9"))
+        assert stream.writes == 1, "Expected a single batch write."
+        assert stream.getvalue() == "".join(f"{n}\n" for n in range(10))
+        assert handler.stats.reasons == {"records": 1}
+        assert handler.stats.max_batch == 10
+        handler.close()
+
+
+def test_batching_bytes_threshold() -> None:
+    """Test records are written once the buffer size threshold is hit."""
+    with _CountingStream() as stream:
+        handler = BatchingHandler(stream, max_bytes=20, max_latency=None)
+        handler.handle(_record("a" * 9))
+        assert stream.writes == 0, "Expected records to remain buffered."
+        handler.handle(_record("b" * 9))
+        assert stream.writes == 1, "Expected a single batch write."
+        assert handler.stats.reasons == {"bytes": 1}
+        assert handler.stats.size == 20
+        handler.close()
+
+
+def test_batching_flush_level() -> None:
+    """Test a record at or above flush level is written immediately with batch."""
+    with _CountingStream() as stream:
+        handler = BatchingHandler(stream, max_latency=None)
+        handler.handle(_record("info"))
+        handler.handle(_record("error", logging.ERROR))
+        assert stream.writes == 1, "Expected a single batch write."
+        assert stream.getvalue() == "info\nerror\n"
+        assert handler.stats.reasons == {"level": 1}
+        handler.close()
+
+
+def test_batching_latency() -> None:
+    """Test the timer thread writes buffered records after max latency."""
+    with _CountingStream() as stream:
+        handler = BatchingHandler(stream, max_latency=0.01)
+        handler.handle(_record("late"))
+
+        deadline = time.monotonic() + 5
+        while not stream.writes and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+        assert stream.getvalue() == "late\n", "Expected timer to write batch."
+        assert handler.stats.reasons == {"latency": 1}
+        handler.close()
+        assert handler._timer is None, "Expected timer thread to be stopped."
+
+
+def test_batching_shutdown_expired() -> None:
+    """Test close with the lock held (as by logging.shutdown) past the deadline."""
+    with _CountingStream() as stream:
+        handler = BatchingHandler(stream, max_latency=0.01)
+        handler.handle(_record("expired"))
+
+        def shutdown() -> None:
+            handler.acquire()
+            try:
+                time.sleep(0.05)  # timer now waits on the held lock
+                handler.flush()
+                handler.close()
+            finally:
+                handler.release()
+
+        thread = threading.Thread(target=shutdown, daemon=True)
+        thread.start()
+        thread.join(5)
+        assert not thread.is_alive(), "Expected close not to deadlock."
+        assert stream.getvalue() == "expired\n"
+        assert handler._timer is None
+
+
+def test_batching_close_writes_buffer() -> None:
+    """Test closing the handler writes remaining buffered records."""
+    with StringIO() as stream:
+        handler = BatchingHandler(stream)
+        handler.handle(_record("pending"))
+        handler.close()
+        assert stream.getvalue() == "pending\n"
+        assert handler.stats.reasons == {"flush": 1}
+
+
+def test_batching_stats() -> None:
+    """Test mean statistics of batches."""
+    stats = BatchStats()
+    assert stats.mean_batch == 0.0
+    assert stats.mean_latency_ns == 0.0
+
+    stats.update(records=4, size=10, latency_ns=100, reason="records")
+    stats.update(records=2, size=10, latency_ns=300, reason="flush")
+    assert stats.mean_batch == 3.0
+    assert stats.mean_latency_ns == 200.0
+    assert stats.max_latency_ns == 300
+
+
+def test_batching_manager_stream(build_manager: Callable[..., EpiLog]) -> None:
+    """Test EpiLog can use a batching handler as its stream."""
+    with StringIO() as stream:
+        handler = BatchingHandler(stream, max_latency=None)
+        manager: EpiLog = build_manager(
+            stream=handler, formatter=logging.Formatter("%(message)s")
+        )
+        log = manager.get_logger("batching")
+        log.info("one")
+        log.info("two")
+        assert stream.getvalue() == "", "Expected records to remain buffered."
+
+        manager.remove(log)
+        assert stream.getvalue() == "one\ntwo\n", "Expected remove to flush."
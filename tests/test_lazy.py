@@ -0,0 +1,138 @@
+"""Test Expected Behavior of the EpiLog Lazy Module."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from io import StringIO
+from typing import Callable
+
+from EpiLog import EpiLog
+from EpiLog.lazy import LAZY_ARGS, Lazy
+
+
+class _Calls:
+    """Callable returning a fixed value, counting its calls."""
+
+    def __init__(self, value: object) -> None:
+        self.value = value
+        self.calls: int = 0
+
+    def __call__(self) -> object:
+        self.calls += 1
+        return self.value
+
+
+def test_lazy_conversions() -> None:
+    """Test a lazy value converts, and formats, as the value it wraps."""
+    calls = _Calls(255)
+    value = Lazy(calls)
+    assert not value.evaluated
+    assert "%s %r %d %x %.1f" % (value, value, value, value, value) == (
+        "255 255 255 ff 255.0"
+    )
+    assert f"{value:>5}" == "  255"
+    assert int(value) == 255 and float(value) == 255.0
+    assert value.evaluated and calls.calls == 1
+
+    assert "abcdef"[Lazy(len, "abc")] == "d"
+    assert str(Lazy(",".join, ["a", "b"])) == "a,b"
+    assert repr(Lazy(dict, key=1)) == "{'key': 1}"
+
+
+def test_lazy_concurrent() -> None:
+    """Test a slow lazy value does not block evaluation of others."""
+    release = threading.Event()
+    slow = Lazy(release.wait, 10)
+    worker = threading.Thread(target=str, args=(slow,))
+    worker.start()
+    try:
+        other = threading.Thread(target=str, args=(Lazy(int, 1),))
+        other.start()
+        other.join(timeout=1)
+        assert not other.is_alive(), "Expected unrelated lazy values to evaluate."
+        assert not slow.evaluated
+    finally:
+        release.set()
+        worker.join()
+
+    assert slow.value is True
+
+
+def test_manager_lazy(
+    stream: StringIO,
+    stream_manager: Callable[..., EpiLog],
+) -> None:
+    """Test lambda arguments are evaluated once, only for emitted records."""
+    manager: EpiLog = stream_manager(lazy=True)
+    manager.attach(logging.StreamHandler(stream))
+    log: logging.Logger = manager.get_logger("lazy_manager")
+
+    disabled = _Calls("hidden")
+    log.debug("disabled %s", lambda: str(disabled()))
+    assert disabled.calls == 0
+
+    emitted = _Calls("shown")
+    log.info("emitted %s", lambda: str(emitted()))
+    assert emitted.calls == 1, "Expected a single evaluation for both handlers."
+    assert stream.getvalue().count("INFO | emitted shown\n") == 2
+
+    log.info("mapping %(n)d", {"n": lambda: 7})
+    assert "INFO | mapping 7\n" in stream.getvalue()
+
+    filtered = _Calls("filtered")
+    log.addFilter(lambda record: False)
+    log.info("filtered %s", lambda: str(filtered()))
+    assert filtered.calls == 0
+
+
+def test_manager_lazy_callables(
+    stream: StringIO,
+    stream_manager: Callable[..., EpiLog],
+) -> None:
+    """Test classes, builtins, and other callables are never called."""
+
+    class Constructed:
+        instances: int = 0
+
+        def __init__(self) -> None:
+            Constructed.instances += 1
+
+    manager: EpiLog = stream_manager(lazy=True)
+    log: logging.Logger = manager.get_logger("lazy_callables")
+    calls = _Calls("value")
+    log.info("cls %s", Constructed)
+    log.info("func %s", len)
+    log.info("object %s", calls)
+    log.info("argument %s", lambda x: x)
+
+    output: str = stream.getvalue()
+    assert Constructed.instances == 0 and calls.calls == 0
+    assert "INFO | cls <class " in output
+    assert "INFO | func <built-in function len>\n" in output
+    assert "_Calls object" in output
+    assert "<lambda>" in output
+
+
+def test_manager_lazy_setter(
+    stream: StringIO,
+    stream_manager: Callable[..., EpiLog],
+) -> None:
+    """Test lambdas are plain arguments unless enabled, and restored on removal."""
+    manager: EpiLog = stream_manager()
+    log: logging.Logger = manager.get_logger("lazy_setter")
+    assert LAZY_ARGS not in log.filters
+
+    calls = _Calls("value")
+    log.info("%s", lambda: str(calls()))
+    assert calls.calls == 0 and "<lambda>" in stream.getvalue()
+
+    manager.lazy = True
+    assert LAZY_ARGS in log.filters
+    log.info("%s", lambda: str(calls()))
+    log.info("%s", Lazy(calls))
+    assert calls.calls == 2
+    assert stream.getvalue().endswith("INFO | value\nINFO | value\n")
+
+    manager.remove(log)
+    assert LAZY_ARGS not in log.filters
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from io import IOBase, StringIO
 from typing import Callable, Optional, Tuple, Union
 
@@ -327,3 +329,220 @@ def test_log_removal_with_protected_streams(
     second_handler: logging.StreamHandler = _handle_second_removal(stream, log, manager)
     assert not stream.closed, "Expected protected stream to remain open."
     assert not second_handler.stream.closed, "Expected protected stream to remain open."
+
+
+def test_queued_stream(build_manager: Callable[..., EpiLog]) -> None:
+    """Test that a queued manager writes records from a background listener."""
+    with StringIO() as stream:
+        handler = logging.StreamHandler(stream)
+        manager: EpiLog = build_manager(stream=handler, queued=True)
+        assert manager.queued, "Expected manager to be queued."
+
+        log: logging.Logger = manager.get_logger("queued")
+        assert handler not in log.handlers, "Expected logger to enqueue records."
+
+        message: str = "Don't worry, the Wizard will be back any day now."
+        log.info(message)
+        manager.flush()
+        _assert_msg_in_output(stream, message)
+
+        manager.remove(log)
+        listener = manager._listener
+        assert listener is not None and not listener.running, "Expected stop."
+
+
+def test_queued_stream_change(build_manager: Callable[..., EpiLog]) -> None:
+    """Tests that hot swapping the stream of a queued manager writes to new stream."""
+    with StringIO() as stream_a, StringIO() as stream_b:
+        manager: EpiLog = build_manager(
+            stream=logging.StreamHandler(stream_a),
+            formatter=logging.Formatter("%(message)s"),
+            queued=True,
+        )
+        log: logging.Logger = manager.get_logger("queued_swap")
+        log.info("first")
+        manager.stream = logging.StreamHandler(stream_b)
+        log.info("second")
+        manager.remove(log)
+
+        assert stream_a.getvalue() == "first\n", "Unexpected output in first stream."
+        assert stream_b.getvalue() == "second\n", "Unexpected output in second stream."
+
+
+def test_queued_level_change(build_manager: Callable[..., EpiLog]) -> None:
+    """Tests that level changes apply to queued records."""
+    with StringIO() as stream:
+        manager: EpiLog = build_manager(
+            level=logging.INFO,
+            stream=logging.StreamHandler(stream),
+            queued=True,
+        )
+        log: logging.Logger = manager.get_logger("queued_level")
+        log.debug("hidden")
+        manager.level = logging.DEBUG
+        log.debug("visible")
+        manager.flush()
+
+        assert "hidden" not in stream.getvalue(), "Expected debug to be filtered."
+        assert "visible" in stream.getvalue(), "Expected debug to be written."
+
+
+def test_queued_dropped(build_manager: Callable[..., EpiLog]) -> None:
+    """Test the dropped counter of an unqueued and a bounded queued manager."""
+    assert build_manager().dropped == 0, "Expected no records dropped."
+
+    manager: EpiLog = build_manager(queued=True, maxsize=1, overflow="drop-newest")
+    assert manager.dropped == 0, "Expected no records dropped."
+
+
+def test_queued_overflow_error(build_manager: Callable[..., EpiLog]) -> None:
+    """Test ValueError is raised when instantiating with invalid overflow policy."""
+    with pytest.raises(ValueError):
+        build_manager(queued=True, overflow="explode")
+
+
+def test_stream_reassign(build_manager: Callable[..., EpiLog]) -> None:
+    """Test assigning the current stream again leaves loggers attached."""
+    manager: EpiLog = build_manager()
+    log: logging.Logger = manager.get_logger("stream_reassign")
+    manager.stream = manager.stream
+    assert log.handlers == [manager.stream]
+
+
+def test_namespace(build_manager: Callable[..., EpiLog]) -> None:
+    """Test namespaced loggers share the handler and level of a parent logger."""
+    with StringIO() as stream:
+        manager: EpiLog = build_manager(
+            level=logging.INFO,
+            stream=logging.StreamHandler(stream),
+            formatter=logging.Formatter("%(name)s | %(message)s"),
+            namespace=True,
+        )
+        parent: Optional[logging.Logger] = manager.parent
+        assert parent is not None and parent.handlers == [manager.stream]
+
+        log: logging.Logger = manager.get_logger("namespace.child")
+        assert log.parent is parent
+        assert log.handlers == [], "Expected handler held by parent only."
+        assert log.getEffectiveLevel() == logging.INFO
+
+        log.debug("hidden")
+        manager.level = logging.DEBUG
+        log.debug("visible")
+        manager.formatter = logging.Formatter("%(levelname)s | %(message)s")
+        log.info("formatted")
+
+        output: str = stream.getvalue()
+        assert "hidden" not in output
+        assert "namespace.child | visible\n" in output, "Expected unchanged name."
+        assert "INFO | formatted\n" in output
+
+
+def test_namespace_stream(build_manager: Callable[..., EpiLog]) -> None:
+    """Test stream replacement, and removal of namespaced loggers."""
+    with StringIO() as stream_a, StringIO() as stream_b:
+        formatter = logging.Formatter("%(message)s")
+        manager: EpiLog = build_manager(
+            stream=logging.StreamHandler(stream_a),
+            formatter=formatter,
+            namespace=True,
+        )
+        log: logging.Logger = manager.get_logger("namespace_stream")
+        log.info("first")
+        manager.stream = logging.StreamHandler(stream_b)
+        log.info("second")
+
+        assert manager.parent is not None
+        assert manager.parent.handlers == [manager.stream]
+        assert stream_a.getvalue() == "first\n"
+        assert stream_b.getvalue() == "second\n"
+
+        manager.remove(log)
+        assert log.parent is logging.root, "Expected logger detached from parent."
+        assert not manager.stream.stream.closed, "Expected shared stream open."
+
+
+def test_names(build_manager: Callable[..., EpiLog]) -> None:
+    """Test names are sorted, and matched by dotted prefix."""
+    manager: EpiLog = build_manager()
+    for name in ("job.1", "job.10", "job.1.task.2", "job.1-x", "job.1.task.1", "job"):
+        manager.get_logger(name)
+
+    assert manager.names() == sorted(manager.loggers)
+    assert manager.names("job.1") == ["job.1", "job.1.task.1", "job.1.task.2"]
+    assert manager.names("job.1.task") == ["job.1.task.1", "job.1.task.2"]
+    assert manager.names("job.2") == []
+    assert manager.names("jo") == []
+
+
+def test_remove_prefix(build_manager: Callable[..., EpiLog]) -> None:
+    """Test loggers are removed by dotted prefix, flushing the shared stream."""
+    with StringIO() as stream:
+        manager: EpiLog = build_manager(
+            stream=logging.StreamHandler(stream),
+            formatter=logging.Formatter("%(message)s"),
+            queued=True,
+        )
+        for n in range(5):
+            manager.get_logger(f"bulk.{n}.task").info(f"task {n}")
+        kept: logging.Logger = manager.get_logger("bulk_kept")
+
+        removed = manager.remove_prefix("bulk")
+        assert removed == [f"bulk.{n}.task" for n in range(5)]
+        assert manager.names() == ["bulk_kept"]
+        assert all(name not in logging.Logger.manager.loggerDict for name in removed)
+        assert stream.getvalue().count("task") == 5, "Expected flush on removal."
+        assert manager.remove_prefix("bulk") == []
+
+        manager.remove(kept)
+        assert not manager.names()
+
+
+def test_remove_many(build_manager: Callable[..., EpiLog]) -> None:
+    """Test loggers are removed by a list of names or instances, or entirely."""
+    manager: EpiLog = build_manager()
+    logs = [manager.get_logger(f"many.{n}") for n in range(6)]
+
+    with pytest.raises(KeyError):
+        manager.remove_many(["many.0", "unknown"])
+    assert len(manager.loggers) == 6, "Expected no loggers removed."
+
+    manager.remove_many([logs[0], "many.1"])
+    assert manager.names() == [f"many.{n}" for n in range(2, 6)]
+
+    manager.clear()
+    assert not manager.loggers and not manager.names()
+    assert all(log.name not in logging.Logger.manager.loggerDict for log in logs)
+
+
+def test_concurrent_registry(build_manager: Callable[..., EpiLog]) -> None:
+    """Test dispatch, removal and reconfiguration are safe across threads."""
+    with StringIO() as stream:
+        handlers = [logging.StreamHandler(stream) for _ in range(2)]
+        manager: EpiLog = build_manager(stream=handlers[0])
+        barrier = threading.Barrier(64)
+
+        def worker(n: int) -> None:
+            barrier.wait()
+            for i in range(200):
+                log: logging.Logger = manager.get_logger(f"stress.{(n + i) % 16}")
+                log.debug("message %d", i)
+                if n % 16 == 0 and i % 20 == 0:
+                    manager.level = (logging.DEBUG, logging.INFO)[i % 40 == 0]
+                    manager.formatter = logging.Formatter("%(message)s")
+                    manager.stream = handlers[i % 40 == 0]
+                if n % 32 == 1 and i % 50 == 0:
+                    manager.remove_prefix("stress")
+
+        interval: float = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # Encourage thread switches within races
+        try:
+            with ThreadPoolExecutor(64) as pool:
+                list(pool.map(worker, range(64)))
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert manager.names() == sorted(manager.loggers)
+        for log in manager.loggers.values():
+            assert log.handlers == [manager.stream], "Expected a single handler."
+            assert log.level == manager.level
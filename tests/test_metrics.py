@@ -0,0 +1,150 @@
+"""Test Expected Behavior of the EpiLog Metrics Module."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Callable, List
+
+import pytest
+
+from EpiLog import EpiLog
+from EpiLog.benchmark import BenchMark
+from EpiLog.metrics import (
+    CONTENT_TYPE,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    metric_name,
+)
+
+
+def test_metric_name() -> None:
+    """Test descriptions are sanitized into valid metric names."""
+    assert metric_name("Handle request") == "handle_request"
+    assert metric_name("GET /items (v2)") == "get_items_v2"
+    assert metric_name("2nd pass") == "_2nd_pass"
+
+
+def test_registry_keys() -> None:
+    """Test metrics are keyed by name and labels, of a single kind per name."""
+    registry = MetricsRegistry()
+    first: Histogram = registry.histogram("query", {"table": "a", "db": "x"})
+    assert registry.histogram("Query", {"db": "x", "table": "a"}) is first
+    assert registry.histogram("query", {"table": "b", "db": "x"}) is not first
+    assert isinstance(registry.counter("errors"), Counter)
+
+    with pytest.raises(ValueError):
+        registry.counter("query")
+    with pytest.raises(ValueError):
+        registry.counter("errors", {"bad-label": "x"})
+    with pytest.raises(ValueError):
+        registry.histogram("unordered", buckets=(10, 1))
+
+
+def test_metrics_threads() -> None:
+    """Test per thread updates are merged without losing any."""
+    registry = MetricsRegistry()
+    counter: Counter = registry.counter("events")
+    histogram: Histogram = registry.histogram("latency")
+
+    def worker() -> None:
+        for n in range(1_000):
+            counter.inc()
+            histogram.add(n)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert counter.value == 8_000
+    assert histogram.count == 8_000
+
+
+def test_render() -> None:
+    """Test metrics are rendered in the OpenMetrics text format."""
+    registry = MetricsRegistry()
+    histogram: Histogram = registry.histogram("Parse", {"kind": 'q"x'}, (1_000, 10_000))
+    for value in (500, 5_000, 50_000):
+        histogram.add(value)
+    registry.counter("parse errors").inc(2)
+
+    assert registry.render().splitlines() == [
+        "# TYPE parse_seconds histogram",
+        "# UNIT parse_seconds seconds",
+        'parse_seconds_bucket{kind="q\\"x",le="1e-06"} 1',
+        'parse_seconds_bucket{kind="q\\"x",le="1e-05"} 2',
+        'parse_seconds_bucket{kind="q\\"x",le="+Inf"} 3',
+        'parse_seconds_count{kind="q\\"x"} 3',
+        'parse_seconds_sum{kind="q\\"x"} 5.55e-05',
+        "# TYPE parse_errors counter",
+        "parse_errors_total 2",
+        "# EOF",
+    ]
+
+
+def test_benchmark_histogram(build_manager: Callable[..., EpiLog]) -> None:
+    """Test a BenchMark reports durations directly into a histogram."""
+    manager: EpiLog = build_manager(stream=logging.NullHandler())
+    log: logging.Logger = manager.get_logger("metrics.benchmark")
+    registry = MetricsRegistry()
+    for _ in range(3):
+        with BenchMark(log, "timed", aggregate=registry.histogram("timed")):
+            ...
+
+    assert registry.histogram("timed").count == 3
+
+
+def test_write(tmp_path) -> None:
+    """Test metrics are written to a file, replacing it without temporary files."""
+    registry = MetricsRegistry()
+    counter: Counter = registry.counter("writes")
+    path = tmp_path / "metrics.prom"
+    registry.write(path)
+    counter.inc()
+    registry.write(path)
+
+    assert "writes_total 1\n" in path.read_text()
+    assert os.listdir(tmp_path) == ["metrics.prom"]
+
+
+def test_schedule(tmp_path) -> None:
+    """Test metrics are written on a schedule, and once more when stopped."""
+    registry = MetricsRegistry()
+    counter: Counter = registry.counter("ticks")
+    path = tmp_path / "metrics.prom"
+    writer = registry.schedule(path, interval=0.01)
+    deadline: float = time.monotonic() + 5
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert path.exists()
+
+    counter.inc(3)
+    writer.stop()
+    assert not writer.is_alive()
+    assert "ticks_total 3\n" in path.read_text()
+
+
+def test_serve() -> None:
+    """Test metrics are served over HTTP from localhost."""
+    registry = MetricsRegistry()
+    registry.counter("requests").inc()
+    server = registry.serve()
+    try:
+        assert server.url.startswith("http://127.0.0.1:")
+        with urllib.request.urlopen(server.url, timeout=5) as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            lines: List[str] = response.read().decode().splitlines()
+        assert "requests_total 1" in lines
+        assert lines[-1] == "# EOF"
+
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(server.url + "/other", timeout=5)
+    finally:
+        server.close()
@@ -0,0 +1,148 @@
+"""Test Expected Behavior of the EpiLog Multiproc Module."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+from typing import Callable, Dict, List, Optional
+
+import pytest
+
+from EpiLog import EpiLog
+from EpiLog.multiproc import (
+    ShippingHandler,
+    init_worker,
+    rebuild,
+    ship,
+    worker_queue,
+)
+
+
+WORKER_LOGGER: str = "multiproc_worker"
+FORMAT: str = "%(name)s | %(levelname)s | %(message)s"
+_worker: Dict[str, logging.Logger] = {}
+
+
+def _work(n: int) -> int:
+    """Log a series of messages from within a worker process."""
+    log: Optional[logging.Logger] = _worker.get("log")
+    if log is None:
+        log = _worker["log"] = EpiLog(logging.DEBUG).get_logger(WORKER_LOGGER)
+    for i in range(10):
+        log.info("task %d message %d", n, i)
+    return n
+
+
+def _inherited(n: int) -> int:
+    """Log through a logger inherited from the (forked) parent manager."""
+    logging.getLogger("multiproc_parent").warning("inherited %d", n)
+    return n
+
+
+def test_ship_rebuild() -> None:
+    """Test a shipped record is picklable, and formats as the original record."""
+    formatter = logging.Formatter("%(levelname)s | %(process)d | %(message)s")
+
+    class Unpicklable:
+        def __reduce__(self):
+            raise TypeError("Cannot pickle")
+
+        def __str__(self) -> str:
+            return "unpicklable"
+
+    try:
+        raise ValueError("shipped")
+    except ValueError:
+        record = logging.LogRecord(
+            "ship", logging.ERROR, __file__, 1, "%s!", (Unpicklable(),), sys.exc_info()
+        )
+
+    data = pickle.loads(pickle.dumps(ship(record)))
+    assert "args" not in data and "exc_info" not in data
+    rebuilt: logging.LogRecord = rebuild(data)
+    assert rebuilt.getMessage() == "unpicklable!"
+
+    output: str = formatter.format(rebuilt)
+    assert output.startswith(f"ERROR | {record.process} | unpicklable!")
+    assert "ValueError: shipped" in output
+
+
+def test_worker_args(build_manager: Callable[..., EpiLog]) -> None:
+    """Test ValueError is raised for worker arguments without a collector."""
+    manager: EpiLog = build_manager()
+    with pytest.raises(ValueError):
+        _ = manager.worker_args
+
+
+@pytest.mark.parametrize(
+    "method",
+    [m for m in ("fork", "spawn") if m in multiprocessing.get_all_start_methods()],
+)
+def test_collect_pool(
+    stream: StringIO,
+    stream_manager: Callable[..., EpiLog],
+    method: str,
+) -> None:
+    """Test records of a process pool are written in order through parent stream."""
+    ctx = multiprocessing.get_context(method)
+    manager: EpiLog = stream_manager(FORMAT, collect=True, context=ctx)
+    log: logging.Logger = manager.get_logger("multiproc_parent")
+    log.info("parent started")
+
+    with ProcessPoolExecutor(
+        2, mp_context=ctx, initializer=init_worker, initargs=manager.worker_args
+    ) as pool:
+        assert sorted(pool.map(_work, range(4))) == list(range(4))
+
+    manager.flush()
+    lines: List[str] = stream.getvalue().splitlines()
+    assert lines[0] == "multiproc_parent | INFO | parent started"
+
+    shipped = [line for line in lines if line.startswith(WORKER_LOGGER)]
+    assert len(shipped) == 40, "Expected every worker record."
+    for n in range(4):
+        expected = [f"{WORKER_LOGGER} | INFO | task {n} message {i}" for i in range(10)]
+        assert [line for line in shipped if f"task {n} " in line] == expected
+
+    assert worker_queue() is None, "Expected parent process to remain a collector."
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="Requires fork."
+)
+def test_collect_forked_manager(
+    stream: StringIO,
+    stream_manager: Callable[..., EpiLog],
+) -> None:
+    """Test loggers of a manager inherited by a forked worker ship records."""
+    ctx = multiprocessing.get_context("fork")
+    manager: EpiLog = stream_manager(FORMAT, collect=True, context=ctx, queued=True)
+    manager.get_logger("multiproc_parent")
+
+    with ProcessPoolExecutor(
+        1, mp_context=ctx, initializer=init_worker, initargs=manager.worker_args
+    ) as pool:
+        list(pool.map(_inherited, range(3)))
+
+    manager.flush()
+    output: str = stream.getvalue()
+    for n in range(3):
+        assert f"multiproc_parent | WARNING | inherited {n}\n" in output
+
+
+def test_shipping_handler_error() -> None:
+    """Test a failure to ship a record is handled by the handler."""
+
+    class Closed:
+        def put_nowait(self, item: object) -> None:
+            raise ValueError("Queue is closed")
+
+    handler = ShippingHandler(Closed())
+    errors: List[logging.LogRecord] = []
+    handler.handleError = errors.append  # type: ignore[method-assign]
+    handler.handle(logging.makeLogRecord({"msg": "lost"}))
+    assert len(errors) == 1
@@ -0,0 +1,177 @@
+"""Test Expected Behavior of the EpiLog Recorder Module."""
+
+from __future__ import annotations
+
+import logging
+import os
+from io import StringIO
+from typing import Callable, List
+
+import pytest
+
+from EpiLog import EpiLog
+from EpiLog.recorder import HEADER, FlightRecorder
+
+from .conftest import _record
+
+
+@pytest.fixture
+def recorder(tmp_path) -> Callable[..., FlightRecorder]:
+    """Construct flight recorders within a temporary directory."""
+    instances: List[FlightRecorder] = []
+
+    def builder(name: str = "ring", **kwargs) -> FlightRecorder:
+        instance = FlightRecorder(tmp_path / name, **kwargs)
+        instance.setFormatter(logging.Formatter("%(levelname)s | %(message)s"))
+        instances.append(instance)
+        return instance
+
+    yield builder
+
+    for instance in instances:
+        instance.close()
+
+
+def test_recorder_entries(recorder: Callable[..., FlightRecorder]) -> None:
+    """Test entries are retained from oldest to newest."""
+    ring: FlightRecorder = recorder(size=1024, trigger=None)
+    for n in range(3):
+        ring.handle(_record(f"message {n}"))
+
+    assert ring.entries() == [f"INFO | message {n}" for n in range(3)]
+    assert os.path.getsize(ring.filename) == HEADER.size + 1024
+
+
+def test_recorder_wraparound(recorder: Callable[..., FlightRecorder]) -> None:
+    """Test oldest entries are overwritten, retaining only complete entries."""
+    ring: FlightRecorder = recorder(size=256, trigger=None)
+    for n in range(100):
+        ring.handle(_record(f"message {n:03d}"))
+
+    entries: List[str] = ring.entries()
+    expected: List[str] = [f"INFO | message {n:03d}" for n in range(100)]
+    assert 0 < len(entries) < 100
+    assert entries == expected[-len(entries) :], "Expected newest entries in order."
+    assert sum(len(e) + 1 for e in entries) <= 256
+
+
+def test_recorder_oversized(recorder: Callable[..., FlightRecorder]) -> None:
+    """Test an entry larger than the ring retains its tail."""
+    ring: FlightRecorder = recorder(size=64, trigger=None)
+    ring.write("x" * 100 + "tail")
+    entries: List[str] = ring.entries()
+    assert len(entries) == 1
+    assert entries[0].endswith("tail")
+
+
+def test_recorder_trigger(recorder: Callable[..., FlightRecorder]) -> None:
+    """Test ring is dumped to a target, and cleared, on a trigger level record."""
+    target = StringIO()
+    ring: FlightRecorder = recorder(trigger=logging.ERROR, target=target)
+    ring.handle(_record("context", logging.DEBUG))
+    assert target.getvalue() == ""
+
+    ring.handle(_record("failure", logging.ERROR))
+    output: str = target.getvalue()
+    assert "flight recorder" in output and "2 records" in output
+    assert output.index("DEBUG | context") < output.index("ERROR | failure")
+    assert ring.entries() == [], "Expected ring cleared after dump."
+
+
+def test_recorder_dump_path(
+    recorder: Callable[..., FlightRecorder],
+    tmp_path,
+) -> None:
+    """Test ring is dumped on demand to a file path."""
+    ring: FlightRecorder = recorder(trigger=None)
+    ring.handle(_record("on demand"))
+
+    path = tmp_path / "dump.log"
+    assert ring.dump(path) == 1
+    assert ring.dump(path) == 0, "Expected nothing to dump after clearing."
+    assert "INFO | on demand\n" in path.read_text()
+
+
+def test_recorder_recover(recorder: Callable[..., FlightRecorder]) -> None:
+    """Test entries are recovered from the file of an unclosed ring."""
+    ring: FlightRecorder = recorder(size=128, trigger=None)
+    for n in range(20):
+        ring.handle(_record(f"before crash {n}"))
+
+    # NOTE: ring is not flushed nor closed, as would be the case of a crash
+    recovered: List[str] = FlightRecorder.read(ring.filename)
+    assert recovered == ring.entries()
+    assert recovered[-1] == "INFO | before crash 19"
+
+
+def test_recorder_continue(recorder: Callable[..., FlightRecorder]) -> None:
+    """Test an existing ring of equal size is continued, otherwise reset."""
+    first: FlightRecorder = recorder(size=512, trigger=None)
+    first.handle(_record("first"))
+    first.close()
+
+    second: FlightRecorder = recorder(size=512, trigger=None)
+    second.handle(_record("second"))
+    assert second.entries() == ["INFO | first", "INFO | second"]
+    second.close()
+
+    third: FlightRecorder = recorder(size=1024, trigger=None)
+    assert third.entries() == []
+
+
+def test_recorder_errors(tmp_path) -> None:
+    """Test ValueError is raised with unsupported sizes, or non recorder files."""
+    with pytest.raises(ValueError):
+        FlightRecorder(tmp_path / "small", size=1)
+
+    path = tmp_path / "other"
+    path.write_bytes(b"not a ring buffer" * 4)
+    with pytest.raises(ValueError):
+        FlightRecorder.read(path)
+
+    path.write_bytes(b"short")
+    with pytest.raises(ValueError):
+        FlightRecorder.read(path)
+
+
+def test_manager_attach(
+    build_manager: Callable[..., EpiLog],
+    recorder: Callable[..., FlightRecorder],
+) -> None:
+    """Test records below manager level are retained by an attached recorder."""
+    with StringIO() as stream:
+        handler = logging.StreamHandler(stream)
+        ring: FlightRecorder = recorder(trigger=logging.ERROR, target=handler)
+        manager: EpiLog = build_manager(
+            logging.INFO,
+            stream=handler,
+            formatter=logging.Formatter("%(levelname)s | %(message)s"),
+        )
+        log: logging.Logger = manager.get_logger("recorder_attach")
+        assert log.level == logging.INFO
+
+        manager.attach(ring)
+        assert manager.handlers == (ring,)
+        assert log.level == logging.DEBUG, "Expected logger enabled for recorder."
+        assert ring in manager.get_logger("recorder_attach_late").handlers
+
+        log.debug("retained")
+        log.info("written")
+        assert "retained" not in stream.getvalue()
+        assert "INFO | written" in stream.getvalue()
+
+        manager.level = logging.WARNING
+        assert ring.level == logging.DEBUG, "Expected recorder to keep its level."
+
+        log.error("failure")
+        output: str = stream.getvalue()
+        assert "DEBUG | retained" in output
+        assert output.count("ERROR | failure") == 2, "Expected record and dump."
+
+        manager.detach(ring)
+        assert manager.handlers == ()
+        assert ring not in log.handlers
+        assert log.level == logging.WARNING
+
+        with pytest.raises(TypeError):
+            manager.attach(stream)  # type: ignore[arg-type]
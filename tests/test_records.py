@@ -0,0 +1,267 @@
+"""Test Expected Behavior of the EpiLog Records Module."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from io import StringIO
+from typing import Callable, FrozenSet, List, Optional
+
+import pytest
+
+from EpiLog import EpiLog
+from EpiLog.records import (
+    OPTIONAL_FIELDS,
+    START_TIME,
+    RecordFactory,
+    SlimRecord,
+    apply_record_factory,
+    record_fields,
+)
+
+
+class _Overridden(logging.Formatter):
+    """Formatter which overrides format, hiding which fields it uses."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return str(record.__dict__)
+
+
+class _Declared(_Overridden):
+    """Formatter which declares the record fields it uses."""
+
+    record_fields = frozenset({"taskName", "thread", "message"})
+
+
+@pytest.mark.parametrize(
+    ["formatter", "expected"],
+    [
+        (logging.Formatter("%(levelname)s | %(message)s"), frozenset()),
+        (logging.Formatter("%(asctime)s | %(message)s"), frozenset()),
+        (
+            logging.Formatter("%(threadName)s %(processName)s %(message)s"),
+            frozenset({"processName"}),
+        ),
+        (
+            logging.Formatter("{module}:{lineno} {taskName}", style="{"),
+            frozenset({"taskName"}),
+        ),
+        (_Overridden(), None),
+        (_Declared(), frozenset({"taskName"})),
+    ],
+)
+def test_record_fields(
+    formatter: logging.Formatter,
+    expected: Optional[FrozenSet[str]],
+) -> None:
+    """Test optional fields are parsed from a formatter."""
+    assert record_fields(formatter) == expected
+
+
+def test_record_factory_from_formatter() -> None:
+    """Test a factory is only derived from formatters with known fields."""
+    assert RecordFactory.from_formatter(_Overridden()) is None
+    factory = RecordFactory.from_formatter(logging.Formatter("%(processName)s"))
+    assert factory is not None and factory.fields == frozenset({"processName"})
+
+    formatters = [logging.Formatter("%(processName)s"), _Declared()]
+    factory = RecordFactory.from_formatters(formatters)
+    assert factory is not None and factory.fields == OPTIONAL_FIELDS
+    assert RecordFactory.from_formatters([*formatters, _Overridden()]) is None
+
+
+def test_slim_record_defaults() -> None:
+    """Test a slim record leaves only unreferenced optional fields as None."""
+    expected = logging.LogRecord("slim", logging.INFO, __file__, 1, "msg", (), None)
+    factory = RecordFactory()
+    record = factory("slim", logging.INFO, __file__, 1, "a %s", ("b",), None)
+
+    assert isinstance(record, SlimRecord)
+    assert record.getMessage() == "a b"
+    assert all(getattr(record, f) is None for f in OPTIONAL_FIELDS)
+    assert record.filename == expected.filename
+    assert record.module == expected.module
+    assert record.thread == expected.thread
+    assert record.threadName == expected.threadName
+    assert record.process == expected.process
+
+
+def test_slim_record_disabled() -> None:
+    """Test thread and process fields are None when disabled by logging."""
+    factory = RecordFactory()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(logging, "logThreads", False)
+        mp.setattr(logging, "logProcesses", False)
+        record = factory("slim", logging.INFO, __file__, 1, "msg", (), None)
+
+    assert record.thread is None and record.threadName is None
+    assert record.process is None
+
+
+def test_slim_record_all_fields() -> None:
+    """Test a slim record populates referenced fields as a LogRecord does."""
+    expected = logging.LogRecord("slim", logging.INFO, __file__, 1, "msg", (), None)
+    factory = RecordFactory(OPTIONAL_FIELDS)
+    record = factory("slim", logging.INFO, __file__, 1, "msg", (), None, "func")
+
+    assert record.filename == expected.filename
+    assert record.module == expected.module
+    assert record.thread == threading.get_ident()
+    assert record.threadName == expected.threadName
+    assert record.process == expected.process
+    assert record.processName == expected.processName
+    assert 0 <= record.msecs < 1000
+    # NOTE: Bounded in magnitude, as units of the logging start time vary by version
+    assert 0 <= expected.relativeCreated <= record.relativeCreated
+    assert record.relativeCreated - expected.relativeCreated < 1000
+    assert record.taskName is None, "Expected no task outside of event loop."
+    assert record.funcName == "func"
+
+
+def test_start_time() -> None:
+    """Test logging start time is normalized to seconds since the epoch."""
+    assert 0 < time.time() - START_TIME < 24 * 60 * 60
+
+
+def test_slim_record_task_name() -> None:
+    """Test task name is populated from within an asyncio task."""
+    factory = RecordFactory(frozenset({"taskName"}))
+
+    async def main() -> Optional[str]:
+        return factory("slim", logging.INFO, "", 1, "msg", (), None).taskName
+
+    assert asyncio.run(main()) is not None
+
+
+def test_slim_record_mapping_args() -> None:
+    """Test a single mapping argument is used for named formatting."""
+    factory = RecordFactory()
+    record = factory("slim", logging.INFO, "", 1, "%(a)s", ({"a": 1},), None)
+    assert record.getMessage() == "1"
+
+
+def test_slim_record_extra() -> None:
+    """Test extra keys are added, and reserved keys raise KeyError."""
+    factory = RecordFactory()
+    record = factory("slim", logging.INFO, "", 1, "msg", (), None, extra={"key": 1})
+    assert record.key == 1
+
+    for key in ("message", "name", "thread"):
+        with pytest.raises(KeyError):
+            factory("slim", logging.INFO, "", 1, "msg", (), None, extra={key: 1})
+
+
+def test_apply_record_factory() -> None:
+    """Test factory is installed onto, and restored from a logger instance."""
+    log = logging.Logger("records.apply")
+    apply_record_factory(log, RecordFactory())
+    assert isinstance(log.makeRecord("n", 20, "", 1, "m", (), None), SlimRecord)
+
+    apply_record_factory(log, None)
+    assert "makeRecord" not in vars(log)
+
+
+def test_manager_slim(
+    build_manager: Callable[..., EpiLog],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test slim factory is derived again when the manager formatter changes."""
+    # Detach handlers of pytest, whose formatters hide which fields they use.
+    monkeypatch.setattr(logging.root, "handlers", [])
+    with StringIO() as stream:
+        manager: EpiLog = build_manager(
+            stream=logging.StreamHandler(stream),
+            formatter=logging.Formatter("%(levelname)s | %(message)s"),
+            slim=True,
+        )
+        log: logging.Logger = manager.get_logger("records_slim")
+        log.info("first")
+
+        manager.formatter = logging.Formatter("%(processName)s | %(message)s")
+        log.info("second")
+
+        output: str = stream.getvalue()
+        assert "INFO | first\n" in output
+        assert "MainProcess | second\n" in output
+
+        manager.formatter = _Overridden()
+        assert "makeRecord" not in vars(log), "Expected full records."
+
+        manager.slim = False
+        manager.formatter = None
+        assert "makeRecord" not in vars(log)
+        manager.slim = True
+        assert "makeRecord" in vars(log)
+
+        manager.remove(log)
+        assert "makeRecord" not in vars(log)
+
+
+@pytest.mark.parametrize("slim", [False, True])
+def test_manager_slim_unchanged(
+    build_manager: Callable[..., EpiLog],
+    monkeypatch: pytest.MonkeyPatch,
+    slim: bool,
+) -> None:
+    """Test loggers are untouched by changes which leave the factory unchanged."""
+    monkeypatch.setattr(logging.root, "handlers", [])
+    applied: List[logging.Logger] = []
+    with StringIO() as stream:
+        manager: EpiLog = build_manager(
+            stream=logging.StreamHandler(stream),
+            formatter=logging.Formatter("%(levelname)s | %(message)s"),
+            slim=slim,
+            namespace=True,
+        )
+        for index in range(10):
+            manager.get_logger(f"records_unchanged.{index}")
+
+        monkeypatch.setattr(
+            "EpiLog.manager.apply_record_factory",
+            lambda log, factory: (
+                applied.append(log) or apply_record_factory(log, factory)
+            ),
+        )
+        manager.formatter = logging.Formatter("%(name)s | %(message)s")
+        handler = logging.StreamHandler(stream)
+        manager.attach(handler)
+        manager.detach(handler)
+        assert applied == [], "Expected no per logger work."
+
+        manager.formatter = logging.Formatter("%(processName)s | %(message)s")
+        assert len(applied) == (10 if slim else 0)
+
+
+def test_manager_slim_propagated(
+    build_manager: Callable[..., EpiLog],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test slim records are formatted by handlers reached through propagation."""
+    monkeypatch.setattr(logging.root, "handlers", [])
+    with StringIO() as stream, StringIO() as root:
+        handler = logging.StreamHandler(root)
+        handler.setFormatter(
+            logging.Formatter(
+                "%(process)d %(processName)s %(thread)d %(filename)s:%(lineno)d "
+                "%(relativeCreated)d %(asctime)s %(message)s"
+            )
+        )
+        logging.root.addHandler(handler)
+        manager: EpiLog = build_manager(
+            stream=logging.StreamHandler(stream),
+            formatter=logging.Formatter("%(levelname)s | %(message)s"),
+            slim=True,
+        )
+        log: logging.Logger = manager.get_logger("records_propagated")
+        assert isinstance(log.makeRecord, RecordFactory)
+        assert log.makeRecord.fields == frozenset({"processName"})
+        log.warning("propagated")
+
+        assert stream.getvalue() == "WARNING | propagated\n"
+        assert root.getvalue().startswith(
+            f"{os.getpid()} MainProcess {threading.get_ident()} test_records.py:"
+        )
+        assert root.getvalue().endswith(" propagated\n")
@@ -0,0 +1,124 @@
+"""Test Expected Behavior of the EpiLog Reporter Module."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from io import StringIO
+from typing import Callable, List
+
+import pytest
+
+from EpiLog import EpiLog
+from EpiLog.reporter import RecordCounter, Reporter, get_counter
+from EpiLog.stats import Accumulator, get_accumulator
+
+
+def _wait(predicate: Callable[[], bool], timeout: float = 5.0) -> bool:
+    deadline: float = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_record_counter() -> None:
+    """Test records are counted per logger across threads, since the last reset."""
+    counter = RecordCounter()
+    log = logging.Logger("reporter.counted", logging.INFO)
+    log.addFilter(counter)
+    log.addHandler(logging.NullHandler())
+
+    def worker() -> None:
+        for _ in range(100):
+            log.info("counted")
+        log.debug("below level")
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert counter.snapshot(reset=True) == {"reporter.counted": 400}
+    assert counter.snapshot() == {}
+    log.warning("again")
+    assert counter.snapshot() == {"reporter.counted": 1}
+
+
+def test_reporter_report(
+    stream: StringIO,
+    stream_manager: Callable[..., EpiLog],
+) -> None:
+    """Test a report emits and resets sources, shared accumulators and counts."""
+    manager: EpiLog = stream_manager("%(name)s | %(message)s")
+    log: logging.Logger = manager.get_logger("reporter.summary")
+    reporter = Reporter(log)
+    source = Accumulator("source")
+    reporter.register(source)
+    reporter.register(source)
+    assert reporter.sources == [source]
+
+    source.add(1_000)
+    get_accumulator("shared").add(2_000)
+    other = logging.Logger("reporter.other")
+    other.addFilter(reporter.counter)
+    for _ in range(3):
+        other.info("counted")
+    reporter.report()
+
+    lines: List[str] = stream.getvalue().splitlines()
+    assert lines[0].startswith("reporter.summary | source: (n=1")
+    assert lines[1].startswith("reporter.summary | shared: (n=1")
+    assert lines[2] == "reporter.summary | records: (reporter.other=3)"
+
+    reporter.unregister(source)
+    reporter.report()
+    assert stream.getvalue().count("\n") == 3, "Expected nothing new to report."
+    assert reporter.reports == 2
+
+    with pytest.raises(ValueError):
+        Reporter(log, interval=0)
+
+
+def test_manager_reporter(
+    stream: StringIO,
+    stream_manager: Callable[..., EpiLog],
+) -> None:
+    """Test a manager reporter reports periodically, and stops on teardown."""
+    manager: EpiLog = stream_manager("%(name)s | %(message)s")
+    log: logging.Logger = manager.get_logger("reporter.app")
+    reporter: Reporter = manager.start_reporter(interval=0.01)
+    assert manager.reporter is reporter and reporter.running
+    assert get_counter(log) is reporter.counter
+
+    log.info("first")
+    assert _wait(lambda: "records: (reporter.app=1)" in stream.getvalue())
+    assert _wait(lambda: reporter.reports >= 3)
+
+    manager.clear()
+    assert not reporter.running and manager.reporter is None
+    assert get_counter(log) is None
+
+
+def test_manager_reporter_teardown(
+    stream: StringIO,
+    stream_manager: Callable[..., EpiLog],
+) -> None:
+    """Test a reporter stops, with a final report, once no other loggers remain."""
+    manager: EpiLog = stream_manager("%(name)s | %(message)s")
+    first: Reporter = manager.start_reporter(interval=60)
+    log: logging.Logger = manager.get_logger("reporter.only")
+    second: Reporter = manager.start_reporter(interval=60)
+    assert not first.running and second.running
+    assert get_counter(log) is second.counter
+
+    log.info("last")
+    manager.remove(log)
+    assert not second.running
+    assert stream.getvalue().endswith("EpiLog.reporter | records: (reporter.only=1)\n")
+    assert "EpiLog.reporter" in manager, "Expected reporter logger to remain."
+
+    manager.start_reporter(interval=60)
+    manager.stop_reporter()
+    assert manager.reporter is None
@@ -0,0 +1,136 @@
+"""Test Expected Behavior of the EpiLog Resources Module."""
+
+from __future__ import annotations
+
+import logging
+import sys
+import time
+import tracemalloc
+from io import StringIO
+from typing import List, Tuple
+
+import pytest
+
+from EpiLog.benchmark import BenchMark
+from EpiLog.resources import (
+    CpuTime,
+    Measurement,
+    Memory,
+    ThreadTime,
+    Usage,
+    describe,
+)
+from EpiLog.units import BYTE_UNITS, NS_UNITS
+
+
+def _spin(seconds: float) -> None:
+    end: float = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        ...
+
+
+@pytest.mark.parametrize(
+    ["value", "expected"],
+    [(512, (512.0, "B")), (2048, (2.0, "KiB")), (3 * 1024**3, (3.0, "GiB"))],
+)
+def test_byte_units(value: int, expected: Tuple[float, str]) -> None:
+    """Test byte values convert to the largest relevant (binary) unit."""
+    assert BYTE_UNITS.convert_units(value) == expected
+
+
+def test_cpu_time() -> None:
+    """Test CPU time is collected while busy, and not while sleeping."""
+    for collector in (CpuTime(), ThreadTime()):
+        state = collector.start()
+        _spin(0.02)
+        (label, busy, units), *_ = collector.stop(state)
+        assert units is NS_UNITS
+        assert busy >= 5_000_000, f"Expected {label} while spinning."
+
+        state = collector.start()
+        time.sleep(0.02)
+        _, idle, _ = collector.stop(state)[0]
+        assert idle < busy
+
+
+def test_memory() -> None:
+    """Test peak and net allocations, and tracing is stopped once unused."""
+    collector = Memory()
+    assert not tracemalloc.is_tracing()
+
+    outer = collector.start()
+    inner = collector.start()
+    retained: List[bytes] = [bytes(100_000)]
+    transient = bytes(1_000_000)
+    del transient
+    measured = dict((label, value) for label, value, _ in collector.stop(inner))
+    assert tracemalloc.is_tracing(), "Expected tracing while outer use is active."
+    collector.stop(outer)
+    assert not tracemalloc.is_tracing()
+
+    assert measured["peak"] >= 1_000_000
+    assert 100_000 <= measured["net"] < 1_000_000
+    assert retained
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="getrusage is unavailable")
+def test_usage() -> None:
+    """Test getrusage counters are reported as deltas."""
+    collector = Usage()
+    state = collector.start()
+    time.sleep(0.001)
+    measured: List[Measurement] = collector.stop(state)
+
+    labels: List[str] = [label for label, _, _ in measured]
+    assert labels == ["minflt", "majflt", "nvcsw", "nivcsw", "inblock", "oublock"]
+    assert all(value >= 0 and units is None for _, value, units in measured)
+    assert Usage(thread=True).stop(None) == []
+
+
+def test_describe() -> None:
+    """Test measurements are described with relevant units, and signs."""
+    measured: List[Measurement] = [
+        ("cpu", 1_500_000, NS_UNITS),
+        ("net", -2048, BYTE_UNITS),
+        ("nvcsw", 3, None),
+    ]
+    assert describe(measured) == ["cpu=1.5000 ms", "net=-2.0000 KiB", "nvcsw=3"]
+
+
+def test_benchmark_resources(stream_construct: Tuple[StringIO, logging.Logger]) -> None:
+    """Test resource usage is reported alongside the duration of a BenchMark."""
+    stream, log = stream_construct
+    with BenchMark(log, "busy", resources=(CpuTime(), Memory())) as b:
+        _spin(0.005)
+        data = bytes(10_000)
+
+    assert data
+    assert set(b.usage) == {"cpu", "peak", "net"}
+    line: str = stream.getvalue().splitlines()[-1]
+    assert line.startswith("INFO | busy: (")
+    assert ", cpu=" in line and ", peak=" in line and ", net=" in line
+
+
+def test_benchmark_resources_disabled(
+    stream_construct: Tuple[StringIO, logging.Logger],
+) -> None:
+    """Test collectors are not started by disabled, nor aggregated BenchMarks."""
+
+    class _Counting(CpuTime):
+        starts: int = 0
+
+        def start(self) -> int:
+            _Counting.starts += 1
+            return super().start()
+
+    class _Sink:
+        def add(self, value: int) -> None: ...
+
+    _, log = stream_construct
+    collectors = (_Counting(),)
+    with BenchMark(log, "disabled", logging.DEBUG, resources=collectors) as b:
+        ...
+    with BenchMark(log, "aggregated", aggregate=_Sink(), resources=collectors):
+        ...
+    assert _Counting.starts == 0
+    assert b.usage == {}
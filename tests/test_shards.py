@@ -0,0 +1,76 @@
+"""Test Expected Behavior of the EpiLog Shards Module."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, List
+
+import pytest
+
+from EpiLog.metrics import Counter
+from EpiLog.reporter import RecordCounter
+from EpiLog.shards import Shards
+from EpiLog.stats import Accumulator
+
+
+def _fold(base: List[int], shard: List[int]) -> None:
+    base[0] += shard[0]
+
+
+def _run(target: Callable[[], None], n: int) -> None:
+    for _ in range(n // 100):
+        threads = [threading.Thread(target=target) for _ in range(100)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+
+def test_shards_fold() -> None:
+    """Test shards of ended threads are folded into the base shard."""
+    shards: Shards[List[int]] = Shards(lambda: [0], _fold)
+
+    def work() -> None:
+        shards.get()[0] += 1
+
+    _run(work, 2000)
+    shards.get()[0] += 1
+
+    assert len(shards) == 1, "Expected only the shard of the current thread."
+    with shards.lock:
+        assert shards.base == [2000]
+        assert sum(s[0] for s in shards.all()) == 2001
+
+
+def test_shards_collected() -> None:
+    """Test shards of a collected instance are released without error."""
+    shards: Shards[List[int]] = Shards(lambda: [0], _fold)
+    shards.get()[0] += 1
+    del shards
+
+
+@pytest.mark.parametrize(
+    ["build", "update", "total"],
+    [
+        (
+            lambda: Accumulator("shards"),
+            lambda acc: acc.add(1),
+            lambda acc: acc.snapshot().count,
+        ),
+        (lambda: Counter("shards"), lambda c: c.inc(), lambda c: c.value),
+        (
+            RecordCounter,
+            lambda c: c.filter(logging.makeLogRecord({"name": "shards"})),
+            lambda c: c.snapshot()["shards"],
+        ),
+    ],
+    ids=["accumulator", "counter", "records"],
+)
+def test_sharded_aggregates(build, update, total) -> None:
+    """Test aggregates retain counts, but not shards, of short lived threads."""
+    aggregate = build()
+    _run(lambda: update(aggregate), 2000)
+
+    assert len(aggregate._shards) == 0
+    assert total(aggregate) == 2000
@@ -0,0 +1,130 @@
+"""Test Expected Behavior of the EpiLog Shared Module."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+from typing import Callable, Dict, List
+
+import pytest
+
+from EpiLog import EpiLog
+from EpiLog.benchmark import BenchMark
+from EpiLog.shared import SharedAccumulator
+from EpiLog.stats import Summary
+
+
+_worker: Dict[str, SharedAccumulator] = {}
+
+
+def _init(acc: SharedAccumulator) -> None:
+    _worker["acc"] = acc
+
+
+def _work(n: int) -> int:
+    """Add measurements from within a worker process, directly and by BenchMark."""
+    acc: SharedAccumulator = _worker["acc"]
+    for value in range(1, 101):
+        acc.add(value * 1_000)
+    log: logging.Logger = logging.getLogger("shared_worker")
+    log.setLevel(logging.INFO)
+    with BenchMark(log, "work", aggregate=acc):
+        ...
+    return os.getpid()
+
+
+@pytest.fixture
+def shared() -> Callable[..., SharedAccumulator]:
+    """Construct shared accumulators, freed after the test."""
+    instances: List[SharedAccumulator] = []
+
+    def builder(key: str = "shared", **kwargs) -> SharedAccumulator:
+        instance = SharedAccumulator(key, **kwargs)
+        instances.append(instance)
+        return instance
+
+    yield builder
+
+    for instance in instances:
+        instance.close()
+
+
+def test_shared_snapshot(shared: Callable[..., SharedAccumulator]) -> None:
+    """Test statistics of measurements added within a single process."""
+    acc: SharedAccumulator = shared()
+    assert acc.snapshot().count == 0
+
+    values: List[int] = [(n * 7919) % 1000 + 1 for n in range(1000)]
+    for v in values:
+        acc.add(v)
+
+    summary: Summary = acc.snapshot()
+    assert summary.count == len(values)
+    assert summary.total == sum(values)
+    assert summary.minimum == min(values)
+    assert summary.maximum == max(values)
+    assert summary.mean == pytest.approx(statistics.fmean(values))
+    assert summary.variance == pytest.approx(statistics.pvariance(values))
+    assert summary.p50 <= summary.p90 <= summary.p99 <= summary.maximum
+
+
+def test_shared_reset(shared: Callable[..., SharedAccumulator]) -> None:
+    """Test snapshots after a reset report the difference from the reset."""
+    acc: SharedAccumulator = shared()
+    for v in (1, 1_000_000):
+        acc.add(v)
+    assert acc.snapshot(reset=True).count == 2
+    assert acc.snapshot().count == 0
+
+    acc.add(1_000)
+    summary: Summary = acc.snapshot()
+    assert (summary.count, summary.total) == (1, 1_000)
+    assert 1 < summary.minimum <= 1_000 <= summary.maximum < 1_000_000
+
+
+def test_shared_slots(shared: Callable[..., SharedAccumulator]) -> None:
+    """Test ValueError is raised for unsupported, or exhausted slots."""
+    with pytest.raises(ValueError):
+        SharedAccumulator("none", slots=0)
+
+    acc: SharedAccumulator = shared(slots=1)
+    acc.add(1)
+    acc._base = -1  # as if forked into another process, with every row claimed
+    with pytest.raises(ValueError):
+        acc.add(1)
+
+
+@pytest.mark.parametrize(
+    "method",
+    [m for m in ("fork", "spawn") if m in multiprocessing.get_all_start_methods()],
+)
+def test_shared_pool(
+    build_manager: Callable[..., EpiLog],
+    shared: Callable[..., SharedAccumulator],
+    method: str,
+) -> None:
+    """Test measurements of worker processes are summed, and emitted by the parent."""
+    ctx = multiprocessing.get_context(method)
+    acc: SharedAccumulator = shared("task", context=ctx)
+    with ProcessPoolExecutor(
+        2, mp_context=ctx, initializer=_init, initargs=(acc,)
+    ) as pool:
+        pids: List[int] = list(pool.map(_work, range(4)))
+
+    summary: Summary = acc.snapshot()
+    assert os.getpid() not in pids
+    assert summary.count == 4 * 101
+    assert summary.minimum <= 1_000
+    assert summary.maximum >= 100_000
+
+    with StringIO() as stream:
+        manager: EpiLog = build_manager(
+            stream=logging.StreamHandler(stream),
+            formatter=logging.Formatter("%(levelname)s | %(message)s"),
+        )
+        acc.emit(manager.get_logger("shared_parent"))
+        assert stream.getvalue().startswith("INFO | task: (n=404, mean=")
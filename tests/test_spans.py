@@ -0,0 +1,156 @@
+"""Test Expected Behavior of the EpiLog Spans Module."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from io import StringIO
+from typing import List, Optional, Tuple
+
+from EpiLog.benchmark import BenchMark
+from EpiLog.spans import Span, current_span
+
+
+def _tree() -> Span:
+    root = Span("root", start=0)
+    a = Span("a", root, start=10)
+    a.end = 40
+    for start in (50, 70):
+        b = Span("b", root, start=start)
+        Span("c", b, start=start).end = start + 5
+        b.end = start + 10
+    root.end = 100
+    return root
+
+
+def test_span_times() -> None:
+    """Test self time excludes time spent within child spans."""
+    root: Span = _tree()
+    assert root.elapsed == 100
+    assert root.child_time == 50
+    assert root.self_time == 50
+    assert [s.name for _, s in root.walk()] == ["root", "a", "b", "c", "b", "c"]
+    assert Span("open").elapsed == 0, "Expected no duration while open."
+
+
+def test_span_report() -> None:
+    """Test report indents children, merging siblings sharing a name."""
+    lines: List[str] = _tree().report(indent="..").splitlines()
+    assert lines == [
+        "root: (100.0000 ns, self=50.0000 ns)",
+        "..a: (30.0000 ns, self=30.0000 ns)",
+        "..b [x2]: (20.0000 ns, self=10.0000 ns)",
+        "....c [x2]: (10.0000 ns, self=10.0000 ns)",
+    ]
+
+
+def test_span_collapsed() -> None:
+    """Test collapsed stacks report self time of each merged stack."""
+    root: Span = _tree()
+    Span("x;y", root, start=0).end = 1
+    assert root.collapsed().splitlines() == [
+        "root 49",
+        "root;a 30",
+        "root;b 10",
+        "root;b;c 10",
+        "root;x:y 1",
+    ]
+
+
+def test_benchmark_tree(stream_construct: Tuple[StringIO, logging.Logger]) -> None:
+    """Test nested BenchMarks emit a single report from the root of a tree."""
+    stream, log = stream_construct
+    with BenchMark(log, "outer", tree=True) as outer:
+        assert current_span() is outer.span
+        with BenchMark(log, "inner") as inner:
+            time.sleep(0.01)
+        with BenchMark(log, "hidden", logging.DEBUG) as hidden:
+            ...
+    assert current_span() is None
+
+    assert outer.span is not None and inner.span is not None
+    assert inner.span.parent is outer.span
+    assert hidden.span is None, "Expected no span of a disabled BenchMark."
+    assert outer.span.child_time == inner.span.elapsed >= 10_000_000
+
+    lines: List[str] = stream.getvalue().splitlines()
+    assert len(lines) == 2, "Expected a single (multiline) report."
+    assert lines[0].startswith("INFO | outer: (")
+    assert lines[1].startswith("  inner: (")
+
+
+def test_benchmark_without_tree(
+    stream_construct: Tuple[StringIO, logging.Logger],
+) -> None:
+    """Test BenchMarks outside of a tree neither track spans nor change output."""
+    stream, log = stream_construct
+    with BenchMark(log, "outer") as outer:
+        with BenchMark(log, "inner") as inner:
+            ...
+
+    assert outer.span is None and inner.span is None
+    assert stream.getvalue().count("\n") == 2
+
+
+def test_benchmark_tree_threads(
+    stream_construct: Tuple[StringIO, logging.Logger],
+) -> None:
+    """Test threads track independent trees, or attach to a copied context."""
+    _, log = stream_construct
+    roots: List[Optional[Span]] = []
+
+    def independent(n: int) -> None:
+        with BenchMark(log, f"thread{n}", tree=True) as b:
+            for _ in range(50):
+                with BenchMark(log, "step"):
+                    ...
+        roots.append(b.span)
+
+    threads = [threading.Thread(target=independent, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(roots) == 4
+    for root in roots:
+        assert root is not None and root.parent is None
+        assert [c.name for c in root.children] == ["step"] * 50
+
+    def attached() -> None:
+        with BenchMark(log, "worker"):
+            ...
+
+    with BenchMark(log, "main", tree=True) as main:
+        t = threading.Thread(target=contextvars.copy_context().run, args=(attached,))
+        t.start()
+        t.join()
+
+    assert main.span is not None
+    assert [c.name for c in main.span.children] == ["worker"]
+
+
+def test_benchmark_tree_tasks(
+    stream_construct: Tuple[StringIO, logging.Logger],
+) -> None:
+    """Test concurrent asyncio tasks attach spans to the tree of their creator."""
+    _, log = stream_construct
+
+    @BenchMark(log, "task")
+    async def task() -> None:
+        with BenchMark(log, "sleep"):
+            await asyncio.sleep(0.01)
+
+    async def main() -> Optional[Span]:
+        with BenchMark(log, "gather", tree=True) as b:
+            await asyncio.gather(*(task() for _ in range(3)))
+        return b.span
+
+    root: Optional[Span] = asyncio.run(main())
+    assert root is not None
+    assert [c.name for c in root.children] == ["task"] * 3
+    assert all([c.name for c in t.children] == ["sleep"] for t in root.children)
+    assert "task [x3]" in root.report()
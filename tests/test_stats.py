@@ -0,0 +1,151 @@
+"""Test Expected Behavior of the EpiLog Stats Module."""
+
+from __future__ import annotations
+
+import logging
+import statistics
+import threading
+import time
+from io import StringIO
+from typing import List, Tuple
+
+import pytest
+
+from EpiLog.benchmark import BenchMark
+from EpiLog.stats import (
+    ACCUMULATORS,
+    NBUCKETS,
+    Accumulator,
+    Summary,
+    bucket_bounds,
+    bucket_index,
+    emit_all,
+    get_accumulator,
+    percentile,
+)
+
+from .conftest import _assert_msg_in_output
+
+
+@pytest.mark.parametrize("value", [0, 1, 7, 8, 9, 15, 16, 1000, 123_456_789, 2**63])
+def test_bucket_bounds(value: int) -> None:
+    """Test a value lies within the bounds of its bucket."""
+    index: int = bucket_index(value)
+    lo, hi = bucket_bounds(index)
+    assert 0 <= index < NBUCKETS
+    assert lo <= value < hi
+    assert (hi - lo) <= max(1, value // 4), "Expected relative error below 25%."
+
+
+def test_bucket_monotonic() -> None:
+    """Test bucket indices are contiguous and monotonic."""
+    indices: List[int] = [bucket_index(v) for v in range(4096)]
+    assert indices == sorted(indices)
+    assert set(indices) == set(range(indices[-1] + 1))
+
+
+def test_percentile() -> None:
+    """Test percentile estimates of a histogram."""
+    buckets: List[int] = [0] * NBUCKETS
+    assert percentile(buckets, 0, 0.5) == 0.0
+
+    values: List[int] = list(range(1, 1001))
+    for v in values:
+        buckets[bucket_index(v)] += 1
+
+    for q in (0.5, 0.9, 0.99):
+        expected: float = values[int(q * len(values)) - 1]
+        estimate: float = percentile(buckets, len(values), q, 1, 1000)
+        assert abs(estimate - expected) <= 0.25 * expected
+
+
+def test_accumulator_snapshot() -> None:
+    """Test accumulated statistics, merged across threads."""
+    acc = Accumulator("snapshot")
+    values: List[int] = [(n * 7919) % 1000 + 1 for n in range(1000)]
+
+    def worker(chunk: List[int]) -> None:
+        for v in chunk:
+            acc.add(v)
+
+    threads = [threading.Thread(target=worker, args=(values[i::4],)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    summary: Summary = acc.snapshot()
+    assert summary.count == len(values)
+    assert summary.total == sum(values)
+    assert summary.minimum == min(values)
+    assert summary.maximum == max(values)
+    assert summary.mean == pytest.approx(statistics.fmean(values))
+    assert summary.variance == pytest.approx(statistics.pvariance(values))
+    assert summary.stdev == pytest.approx(statistics.pstdev(values))
+    assert summary.p50 <= summary.p90 <= summary.p99 <= summary.maximum
+    assert summary.rate > 0
+
+
+def test_accumulator_reset() -> None:
+    """Test snapshot resets accumulated statistics when requested."""
+    acc = Accumulator("reset")
+    acc.add(10)
+    assert acc.snapshot(reset=True).count == 1
+    assert acc.snapshot().count == 0
+    assert Summary().rate == 0.0
+
+
+def test_accumulator_emit(stream_construct: Tuple[StringIO, logging.Logger]) -> None:
+    """Test a single summary line is emitted through the logger."""
+    stream, log = stream_construct
+    acc = Accumulator("emitted", log)
+    acc.emit()
+    assert stream.getvalue() == "", "Expected no summary without measurements."
+
+    for v in (1_000, 2_000, 3_000):
+        acc.add(v)
+    acc.emit()
+
+    output: str = stream.getvalue()
+    assert output.count("\n") == 1, "Expected a single summary line."
+    assert "INFO | emitted: (n=3, mean=2.0000 us" in output
+
+
+def test_accumulator_interval(
+    stream_construct: Tuple[StringIO, logging.Logger],
+) -> None:
+    """Test a summary is emitted from add once interval elapses."""
+    stream, log = stream_construct
+    acc = Accumulator("interval", log, interval=0.01)
+    acc.add(5)
+    assert stream.getvalue() == ""
+
+    time.sleep(0.02)
+    acc.add(5)
+    _assert_msg_in_output(stream, "interval: (n=2")
+
+
+def test_benchmark_aggregate(stream_construct: Tuple[StringIO, logging.Logger]) -> None:
+    """Test BenchMarks sharing a key feed a single accumulator."""
+    stream, log = stream_construct
+    for _ in range(10):
+        with BenchMark(log, "aggregated", aggregate=True):
+            ...
+    with BenchMark(log, "other description", aggregate=True, key="aggregated") as b:
+        assert b.accumulator is get_accumulator("aggregated")
+
+    assert stream.getvalue() == "", "Expected no message per use."
+    emit_all()
+    _assert_msg_in_output(stream, "INFO | aggregated: (n=11")
+
+
+def test_benchmark_aggregate_instance(
+    stream_construct: Tuple[StringIO, logging.Logger],
+) -> None:
+    """Test BenchMark feeds an explicitly provided accumulator."""
+    _, log = stream_construct
+    acc = Accumulator("explicit", log)
+    with BenchMark(log, "explicit", aggregate=acc):
+        ...
+    assert acc.snapshot().count == 1
+    assert "explicit" not in ACCUMULATORS
@@ -0,0 +1,82 @@
+"""Test Expected Behavior of the Benchmark Suite Regression Checks."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from benchmarks.suite import check, compare, main
+
+
+def _results(**medians: float) -> Dict[str, Any]:
+    return {
+        "results": {
+            name.replace("_", "."): {"best": m, "median": m, "samples": [m] * 5}
+            for name, m in medians.items()
+        }
+    }
+
+
+def _statuses(rows: List[Dict[str, Any]]) -> Dict[str, str]:
+    return {row["name"]: row["status"] for row in rows}
+
+
+def test_check_budgets() -> None:
+    """Test only benchmarks above their budget (with a reference) are reported."""
+    results: Dict[str, Any] = _results(
+        benchmark_bare=100.0,
+        benchmark_disabled=199.0,
+        benchmark_resources_disabled=250.0,
+    )
+    exceeded: List[str] = check(results)
+    assert len(exceeded) == 1
+    assert exceeded[0].startswith("benchmark.resources.disabled: 2.50x benchmark.bare")
+
+    assert check(_results(benchmark_disabled=1e6)) == [], "Expected no reference."
+
+
+def test_compare_statuses() -> None:
+    """Test changes beyond the threshold are flagged, in either direction."""
+    baseline = _results(same=100.0, slower=100.0, faster=100.0, removed=1.0)
+    current = _results(same=104.0, slower=110.0, faster=90.0, added=1.0)
+    rows: List[Dict[str, Any]] = compare(baseline, current, threshold=0.05)
+
+    assert _statuses(rows) == {
+        "added": "new",
+        "faster": "improvement",
+        "removed": "missing",
+        "same": "ok",
+        "slower": "regression",
+    }
+    slower: Dict[str, Any] = next(r for r in rows if r["name"] == "slower")
+    assert slower["change"] == pytest.approx(0.1)
+    assert slower["tolerance"] == pytest.approx(0.05)
+
+
+def test_compare_noise() -> None:
+    """Test noisy results widen the tolerance of a change."""
+    baseline = _results(noisy=100.0)
+    baseline["results"]["noisy"]["samples"] = [80.0, 90.0, 100.0, 110.0, 120.0]
+    current = _results(noisy=120.0)
+
+    (row,) = compare(baseline, current, threshold=0.05, factor=3.0)
+    assert row["tolerance"] == pytest.approx(0.3)
+    assert row["status"] == "ok"
+
+
+@pytest.mark.parametrize("median, expected", [(100.0, 0), (200.0, 1)])
+def test_main_compare(tmp_path: Path, median: float, expected: int) -> None:
+    """Test the compare command fails only on a regression."""
+    paths: List[Path] = []
+    for name, results in (
+        ("baseline", _results(records=100.0)),
+        ("current", _results(records=median)),
+    ):
+        path: Path = tmp_path / f"{name}.json"
+        path.write_text(json.dumps(results), encoding="utf-8")
+        paths.append(path)
+
+    assert main(["compare", *map(str, paths)]) == expected